@@ -1,6 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import csv, heapq, math, time, os, random, threading
+import csv, heapq, math, time, os, random, sys, threading
+
+# Shared helpers live in <repo>/labkit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')))
+
+from labkit.framebudget import render_chunked
+from labkit.profiling import MODES as PROFILE_MODES, make_profiler
 
 # ══════════════════════════════════════════════
 #  DISPLAY SCALE DETECTION
@@ -256,6 +262,7 @@ class App(tk.Tk):
         self.dst_var        = tk.StringVar(value="GENTRI")
         self.map_metric_var = tk.StringVar(value="distance")
         self.bidir_var      = tk.BooleanVar(value=True)
+        self.profile_var    = tk.StringVar(value="Off")
 
         self.result_dist = {}
         self.result_time = {}
@@ -264,6 +271,7 @@ class App(tk.Tk):
         self._anim_particles       = []
         self._pulse_phase          = 0.0
         self._anim_job             = None
+        self._debug_job            = None   # ChunkScheduler filling the step log
         self._path_anim_progress   = {}
         self._jet_progress         = 0.0
         self._animation_running    = False
@@ -341,6 +349,14 @@ class App(tk.Tk):
         self._btn(ctrl, "▶  FIND PATHS", self._run,
                   fg=C["yellow"], bg="#1a1500").pack(side="left", padx=S(14))
 
+        tk.Label(ctrl, text="PROFILE:", bg=C["panel"], fg=C["textdim"],
+                 font=FONT_MONOB).pack(side="left", padx=(S(4), S(2)))
+        self.profile_cb = ttk.Combobox(ctrl, textvariable=self.profile_var,
+                                       values=PROFILE_MODES, width=9,
+                                       font=FONT_MONO, state="readonly")
+        self._style_combo(self.profile_cb)
+        self.profile_cb.pack(side="left", padx=S(4))
+
         self.status_lbl = tk.Label(ctrl, text="◌ AWAITING DATA",
                                    bg=C["panel"], fg=C["textdim"],
                                    font=FONT_MONO)
@@ -683,6 +699,19 @@ class App(tk.Tk):
         self._set_status("⟳ COMPUTING...", C["yellow"])
         self.update_idletasks()
 
+        profiler = make_profiler(self.profile_var.get(),
+                                 os.path.join(self.base_dir, "profiles"), "find_paths")
+        if profiler:
+            profiler.start()
+        try:
+            self._find_paths(src, dst)
+        finally:
+            if profiler:
+                profiler.stop()
+        if profiler:
+            self._show_profile(profiler)
+
+    def _find_paths(self, src, dst):
         results = {}
         for metric in ['distance', 'time', 'fuel']:
             path, total, steps = dijkstra(self.graph, src, dst, metric)
@@ -705,6 +734,22 @@ class App(tk.Tk):
         self._animate_paths()
         self._refresh_debug()
 
+    def _show_profile(self, profiler):
+        """Hotspot summary of a profiled FIND PATHS run"""
+        win = tk.Toplevel(self)
+        win.title(f"PROFILE // {profiler.mode.upper()}")
+        win.configure(bg=C["bg"])
+        tk.Label(win, text=f"◈ TOP {profiler.top} HOTSPOTS ◈", bg=C["bg"], fg=C["cyan"],
+                 font=FONT_TITLE).pack(anchor="w", padx=S(12), pady=(S(10), S(4)))
+        t = tk.Text(win, width=110, height=profiler.top + 6, bg=C["panel"], fg=C["text"],
+                    font=FONT_SMALL, relief="flat",
+                    highlightthickness=1, highlightbackground=C["border"])
+        t.pack(fill="both", expand=True, padx=S(12), pady=S(4))
+        t.insert("end", "\n".join(profiler.summary))
+        t.insert("end", f"\n\nSAVED: {os.path.abspath(profiler.path)}")
+        t.config(state="disabled")
+        self._btn(win, "CLOSE", win.destroy).pack(pady=S(8))
+
     # ─────────────────────────────────────────
     #  MAP DRAWING — all pixel values via S()
     # ─────────────────────────────────────────
@@ -1116,19 +1161,26 @@ class App(tk.Tk):
         path   = r.get('path', [])
 
         lb = self.steps_listbox
+        if self._debug_job: self._debug_job.cancel()
         lb.delete(0, "end")
         self._debug_steps = steps
 
-        for i, s in enumerate(steps):
-            if 'visit' in s:
-                d_val = s['dist_so_far']
-                d_str = f"{d_val:.1f}" if d_val != float('inf') else "∞"
-                lb.insert("end", f"  [{i:02d}] VISIT   {s['visit']:<12}  cost={d_str}")
-                lb.itemconfig("end", fg=C["cyan"])
-            elif 'relax' in s:
-                u, v = s['relax']
-                lb.insert("end", f"  [{i:02d}] RELAX   {u}→{v:<8}  new={s['new_dist']:.1f}")
-                lb.itemconfig("end", fg=C["yellow"])
+        # Long step logs are filled a frame-budget at a time so the map keeps animating
+        def insert_steps(indices):
+            for i in indices:
+                s = steps[i]
+                if 'visit' in s:
+                    d_val = s['dist_so_far']
+                    d_str = f"{d_val:.1f}" if d_val != float('inf') else "∞"
+                    lb.insert("end", f"  [{i:02d}] VISIT   {s['visit']:<12}  cost={d_str}")
+                    lb.itemconfig("end", fg=C["cyan"])
+                elif 'relax' in s:
+                    u, v = s['relax']
+                    lb.insert("end", f"  [{i:02d}] RELAX   {u}→{v:<8}  new={s['new_dist']:.1f}")
+                    lb.itemconfig("end", fg=C["yellow"])
+            if indices and indices[0] == 0:
+                lb.select_set(0)
+                self._on_step_select(None)
 
         td, tt, tf = r.get('td',0), r.get('tt',0), r.get('tf',0)
         arrow = " → ".join(path) if path else "NO PATH"
@@ -1139,9 +1191,7 @@ class App(tk.Tk):
             f"VISITED NODES: {sum(1 for s in steps if 'visit' in s)}   "
             f"RELAXATIONS: {sum(1 for s in steps if 'relax' in s)}")
 
-        if steps:
-            lb.select_set(0)
-            self._on_step_select(None)
+        self._debug_job = render_chunked(self.after, range(len(steps)), insert_steps)
 
     def _on_step_select(self, event):
         lb  = self.steps_listbox
@@ -1239,6 +1289,7 @@ class App(tk.Tk):
         self.src_cb.config(state="disabled")
         self.dst_cb.config(state="disabled")
         self.bidir_btn.config(state="disabled")
+        self.profile_cb.config(state="disabled")
         for btn in [b for b in self.winfo_children() if isinstance(b, tk.Button)]:
             btn.config(state="disabled")
 
@@ -1246,6 +1297,7 @@ class App(tk.Tk):
         self.src_cb.config(state="readonly")
         self.dst_cb.config(state="readonly")
         self.bidir_btn.config(state="normal")
+        self.profile_cb.config(state="readonly")
         for btn in [b for b in self.winfo_children() if isinstance(b, tk.Button)]:
             btn.config(state="normal")
 
@@ -1,6 +1,11 @@
 import os
 import sys
 
+# Shared helpers live in <repo>/labkit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')))
+
+from labkit.profiling import MODES as PROFILE_MODES, make_profiler
+
 # Force tkinter-compatible backend BEFORE any other matplotlib import
 import matplotlib
 matplotlib.use("TkAgg")
@@ -164,6 +169,30 @@ class DijkstraApp:
                            command=self.run_dijkstra,
                            indicatoron=False, **btn_cfg).pack(side=tk.LEFT, padx=4)
 
+        # Profiler selector
+        tk.Label(ctrl, text="  ║  ",
+                 font=("Courier New", 10),
+                 fg=CYBER_DIMTEXT, bg=CYBER_PANEL).pack(side=tk.LEFT)
+        tk.Label(ctrl, text="PROFILE:",
+                 font=("Courier New", 10, "bold"),
+                 fg=CYBER_ACCENT3, bg=CYBER_PANEL).pack(side=tk.LEFT, padx=(0, 6))
+
+        self.profile_var = tk.StringVar(value="Off")
+        profile_menu = tk.OptionMenu(ctrl, self.profile_var, *PROFILE_MODES)
+        profile_menu.config(
+            font=("Courier New", 10, "bold"),
+            bg=CYBER_GRAY, fg=CYBER_ACCENT1,
+            activebackground=CYBER_PANEL, activeforeground=CYBER_ACCENT3,
+            highlightthickness=0, relief=tk.FLAT, bd=0,
+            cursor="crosshair", width=8,
+        )
+        profile_menu["menu"].config(
+            bg=CYBER_GRAY, fg=CYBER_ACCENT1,
+            font=("Courier New", 10),
+            activebackground=CYBER_ACCENT1, activeforeground=CYBER_BG,
+        )
+        profile_menu.pack(side=tk.LEFT, padx=6)
+
         # ── results table strip ───────────────────────────────────────────────
         self.result_frame = tk.Frame(self.root, bg=CYBER_BG)
         self.result_frame.pack(side=tk.TOP, fill=tk.X, padx=8, pady=2)
@@ -181,6 +210,20 @@ class DijkstraApp:
 
     # ── Dijkstra ──────────────────────────────────────────────────────────────
     def run_dijkstra(self):
+        profiler = make_profiler(self.profile_var.get(),
+                                 os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles'),
+                                 "run_dijkstra")
+        if not profiler:
+            self._run_dijkstra()
+            return
+        profiler.start()
+        try:
+            self._run_dijkstra()
+        finally:
+            profiler.stop()
+        self._show_profile(profiler)
+
+    def _run_dijkstra(self):
         metric = self.metric_var.get()
         origin = self.origin_var.get()
 
@@ -198,6 +241,22 @@ class DijkstraApp:
         self._rebuild_result_table(origin, dist_map, path_map, units[metric])
         self._draw(G, origin, dist_map, path_map, metric)
 
+    # ── Profile ───────────────────────────────────────────────────────────────
+    def _show_profile(self, profiler):
+        win = tk.Toplevel(self.root)
+        win.title(f"◈ PROFILE — {profiler.mode.upper()} ◈")
+        win.configure(bg=CYBER_BG)
+        tk.Label(win, text=f"◈  TOP {profiler.top} HOTSPOTS  ◈",
+                 font=("Courier New", 12, "bold"),
+                 fg=CYBER_ACCENT1, bg=CYBER_BG).pack(anchor="w", padx=10, pady=(8, 4))
+        text = tk.Text(win, width=110, height=profiler.top + 6,
+                       font=("Courier New", 9), fg=CYBER_TEXT, bg=CYBER_PANEL,
+                       relief=tk.FLAT, highlightbackground=CYBER_ACCENT1, highlightthickness=1)
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=4)
+        text.insert(tk.END, "\n".join(profiler.summary))
+        text.insert(tk.END, f"\n\nSAVED: {os.path.abspath(profiler.path)}")
+        text.config(state=tk.DISABLED)
+
     # ── Result table ──────────────────────────────────────────────────────────
     def _rebuild_result_table(self, origin, dist_map, path_map, unit):
         for w in self.result_frame.winfo_children():
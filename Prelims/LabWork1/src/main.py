@@ -1,15 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import time
-import random
 import csv
-from typing import List, Tuple, Optional, Callable
+from typing import Tuple
 import os
 import threading
 import subprocess
 import sys
 import glob
 
+# Shared helpers live in <repo>/labkit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..')))
+
+from labkit import datagen, export
+from labkit.framebudget import render_chunked
+from labkit.incremental import IncrementalSortCache
+from labkit.isolated import run_isolated
+from labkit.progress import ProgressEta
+from labkit.resultcache import ResultCache
+from labkit.verify import PENDING, fill_placeholder, verify_in_background, verify_values
+
 DOG_COLORS = {
     'primary': '#8B4513',      # Saddle Brown (dog fur)
     'secondary': '#D2691E',    # Chocolate (light brown)
@@ -23,138 +32,11 @@ DOG_COLORS = {
     'text': '#2F4F4F'          # Dark Slate Gray
 }
 
-class SortingAlgorithms:
-    """Contains implementations of various sorting algorithms with progress tracking"""
-
-    @staticmethod
-    def bubble_sort(arr: List, timer_cb: Optional[Callable] = None,
-                    stop_cb: Optional[Callable] = None,
-                    progress_cb: Optional[Callable[[int, int], None]] = None,
-                    reverse: bool = False) -> List:
-        """Bubble Sort - O(n^2)
-        progress_cb(current_outer_iteration, total_outer_iterations) -> None
-        reverse: False -> ascending, True -> descending
-        """
-        n = len(arr)
-        arr_copy = arr.copy()
-        start_time = time.time()
-
-        for i in range(n):
-            swapped = False
-            # inner loop
-            for j in range(0, n - i - 1):
-                # comparison depends on reverse flag
-                if (not reverse and arr_copy[j] > arr_copy[j + 1]) or (reverse and arr_copy[j] < arr_copy[j + 1]):
-                    arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
-                    swapped = True
-
-            # update progress at the end of each outer loop iteration
-            if progress_cb:
-                try:
-                    progress_cb(i + 1, n)
-                except Exception:
-                    pass
-
-            if not swapped:
-                break
-
-            if stop_cb and stop_cb():
-                return arr_copy  # Return partially sorted if stopped
-
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-
-        return arr_copy
-
-    @staticmethod
-    def insertion_sort(arr: List, timer_cb: Optional[Callable] = None, stop_cb: Optional[Callable] = None, reverse: bool = False) -> List:
-        """Insertion Sort - O(n^2)"""
-        arr_copy = arr.copy()
-        n = len(arr_copy)
-        start_time = time.time()
-
-        for i in range(1, n):
-            key = arr_copy[i]
-            j = i - 1
-
-            # choose comparison by reverse flag
-            if not reverse:
-                while j >= 0 and arr_copy[j] > key:
-                    arr_copy[j + 1] = arr_copy[j]
-                    j -= 1
-            else:
-                while j >= 0 and arr_copy[j] < key:
-                    arr_copy[j + 1] = arr_copy[j]
-                    j -= 1
-
-            arr_copy[j + 1] = key
-
-            if stop_cb and stop_cb():
-                return arr_copy  # Return partially sorted if stopped
-
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-
-        return arr_copy
-
-    @staticmethod
-    def merge_sort(arr: List, timer_cb: Optional[Callable] = None, stop_cb: Optional[Callable] = None, reverse: bool = False) -> List:
-        """Merge Sort - O(n log n)
-        reverse: False -> ascending, True -> descending
-        """
-        if len(arr) <= 1:
-            return arr.copy()
-
-        start_time = time.time()
-
-        def merge(left: List, right: List) -> List:
-            result = []
-            i = j = 0
-
-            while i < len(left) and j < len(right):
-                if not reverse:
-                    if left[i] <= right[j]:
-                        result.append(left[i])
-                        i += 1
-                    else:
-                        result.append(right[j])
-                        j += 1
-                else:
-                    # for descending, pick the larger first
-                    if left[i] >= right[j]:
-                        result.append(left[i])
-                        i += 1
-                    else:
-                        result.append(right[j])
-                        j += 1
-
-            result.extend(left[i:])
-            result.extend(right[j:])
-            return result
-
-        def merge_sort_recursive(arr_in: List) -> List:
-            if len(arr_in) <= 1:
-                return arr_in
-
-            if stop_cb and stop_cb():
-                return arr_in  # Return unsorted if stopped
-
-            mid = len(arr_in) // 2
-            left = merge_sort_recursive(arr_in[:mid])
-            right = merge_sort_recursive(arr_in[mid:])
-
-            result = merge(left, right)
-
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-
-            return result
-
-        return merge_sort_recursive(arr.copy())
-
 class PrelimLab1:
     """🐕 Prelim Lab Work 1 - Bubble Sort with 10,000 elements"""
 
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'result_cache')
+
     def __init__(self, parent_frame):
         self.frame = parent_frame
         self.dataset = []
@@ -165,6 +47,13 @@ class PrelimLab1:
         self.show_first_10 = tk.BooleanVar(value=True)
         self.available_datasets = []  # list of (path, filename) valid dataset files
         self.order_var = tk.StringVar(value="asc")  # 'asc' or 'desc'
+        self.dataset_path = None  # file the dataset came from (None when generated)
+        self.render_job = None  # ChunkScheduler listing the sorted values, if any
+        self.incremental = tk.BooleanVar(value=False)
+        self.incremental_cache = IncrementalSortCache()
+        self.use_cache = tk.BooleanVar(value=True)
+        self.persist_cache = tk.BooleanVar(value=False)  # also save results under CACHE_DIR
+        self.result_cache = ResultCache(directory=self.CACHE_DIR if self.persist_cache.get() else None)
         self.setup_ui()
         self.update_timer_visibility()
         self.update_progress_visibility()
@@ -274,6 +163,24 @@ class PrelimLab1:
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=3)
 
+        # Generator settings
+        gen_frame = tk.Frame(left_controls, bg=DOG_COLORS['bg'])
+        gen_frame.grid(row=3, column=0, columnspan=3, pady=(0, 5))
+
+        tk.Label(gen_frame, text="Distribution:", font=("Arial", 9), bg=DOG_COLORS['bg'], fg=DOG_COLORS['dark']).pack(side=tk.LEFT)
+        self.gen_dist_var = tk.StringVar(value="uniform")
+        ttk.Combobox(
+            gen_frame,
+            textvariable=self.gen_dist_var,
+            values=list(datagen.DISTRIBUTIONS),
+            state="readonly",
+            width=13
+        ).pack(side=tk.LEFT, padx=(3, 10))
+
+        tk.Label(gen_frame, text="Seed:", font=("Arial", 9), bg=DOG_COLORS['bg'], fg=DOG_COLORS['dark']).pack(side=tk.LEFT)
+        self.gen_seed_var = tk.StringVar(value="")
+        tk.Entry(gen_frame, textvariable=self.gen_seed_var, font=("Arial", 9), width=10).pack(side=tk.LEFT, padx=3)
+
         # Right - Action buttons
         right_controls = tk.Frame(control_frame, bg=DOG_COLORS['bg'])
         right_controls.pack(side=tk.RIGHT)
@@ -307,6 +214,34 @@ class PrelimLab1:
             fg=DOG_COLORS['dark']
         ).pack()
 
+        tk.Checkbutton(
+            right_controls,
+            text="🐾 Incremental (merge lines appended to the file)",
+            variable=self.incremental,
+            font=("Arial", 9),
+            bg=DOG_COLORS['bg'],
+            fg=DOG_COLORS['dark']
+        ).pack()
+
+        tk.Checkbutton(
+            right_controls,
+            text="🐾 Reuse cached results (same data and order)",
+            variable=self.use_cache,
+            font=("Arial", 9),
+            bg=DOG_COLORS['bg'],
+            fg=DOG_COLORS['dark']
+        ).pack()
+
+        tk.Checkbutton(
+            right_controls,
+            text="🐾 Keep cached results on disk",
+            variable=self.persist_cache,
+            command=self.apply_cache_setting,
+            font=("Arial", 9),
+            bg=DOG_COLORS['bg'],
+            fg=DOG_COLORS['dark']
+        ).pack()
+
         # Order selection (Ascending / Descending)
         order_frame = tk.Frame(right_controls, bg=DOG_COLORS['bg'])
         order_frame.pack(pady=4)
@@ -440,6 +375,10 @@ class PrelimLab1:
         )
         status_bar.pack(fill=tk.X, pady=(5, 0))
 
+    def apply_cache_setting(self):
+        """Save cached results under CACHE_DIR only while the disk option is ticked"""
+        self.result_cache.directory = self.CACHE_DIR if self.persist_cache.get() else None
+
     def update_timer_visibility(self):
         """Update timer label visibility based on checkbox"""
         if self.show_timer.get():
@@ -534,6 +473,7 @@ class PrelimLab1:
                         continue
                     nums.append(int(stripped))
             self.dataset = nums
+            self.dataset_path = path
             self.size_var.set(str(len(self.dataset)))
             self.results_text.insert(tk.END, f"\n📂 Loaded {filename} with {len(self.dataset)} numbers from data folder.\n")
             self.status_var.set(f"Loaded {filename}")
@@ -555,8 +495,10 @@ class PrelimLab1:
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 self.dataset = [int(line.strip()) for line in f if line.strip()]
+            self.dataset_path = path
 
             self.size_var.set(str(len(self.dataset)))
+            self.cancel_render()
             self.results_text.delete("1.0", tk.END)
             self.results_text.insert("1.0", f"🐾 Imported {len(self.dataset)} numbers from {os.path.basename(path)}\n")
 
@@ -572,9 +514,15 @@ class PrelimLab1:
             if size <= 0:
                 raise ValueError("Size must be positive")
 
-            self.dataset = [random.randint(1, 100000) for _ in range(size)]
+            distribution = self.gen_dist_var.get()
+            seed_text = self.gen_seed_var.get().strip()
+            seed = datagen.resolve_seed(int(seed_text) if seed_text else None)
+
+            self.dataset = datagen.generate(size, distribution, seed)
+            self.dataset_path = None
+            self.cancel_render()
             self.results_text.delete("1.0", tk.END)
-            self.results_text.insert("1.0", f"🎲 Generated {size} random numbers!\n")
+            self.results_text.insert("1.0", f"🎲 Generated {size} {distribution} numbers (seed {seed})\n")
 
             messagebox.showinfo("Success! 🐕", f"Generated {size} numbers")
 
@@ -602,26 +550,28 @@ class PrelimLab1:
         self.stop_button.config(state=tk.NORMAL)
         self.status_var.set("Sorting in progress... 🐕")
 
+        self.cancel_render()
         self.results_text.delete("1.0", tk.END)
         self.results_text.insert("1.0", f"🐕 Starting Bubble Sort with {len(self.dataset)} elements...\n\n")
         self.frame.update()
 
         def sort_thread():
             try:
-                start_time = time.time()
-
                 # determine reverse flag from UI
                 reverse_flag = True if self.order_var.get() == 'desc' else False
 
-                # prepare progress callback if enabled
+                # prepare progress callback if enabled (current/total are comparisons, see labkit.progress)
+                eta = ProgressEta()
+
                 def progress_cb_local(current, total):
+                    status = f"Sorting... {eta.update(current, total).describe()}"
                     # update progress bar safely from worker thread
                     def _update():
                         try:
                             self.progress['maximum'] = total
                             self.progress['value'] = current
                             # optional quick status
-                            self.status_var.set(f"Sorting... {current}/{total}")
+                            self.status_var.set(status)
                         except Exception:
                             pass
                     # schedule on main thread
@@ -630,24 +580,55 @@ class PrelimLab1:
                     except Exception:
                         pass
 
-                self.sorted_array = SortingAlgorithms.bubble_sort(
-                    self.dataset,
-                    timer_cb=self.update_timer if self.show_timer.get() else None,
-                    stop_cb=lambda: not self.is_sorting,
-                    progress_cb=progress_cb_local if self.show_progress.get() else None,
-                    reverse=reverse_flag
-                )
-
-                end_time = time.time()
-                execution_time = end_time - start_time
-
-                # Verify correctness depending on order
-                if reverse_flag:
-                    is_sorted = all(self.sorted_array[i] >= self.sorted_array[i+1]
-                                   for i in range(len(self.sorted_array)-1))
+                def bubble_timed(values):
+                    # runs in a child process: the window stays responsive and Stop kills it at once
+                    return run_isolated(
+                        "Bubble Sort",
+                        values,
+                        timer_cb=self.update_timer if self.show_timer.get() else None,
+                        stop_cb=lambda: not self.is_sorting,
+                        progress_cb=progress_cb_local if self.show_progress.get() else None,
+                        reverse=reverse_flag
+                    )
+
+                mode_text = "Full sort"
+                cached = None
+                timing_text = None  # breakdown of an incremental run's time
+                if self.incremental.get() and self.dataset_path:
+                    # only the lines appended since the last run are sorted, then merged;
+                    # the time is sort + merge, like a full sort's (file I/O is listed apart)
+                    result = self.incremental_cache.sort(self.dataset_path, bubble_timed, reverse=reverse_flag)
+                    execution_time = result.seconds
+                    timing_text = result.describe()
+                    if result.mode == 'full':
+                        self.dataset = result.values
+                    elif result.mode == 'incremental':
+                        self.dataset = self.dataset + result.appended
+                        mode_text = f"Incremental (+{len(result.appended)} appended values merged)"
+                    else:
+                        mode_text = "Incremental (file unchanged, cached result reused)"
+                    if not self.is_sorting:
+                        # a stopped run is only partially sorted; never reuse it
+                        self.incremental_cache.forget(self.dataset_path)
+                    self.sorted_array = result.sorted_values
                 else:
-                    is_sorted = all(self.sorted_array[i] <= self.sorted_array[i+1]
-                                   for i in range(len(self.sorted_array)-1))
+                    # same values in the same order were sorted before: show that result at once
+                    cache_key = self.result_cache.key(self.dataset, "values", "Bubble Sort", reverse_flag) if self.use_cache.get() else None
+                    cached = self.result_cache.get(cache_key) if cache_key else None
+                    if cached is not None:
+                        self.sorted_array, execution_time = cached.values, cached.seconds
+                        mode_text = "Cached result (time measured when it was first sorted)"
+                    else:
+                        self.sorted_array, execution_time = bubble_timed(self.dataset)
+                        if cache_key and self.is_sorting:
+                            self.result_cache.put(cache_key, self.sorted_array, execution_time)
+
+                # Verify correctness off the timed path; the report shows it when done
+                original, result = self.dataset, self.sorted_array
+                verification = verify_in_background(
+                    lambda: verify_values(original, result, reverse_flag),
+                    lambda fn: self.frame.after(0, fn)
+                )
 
                 order_text = "Descending" if reverse_flag else "Ascending"
 
@@ -658,8 +639,12 @@ class PrelimLab1:
                 self.results_text.insert(tk.END, f"Dataset Size: {len(self.dataset)} elements\n")
                 self.results_text.insert(tk.END, f"Algorithm: Bubble Sort (O(n²))\n")
                 self.results_text.insert(tk.END, f"Order: {order_text}\n")
+                self.results_text.insert(tk.END, f"Mode: {mode_text}\n")
                 self.results_text.insert(tk.END, f"Execution Time: {execution_time:.4f} seconds ({execution_time*1000:.2f} ms)\n")
-                self.results_text.insert(tk.END, f"Verification: {'✅ PASSED (Good boy!)' if is_sorted else '❌ FAILED (Bad dog!)'}\n\n")
+                if timing_text:
+                    self.results_text.insert(tk.END, f"                ({timing_text})\n")
+                self.results_text.insert(tk.END, f"Verification: {PENDING}\n\n")
+                verification.when_done(lambda outcome: self.show_verification("Verification: ", outcome))
 
                 self.results_text.insert(tk.END, f"{'='*70}\n")
                 self.results_text.insert(tk.END, f"COMPLETE SORTED ARRAY ({len(self.sorted_array)} elements)\n")
@@ -672,12 +657,8 @@ class PrelimLab1:
                 self.results_text.insert(tk.END, f"{header}\n")
                 self.results_text.insert(tk.END, f"{'='*70}\n\n")
 
-                for num in array_to_show:
-                    self.results_text.insert(tk.END, f"{num}\n")
-
-                self.results_text.insert(tk.END, f"\n{'='*70}\n")
-                self.results_text.insert(tk.END, f"🐾 Sorting complete! Good dog! 🐾\n")
-                self.results_text.insert(tk.END, f"{'='*70}\n")
+                # the listing can be the whole array; insert it from the UI thread in frame-sized chunks
+                self.frame.after(0, lambda: self.render_sorted(array_to_show))
 
                 self.timer_label.config(text=f"⏱️ Time: {execution_time:.4f}s")
 
@@ -688,9 +669,11 @@ class PrelimLab1:
                     except Exception:
                         pass
 
+                done_text = (f"Bubble Sort result reused from the cache (first sorted in {execution_time:.4f} seconds)!\n"
+                             if cached is not None else f"Bubble Sort completed in {execution_time:.4f} seconds!\n")
                 messagebox.showinfo("Success! 🐕",
-                    f"Bubble Sort completed in {execution_time:.4f} seconds!\n"
-                    f"{'Sorted correctly! Good boy! 🦴' if is_sorted else 'Error in sorting! 😿'}")
+                    done_text +
+                    f"Correctness is checked in the background - see Verification in the report 🦴")
 
                 self.status_var.set("Sorting complete! ✅")
 
@@ -708,6 +691,34 @@ class PrelimLab1:
 
         threading.Thread(target=sort_thread, daemon=True).start()
 
+    def cancel_render(self):
+        """Stop listing a previous result before the text is replaced"""
+        if self.render_job is not None:
+            self.render_job.cancel()
+            self.render_job = None
+
+    def render_sorted(self, values):
+        """Append the sorted values and the closing banner without freezing the window"""
+        self.cancel_render()
+
+        def insert_chunk(chunk):
+            try:
+                self.results_text.insert(tk.END, "\n".join(map(str, chunk)) + "\n")
+            except Exception:
+                pass
+
+        def on_complete():
+            self.results_text.insert(tk.END, f"\n{'='*70}\n")
+            self.results_text.insert(tk.END, f"🐾 Sorting complete! Good dog! 🐾\n")
+            self.results_text.insert(tk.END, f"{'='*70}\n")
+
+        self.render_job = render_chunked(self.frame.after, values, insert_chunk, on_complete)
+
+    def show_verification(self, label, outcome):
+        """Replace the pending placeholder after label with the verification result"""
+        dog = "(Good boy!)" if getattr(outcome, "passed", False) else "(Bad dog!)"
+        fill_placeholder(self.results_text, label, outcome, dog)
+
     def stop_sort(self):
         """Stop the current sorting operation"""
         if self.is_sorting:
@@ -754,22 +765,31 @@ class PrelimLab1:
 
         path = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            filetypes=export.filetypes("Text files", ".txt") + [("All files", "*.*")],
             initialfile="sorted_data.txt"
         )
 
         if path:
-            try:
-                with open(path, 'w', encoding='utf-8') as f:
-                    for num in self.sorted_array:
-                        f.write(f"{num}\n")
+            data = self.sorted_array
+            self.status_var.set(f"Exporting {len(data)} numbers... 🐕")
 
+            def on_done(written, elapsed):
+                self.status_var.set(f"Exported {written:,} bytes in {elapsed:.3f}s ✅")
                 messagebox.showinfo("Exported! 🐕",
-                    f"Sorted data ({len(self.sorted_array)} numbers) saved to {os.path.basename(path)}")
+                    f"Sorted data ({len(data)} numbers) saved to {os.path.basename(path)}")
 
-            except Exception as e:
+            def on_error(e):
+                self.status_var.set("Export failed 😿")
                 messagebox.showerror("Error! 😿", f"Failed to export: {e}")
 
+            # write in large pre-joined blocks on a worker thread so Tk stays responsive
+            export.export_in_background(
+                lambda: export.write_lines(path, data),
+                lambda fn: self.frame.after(0, fn),
+                on_done,
+                on_error
+            )
+
 class ArfArfSort:
     """🐕 Main application class - Lab 1 Only Edition"""
 
@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import time
-import random
 import csv
 from typing import List, Tuple, Optional, Callable
 import os
@@ -10,6 +9,23 @@ import subprocess
 import sys
 import glob
 
+# Shared helpers live in <repo>/labkit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..')))
+
+from labkit import datagen, export
+from labkit.incremental import IncrementalSortCache
+from labkit.isolated import IsolatedSort, run_concurrently, run_isolated, spread_cpus
+from labkit.sorting import ALGORITHMS, OpCounters
+from labkit.timing import measure
+from labkit.framebudget import render_chunked
+from labkit.paging import PagedLines, TextPager
+from labkit.progress import ProgressEta, work_total
+from labkit.resultcache import ResultCache, fingerprint
+from labkit.sizesweep import probe_points
+from labkit.verify import PENDING, fill_placeholder, verify_in_background, verify_values
+from labkit.complexity import ComplexityFit, format_duration, geometric_sizes
+from labkit.profiling import MODES as PROFILE_MODES, make_profiler
+
 DOG_COLORS = {
     'primary': '#8B4513',      # Saddle Brown (dog fur)
     'secondary': '#D2691E',    # Chocolate (light brown)
@@ -23,146 +39,14 @@ DOG_COLORS = {
     'text': '#2F4F4F'          # Dark Slate Gray
 }
 
-class SortingAlgorithms:
-    """Contains implementations of various sorting algorithms with progress tracking"""
-
-    @staticmethod
-    def bubble_sort(arr: List,
-                    timer_cb: Optional[Callable] = None,
-                    stop_cb: Optional[Callable] = None,
-                    progress_cb: Optional[Callable[[int, int], None]] = None,
-                    reverse: bool = False) -> List:
-        """Bubble Sort - O(n^2)
-        reverse: False -> ascending, True -> descending
-        """
-        n = len(arr)
-        arr_copy = arr.copy()
-        start_time = time.time()
-
-        for i in range(n):
-            swapped = False
-            for j in range(0, n - i - 1):
-                if (not reverse and arr_copy[j] > arr_copy[j + 1]) or (reverse and arr_copy[j] < arr_copy[j + 1]):
-                    arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
-                    swapped = True
-
-            if progress_cb:
-                try:
-                    progress_cb(i + 1, n)
-                except Exception:
-                    pass
-
-            if not swapped:
-                break
-
-            if stop_cb and stop_cb():
-                return arr_copy
-
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-
-        return arr_copy
-
-    @staticmethod
-    def insertion_sort(arr: List,
-                       timer_cb: Optional[Callable] = None,
-                       stop_cb: Optional[Callable] = None,
-                       progress_cb: Optional[Callable[[int, int], None]] = None,
-                       reverse: bool = False) -> List:
-        """Insertion Sort - O(n^2)"""
-        arr_copy = arr.copy()
-        n = len(arr_copy)
-        start_time = time.time()
-
-        for i in range(1, n):
-            key = arr_copy[i]
-            j = i - 1
-
-            if not reverse:
-                while j >= 0 and arr_copy[j] > key:
-                    arr_copy[j + 1] = arr_copy[j]
-                    j -= 1
-            else:
-                while j >= 0 and arr_copy[j] < key:
-                    arr_copy[j + 1] = arr_copy[j]
-                    j -= 1
-
-            arr_copy[j + 1] = key
-
-            if progress_cb:
-                try:
-                    progress_cb(i, n)
-                except Exception:
-                    pass
-
-            if stop_cb and stop_cb():
-                return arr_copy
-
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-
-        return arr_copy
-
-    @staticmethod
-    def merge_sort(arr: List,
-                   timer_cb: Optional[Callable] = None,
-                   stop_cb: Optional[Callable] = None,
-                   progress_cb: Optional[Callable[[int, int], None]] = None,
-                   reverse: bool = False) -> List:
-        """Merge Sort - O(n log n)"""
-        if len(arr) <= 1:
-            return arr.copy()
-
-        start_time = time.time()
-
-        def merge(left: List, right: List) -> List:
-            result = []
-            i = j = 0
-            while i < len(left) and j < len(right):
-                if (not reverse and left[i] <= right[j]) or (reverse and left[i] >= right[j]):
-                    result.append(left[i])
-                    i += 1
-                else:
-                    result.append(right[j])
-                    j += 1
-            result.extend(left[i:])
-            result.extend(right[j:])
-            return result
-
-        # optional simple progress heuristic: count merges completed vs. total (not exact)
-        merge_counter = {'count': 0, 'total': max(1, len(arr).bit_length() * len(arr))}
-
-        def merge_sort_recursive(arr_local: List) -> List:
-            if len(arr_local) <= 1:
-                return arr_local
-
-            if stop_cb and stop_cb():
-                return arr_local
-
-            mid = len(arr_local) // 2
-            left = merge_sort_recursive(arr_local[:mid])
-            right = merge_sort_recursive(arr_local[mid:])
-            result = merge(left, right)
-
-            # progress callback (best-effort)
-            merge_counter['count'] += 1
-            if progress_cb:
-                try:
-                    progress_cb(merge_counter['count'], merge_counter['total'])
-                except Exception:
-                    pass
-
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-
-            return result
-
-        return merge_sort_recursive(arr.copy())
-
-
 class PrelimLab2:
     """🦴 Prelim Lab Work 2 - Comparative Analysis of Sorting Algorithms"""
 
+    FIT_MIN_SIZE = 256      # smaller datasets are too fast to fit a growth curve
+    FIT_TIME_LIMIT = 0.5    # stop an algorithm's size sweep once one size takes this long (per run)
+    PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'profiles')
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'result_cache')
+
     def __init__(self, parent_frame):
         self.frame = parent_frame
         self.dataset = []
@@ -173,6 +57,17 @@ class PrelimLab2:
         self.show_first_10 = tk.BooleanVar(value=True)
         self.available_datasets = []  # (path, filename, count)
         self.order_var = tk.StringVar(value="asc")  # 'asc' or 'desc'
+        self.dataset_path = None  # file the dataset came from (None when generated)
+        self.render_job = None  # ChunkScheduler filling results_text, if any
+        self.incremental = tk.BooleanVar(value=False)
+        self.incremental_cache = IncrementalSortCache()
+        self.count_ops = tk.BooleanVar(value=False)
+        self.profile_mode = tk.StringVar(value="Off")
+        self.repeats_var = tk.StringVar(value="3")  # timed runs per algorithm in Run All
+        self.concurrent = tk.BooleanVar(value=False)  # Compare All runs every algorithm at once
+        self.use_cache = tk.BooleanVar(value=True)  # Run Selected reuses results of the same data
+        self.persist_cache = tk.BooleanVar(value=False)  # also save results under CACHE_DIR
+        self.result_cache = ResultCache(directory=self.CACHE_DIR if self.persist_cache.get() else None)
         self.setup_ui()
         self.update_timer_visibility()
         self.update_progress_visibility()
@@ -278,6 +173,24 @@ class PrelimLab2:
             font=("Arial", 9)
         ).pack(side=tk.LEFT, padx=3)
 
+        # Generator settings
+        gen_frame = tk.Frame(left, bg=DOG_COLORS['bg'])
+        gen_frame.grid(row=3, column=0, columnspan=3, pady=(0, 5))
+
+        tk.Label(gen_frame, text="Distribution:", font=("Arial", 9), bg=DOG_COLORS['bg'], fg=DOG_COLORS['dark']).pack(side=tk.LEFT)
+        self.gen_dist_var = tk.StringVar(value="uniform")
+        ttk.Combobox(
+            gen_frame,
+            textvariable=self.gen_dist_var,
+            values=list(datagen.DISTRIBUTIONS),
+            state="readonly",
+            width=13
+        ).pack(side=tk.LEFT, padx=(3, 10))
+
+        tk.Label(gen_frame, text="Seed:", font=("Arial", 9), bg=DOG_COLORS['bg'], fg=DOG_COLORS['dark']).pack(side=tk.LEFT)
+        self.gen_seed_var = tk.StringVar(value="")
+        tk.Entry(gen_frame, textvariable=self.gen_seed_var, font=("Arial", 9), width=10).pack(side=tk.LEFT, padx=3)
+
         # Middle - Algorithm selection
         middle = tk.Frame(control_frame, bg=DOG_COLORS['bg'])
         middle.pack(side=tk.LEFT, padx=20)
@@ -325,6 +238,60 @@ class PrelimLab2:
             font=("Arial", 9)
         ).pack()
 
+        tk.Checkbutton(
+            middle,
+            text="🐾 Incremental (merge appended lines)",
+            variable=self.incremental,
+            bg=DOG_COLORS['bg'],
+            font=("Arial", 9)
+        ).pack()
+
+        tk.Checkbutton(
+            middle,
+            text="🐾 Reuse cached results (Run Selected only)",
+            variable=self.use_cache,
+            bg=DOG_COLORS['bg'],
+            font=("Arial", 9)
+        ).pack()
+
+        tk.Checkbutton(
+            middle,
+            text="🐾 Keep cached results on disk",
+            variable=self.persist_cache,
+            command=self.apply_cache_setting,
+            bg=DOG_COLORS['bg'],
+            font=("Arial", 9)
+        ).pack()
+
+        tk.Checkbutton(
+            middle,
+            text="🐾 Count operations (comparisons, moves...)",
+            variable=self.count_ops,
+            bg=DOG_COLORS['bg'],
+            font=("Arial", 9)
+        ).pack()
+
+        tk.Checkbutton(
+            middle,
+            text="🐾 Compare All at the same time (one process per algorithm)",
+            variable=self.concurrent,
+            bg=DOG_COLORS['bg'],
+            font=("Arial", 9)
+        ).pack()
+
+        # Repetitions for the comparative run (median / CI need more than one sample)
+        repeat_frame = tk.Frame(middle, bg=DOG_COLORS['bg'])
+        repeat_frame.pack(pady=(4, 0))
+        tk.Label(repeat_frame, text="Repetitions (Run All):", font=("Arial", 9, "bold"), bg=DOG_COLORS['bg']).pack(side=tk.LEFT, padx=(0,6))
+        tk.Entry(repeat_frame, textvariable=self.repeats_var, font=("Arial", 9), width=4).pack(side=tk.LEFT)
+
+        # Optional CPU profile of Run All (cProfile -> .pstats, Sampling -> .folded)
+        profile_frame = tk.Frame(middle, bg=DOG_COLORS['bg'])
+        profile_frame.pack(pady=(4, 0))
+        tk.Label(profile_frame, text="Profile Run All:", font=("Arial", 9, "bold"), bg=DOG_COLORS['bg']).pack(side=tk.LEFT, padx=(0,6))
+        ttk.Combobox(profile_frame, textvariable=self.profile_mode, values=PROFILE_MODES,
+                     state="readonly", font=("Arial", 9), width=9).pack(side=tk.LEFT)
+
         # Order selection (Ascending / Descending)
         order_frame = tk.Frame(middle, bg=DOG_COLORS['bg'])
         order_frame.pack(pady=4)
@@ -382,6 +349,19 @@ class PrelimLab2:
 
         self.progress = ttk.Progressbar(timer_frame, orient='horizontal', mode='determinate', length=600)
 
+        # One bar per algorithm, shown while Compare All runs them at the same time
+        self.algo_bars_frame = tk.Frame(timer_frame, bg=DOG_COLORS['bg'])
+        self.algo_bars = {}
+        for algo in ALGORITHMS:
+            row = tk.Frame(self.algo_bars_frame, bg=DOG_COLORS['bg'])
+            row.pack(anchor=tk.W, fill=tk.X)
+            tk.Label(row, text=algo, width=14, anchor='w', font=("Arial", 9, "bold"), bg=DOG_COLORS['bg']).pack(side=tk.LEFT)
+            bar = ttk.Progressbar(row, orient='horizontal', mode='determinate', length=400)
+            bar.pack(side=tk.LEFT, padx=(0, 8))
+            status = tk.Label(row, text="", font=("Arial", 9), bg=DOG_COLORS['bg'])
+            status.pack(side=tk.LEFT)
+            self.algo_bars[algo] = (bar, status)
+
         # Results
         tk.Label(
             self.frame,
@@ -399,6 +379,30 @@ class PrelimLab2:
         )
         self.results_text.pack(padx=20, pady=5, fill=tk.BOTH, expand=True)
 
+        # Pager for the sorted array: only the page on screen is formatted
+        pager_frame = tk.Frame(self.frame, bg=DOG_COLORS['bg'])
+        pager_frame.pack(padx=20, fill=tk.X)
+        self.pager_status = tk.StringVar(value="No records")
+        self.results_pager = TextPager(self.results_text, on_change=self.pager_status.set)
+        tk.Button(pager_frame, text="◀", command=self.results_pager.prev_page,
+                  font=("Arial", 9, "bold"), padx=6).pack(side=tk.LEFT)
+        tk.Button(pager_frame, text="▶", command=self.results_pager.next_page,
+                  font=("Arial", 9, "bold"), padx=6).pack(side=tk.LEFT, padx=(2, 0))
+        tk.Label(pager_frame, textvariable=self.pager_status, bg=DOG_COLORS['bg'],
+                 font=("Arial", 9)).pack(side=tk.LEFT, padx=10)
+        self.find_var = tk.StringVar()
+        tk.Button(pager_frame, text="🔍 Find", command=self.find_in_results,
+                  font=("Arial", 9, "bold"), padx=6).pack(side=tk.RIGHT)
+        find_entry = tk.Entry(pager_frame, textvariable=self.find_var, width=10)
+        find_entry.pack(side=tk.RIGHT, padx=(8, 2))
+        find_entry.bind("<Return>", lambda e: self.find_in_results())
+        self.jump_var = tk.StringVar()
+        tk.Button(pager_frame, text="Go to #", command=self.jump_in_results,
+                  font=("Arial", 9, "bold"), padx=6).pack(side=tk.RIGHT)
+        jump_entry = tk.Entry(pager_frame, textvariable=self.jump_var, width=8)
+        jump_entry.pack(side=tk.RIGHT, padx=2)
+        jump_entry.bind("<Return>", lambda e: self.jump_in_results())
+
         # Export
         export_frame = tk.Frame(self.frame, bg=DOG_COLORS['bg'])
         export_frame.pack(pady=10)
@@ -437,6 +441,9 @@ class PrelimLab2:
         )
         status_bar.pack(fill=tk.X, pady=(5, 0))
 
+    def apply_cache_setting(self):
+        self.result_cache.directory = self.CACHE_DIR if self.persist_cache.get() else None
+
     def update_timer_visibility(self):
         if self.show_timer.get():
             self.timer_label.pack(anchor=tk.W)
@@ -519,6 +526,7 @@ class PrelimLab2:
                         continue
                     nums.append(int(stripped))
             self.dataset = nums
+            self.dataset_path = path
             self.size_var.set(str(len(self.dataset)))
             self.results_text.insert(tk.END, f"\n📂 Loaded {filename} with {len(self.dataset)} numbers from data folder.\n")
             self.status_var.set(f"Loaded {filename}")
@@ -539,6 +547,7 @@ class PrelimLab2:
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 self.dataset = [int(line.strip()) for line in f if line.strip()]
+            self.dataset_path = path
 
             self.size_var.set(str(len(self.dataset)))
             self.results_text.delete("1.0", tk.END)
@@ -555,9 +564,14 @@ class PrelimLab2:
             if size <= 0:
                 raise ValueError("Size must be positive")
 
-            self.dataset = [random.randint(1, 100000) for _ in range(size)]
+            distribution = self.gen_dist_var.get()
+            seed_text = self.gen_seed_var.get().strip()
+            seed = datagen.resolve_seed(int(seed_text) if seed_text else None)
+
+            self.dataset = datagen.generate(size, distribution, seed)
+            self.dataset_path = None
             self.results_text.delete("1.0", tk.END)
-            self.results_text.insert("1.0", f"🎲 Generated {size} numbers\n")
+            self.results_text.insert("1.0", f"🎲 Generated {size} {distribution} numbers (seed {seed})\n")
 
             messagebox.showinfo("Success! 🐕", f"Generated {size} numbers")
 
@@ -571,36 +585,18 @@ class PrelimLab2:
 
     def run_algorithm(self, algorithm_name: str, dataset: List,
                       progress_cb: Optional[Callable[[int,int],None]] = None,
-                      reverse: bool = False) -> Tuple[List, float]:
-        """Run a specific sorting algorithm with reverse support"""
-        start_time = time.time()
-        if algorithm_name == "Bubble Sort":
-            sorted_array = SortingAlgorithms.bubble_sort(
-                dataset,
-                timer_cb=self.update_timer if self.show_timer.get() else None,
-                stop_cb=lambda: not self.is_sorting,
-                progress_cb=progress_cb,
-                reverse=reverse
-            )
-        elif algorithm_name == "Insertion Sort":
-            sorted_array = SortingAlgorithms.insertion_sort(
-                dataset,
-                timer_cb=self.update_timer if self.show_timer.get() else None,
-                stop_cb=lambda: not self.is_sorting,
-                progress_cb=progress_cb,
-                reverse=reverse
-            )
-        else:
-            sorted_array = SortingAlgorithms.merge_sort(
-                dataset,
-                timer_cb=self.update_timer if self.show_timer.get() else None,
-                stop_cb=lambda: not self.is_sorting,
-                progress_cb=progress_cb,
-                reverse=reverse
-            )
-
-        execution_time = time.time() - start_time
-        return sorted_array, execution_time
+                      reverse: bool = False,
+                      counters: Optional[OpCounters] = None) -> Tuple[List, float]:
+        """Run a specific sorting algorithm with reverse support, in a child process"""
+        return run_isolated(
+            algorithm_name,
+            dataset,
+            timer_cb=self.update_timer if self.show_timer.get() else None,
+            stop_cb=lambda: not self.is_sorting,
+            progress_cb=progress_cb,
+            reverse=reverse,
+            counters=counters
+        )
 
     # ---------- Loading overlay & chunked render helpers ----------
     def show_loading_overlay(self, message="Rendering results... Please wait"):
@@ -632,38 +628,41 @@ class PrelimLab2:
             pass
         self._loading_overlay = None
 
-    def render_lines_chunked(self, lines: List[str], chunk_size: int = 200, on_complete: Optional[Callable] = None):
-        """Insert lines into the results_text in small chunks so the UI remains responsive."""
+    def render_lines_chunked(self, lines: List[str], on_complete: Optional[Callable] = None):
+        """Insert lines into the results_text in frame-budgeted chunks so the UI remains responsive."""
+        if self.render_job is not None:
+            self.render_job.cancel()
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete("1.0", tk.END)
-        total = len(lines)
-        idx = 0
-
-        def _insert_chunk():
-            nonlocal idx
-            end = min(idx + chunk_size, total)
-            # join chunk into a single insert call
-            chunk_text = "".join(lines[idx:end])
-            try:
-                self.results_text.insert(tk.END, chunk_text)
-            except Exception:
-                pass
-            idx = end
-            # update visible UI
+        self.results_pager.detach()
+
+        def insert_chunk(chunk):
+            # one insert call per chunk; see() keeps the newest output visible
             try:
+                self.results_text.insert(tk.END, "".join(chunk))
                 self.results_text.see(tk.END)
             except Exception:
                 pass
-            if idx < total:
-                # schedule next chunk
-                self.frame.after(5, _insert_chunk)
-            else:
-                # done
-                if on_complete:
-                    on_complete()
 
-        # start chunked insertion
-        self.frame.after(1, _insert_chunk)
+        self.render_job = render_chunked(self.frame.after, lines, insert_chunk, on_complete)
+
+    def jump_in_results(self):
+        """Show the page holding element number jump_var (1-based)"""
+        try:
+            index = int(self.jump_var.get().replace(",", "")) - 1
+        except ValueError:
+            messagebox.showerror("Error! 😿", "Enter an element number to jump to!")
+            return
+        if not self.results_pager.jump_to(index):
+            messagebox.showinfo("No Data! 🐕", "Run a single algorithm first!")
+
+    def find_in_results(self):
+        """Jump to the next sorted element containing find_var"""
+        needle = self.find_var.get().strip()
+        if not needle or not self.results_pager.attached:
+            return
+        if self.results_pager.find(needle) < 0:
+            messagebox.showinfo("Not Found 🐕", f"No sorted element contains '{needle}'")
 
     # ---------- Run single algorithm ----------
     def run_single(self):
@@ -687,26 +686,65 @@ class PrelimLab2:
 
         def sort_thread():
             try:
-                # prepare progress callback
+                # prepare progress callback (work units, see labkit.progress)
+                eta = ProgressEta()
+
                 def progress_cb_local(current, total):
+                    status = f"Sorting {algorithm}... {eta.update(current, total).describe()}"
                     def _update():
                         try:
                             self.progress['maximum'] = total
                             self.progress['value'] = current
-                            self.status_var.set(f"Sorting {algorithm}... {current}/{total}")
+                            self.status_var.set(status)
                         except Exception:
                             pass
                     self.frame.after(0, _update)
 
                 progress_cb = progress_cb_local if self.show_progress.get() else None
 
-                sorted_array, exec_time = self.run_algorithm(algorithm, self.dataset, progress_cb=progress_cb, reverse=reverse_flag)
+                counters = OpCounters() if self.count_ops.get() else None
+                mode_text = "Full sort"
+                timing_text = None  # breakdown of an incremental run's time
+                if self.incremental.get() and self.dataset_path:
+                    # only the lines appended since the last run are sorted, then merged;
+                    # the time is sort + merge, like a full sort's (file I/O is listed apart)
+                    result = self.incremental_cache.sort(
+                        self.dataset_path,
+                        lambda values: self.run_algorithm(algorithm, values, progress_cb=progress_cb, reverse=reverse_flag, counters=counters),
+                        reverse=reverse_flag
+                    )
+                    exec_time = result.seconds
+                    timing_text = result.describe()
+                    if result.mode == 'full':
+                        self.dataset = result.values
+                    elif result.mode == 'incremental':
+                        self.dataset = self.dataset + result.appended
+                        mode_text = f"Incremental (+{len(result.appended)} appended values merged)"
+                    else:
+                        mode_text = "Incremental (file unchanged, cached result reused)"
+                    if not self.is_sorting:
+                        # a stopped run is only partially sorted; never reuse it
+                        self.incremental_cache.forget(self.dataset_path)
+                    sorted_array = result.sorted_values
+                else:
+                    # counting needs a real run; otherwise the same data, algorithm and order is a cache hit
+                    use_cache = self.use_cache.get() and counters is None
+                    cache_key = self.result_cache.key(self.dataset, "values", algorithm, reverse_flag) if use_cache else None
+                    cached = self.result_cache.get(cache_key) if cache_key else None
+                    if cached is not None:
+                        sorted_array, exec_time = cached.values, cached.seconds
+                        mode_text = "Cached result (time measured when it was first sorted)"
+                    else:
+                        sorted_array, exec_time = self.run_algorithm(algorithm, self.dataset, progress_cb=progress_cb, reverse=reverse_flag, counters=counters)
+                        if cache_key and self.is_sorting:
+                            self.result_cache.put(cache_key, sorted_array, exec_time)
                 self.sorted_arrays = {algorithm: sorted_array}
 
-                # prepare output lines first (so timing is taken when sort finished)
-                is_sorted = all(
-                    (sorted_array[i] >= sorted_array[i+1]) if reverse_flag else (sorted_array[i] <= sorted_array[i+1])
-                    for i in range(len(sorted_array)-1)
+                # verify off the timed path while the output lines are prepared
+                original = self.dataset
+                verification = verify_in_background(
+                    lambda: verify_values(original, sorted_array, reverse_flag),
+                    lambda fn: self.frame.after(0, fn)
                 )
 
                 order_text = "Descending" if reverse_flag else "Ascending"
@@ -716,22 +754,28 @@ class PrelimLab2:
                 lines.append("="*70 + "\n\n")
                 lines.append(f"Size: {len(self.dataset)}\n")
                 lines.append(f"Time: {exec_time:.4f}s ({exec_time*1000:.2f}ms)\n")
-                lines.append(f"Status: {'✅ SORTED' if is_sorted else '❌ ERROR'}\n\n")
+                if timing_text:
+                    lines.append(f"      ({timing_text})\n")
+                lines.append(f"Mode: {mode_text}\n")
+                if counters is not None:
+                    lines.append(f"Operations: {counters.describe()}\n")
+                    lines.append("            (time includes operation counting)\n")
+                lines.append(f"Status: {PENDING}\n\n")
                 header = "FIRST 10 SORTED RECORDS" if self.show_first_10.get() else f"COMPLETE SORTED ARRAY ({len(sorted_array)} elements)"
                 lines.append("="*70 + "\n")
                 lines.append(f"{header}\n")
                 lines.append("="*70 + "\n")
+                # the array itself is paged in after rendering (◀ ▶, Go to #, Find)
                 display_array = sorted_array[:10] if self.show_first_10.get() else sorted_array
-                for num in display_array:
-                    lines.append(f"{num}\n")
-                lines.append("\n" + "="*70 + "\n")
-                lines.append("🐾 Complete! 🐾\n" + "="*70 + "\n")
+                footer = "\n" + "="*70 + "\n" + "🐾 Complete! 🐾\n" + "="*70 + "\n"
 
                 # Show loading overlay and render chunked
                 self.show_loading_overlay("Rendering results...")
 
                 def on_render_done():
                     # hide overlay, finalize UI and show the final completion message
+                    self.results_pager.attach(PagedLines(display_array))
+                    self.results_text.insert(tk.END, footer)
                     self.hide_loading_overlay()
                     self.timer_label.config(text=f"⏱️ {exec_time:.4f}s")
                     if self.show_progress.get():
@@ -740,6 +784,7 @@ class PrelimLab2:
                         except Exception:
                             pass
                     self.status_var.set("--")
+                    verification.when_done(lambda outcome: fill_placeholder(self.results_text, "Status: ", outcome))
                     messagebox.showinfo("Done! 🐕", f"{algorithm} completed in {exec_time:.4f}s")
                     # finalize state
                     self.is_sorting = False
@@ -750,7 +795,7 @@ class PrelimLab2:
                         pass
 
                 # render
-                self.frame.after(1, lambda: self.render_lines_chunked(lines, chunk_size=200, on_complete=on_render_done))
+                self.frame.after(1, lambda: self.render_lines_chunked(lines, on_complete=on_render_done))
 
             except Exception as e:
                 self.hide_loading_overlay()
@@ -778,6 +823,59 @@ class PrelimLab2:
             # hide overlay if any
             self.hide_loading_overlay()
 
+    def show_algo_bars(self, visible: bool):
+        if visible:
+            for bar, status in self.algo_bars.values():
+                bar.config(value=0, maximum=1)
+                status.config(text="⏳ starting...")
+            self.algo_bars_frame.pack(anchor=tk.W, pady=(5, 2))
+        else:
+            self.algo_bars_frame.pack_forget()
+
+    def update_algo_bar(self, algo: str, done: int, total: int, text: str):
+        bar, status = self.algo_bars[algo]
+        bar.config(maximum=total, value=done)
+        status.config(text=text)
+
+    def compare_concurrently(self, algorithms: List[str], repeats: int, reverse: bool):
+        """Time every algorithm at once, one pinned child process each (runs on the worker thread).
+
+        Each result row is added to the live table as soon as that algorithm
+        finishes. Returns ({algo: IsolatedResult}, wall seconds, cpus), or
+        None if stopped.
+        """
+        cpus = spread_cpus(len(algorithms))
+        jobs = {algo: IsolatedSort(algo, self.dataset, reverse, repeats, cpu=cpu)
+                for algo, cpu in zip(algorithms, cpus)}
+        etas = {algo: ProgressEta() for algo in algorithms}
+        started = time.perf_counter()
+
+        self.frame.after(0, lambda: self.show_algo_bars(True))
+        self.results_text.insert(tk.END, f"{'Algorithm':<16} {'Median (s)':<12} {'Min (s)':<12} {'Finished after'}\n")
+        self.results_text.insert(tk.END, "-"*58 + "\n")
+
+        def on_progress(algo, done, total):
+            text = etas[algo].update(done, total).describe()
+            self.frame.after(0, lambda: self.update_algo_bar(algo, done, total, text))
+
+        def on_done(algo, run):
+            wall = time.perf_counter() - started
+            row = f"{algo:<16} {run.stats.median:<12.6f} {run.stats.min:<12.6f} {wall:.2f}s\n"
+
+            def show():
+                self.update_algo_bar(algo, 1, 1, f"✅ median {run.stats.median:.4f}s")
+                self.results_text.insert(tk.END, row)
+
+            self.frame.after(0, show)
+
+        try:
+            runs = run_concurrently(jobs, on_progress, on_done, stop_cb=lambda: not self.is_sorting)
+        finally:
+            self.frame.after(1000, lambda: self.show_algo_bars(False))
+        if any(run is None for run in runs.values()):
+            return None
+        return runs, time.perf_counter() - started, cpus
+
     def run_all(self):
         if not self.dataset:
             messagebox.showwarning("No Data! 🐕", "Import or generate dataset first!")
@@ -787,6 +885,14 @@ class PrelimLab2:
             messagebox.showwarning("Busy! 🐕", "Already sorting!")
             return
 
+        try:
+            repeats = int(self.repeats_var.get())
+            if repeats < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error! 😿", "Repetitions must be a whole number of at least 1!")
+            return
+
         self.is_sorting = True
         reverse_flag = True if self.order_var.get() == 'desc' else False
 
@@ -795,31 +901,92 @@ class PrelimLab2:
         self.results_text.insert("1.0", f"🐕 Comparing all algorithms ({'Descending' if reverse_flag else 'Ascending'})...\n\n")
         self.frame.update()
 
+        profile_mode = self.profile_mode.get()
+
         def compare_thread():
+            # one pass over the data for every algorithm's cache key
+            data_fingerprint = fingerprint(self.dataset) if self.use_cache.get() else None
+            profiler = make_profiler(profile_mode, self.PROFILE_DIR, "run_all")
             try:
+                if profiler:
+                    profiler.start()
                 algorithms = ["Bubble Sort", "Insertion Sort", "Merge Sort"]
-                results = {}
+                results = {}          # median seconds per algorithm
+                stats_by_algo = {}
+                counts = {}           # OpCounters per algorithm (Count operations only)
                 self.sorted_arrays = {}
 
+                # profiles need the algorithms in this process, one after another
+                concurrent = None
+                if self.concurrent.get() and not profiler:
+                    self.results_text.insert(tk.END, f"Running all {len(algorithms)} algorithms at the same time ({repeats}x each)...\n\n")
+                    concurrent = self.compare_concurrently(algorithms, repeats, reverse_flag)
+                    if concurrent is None:
+                        return
+
                 for algo in algorithms:
-                    self.results_text.insert(tk.END, f"Running {algo}...\n")
-                    self.frame.update()
-
-                    def progress_cb_local(current, total, _algo=algo):
-                        def _update():
-                            try:
-                                self.progress['maximum'] = total
-                                self.progress['value'] = current
-                                self.status_var.set(f"Sorting {_algo}... {current}/{total}")
-                            except Exception:
-                                pass
-                        self.frame.after(0, _update)
-
-                    progress_cb = progress_cb_local if (self.show_progress.get() and algo in ("Bubble Sort", "Insertion Sort", "Merge Sort")) else None
-
-                    sorted_array, exec_time = self.run_algorithm(algo, self.dataset, progress_cb=progress_cb, reverse=reverse_flag)
-                    results[algo] = exec_time
+                    if concurrent:
+                        run = concurrent[0][algo]
+                        stats, sorted_array = run.stats, run.values
+                    else:
+                        self.results_text.insert(tk.END, f"Running {algo} ({repeats}x)...\n")
+                        self.frame.update()
+
+                        def progress_cb_local(current, total, _algo=algo, _eta=ProgressEta()):
+                            status = f"Sorting {_algo}... {_eta.update(current, total).describe()}"
+                            def _update():
+                                try:
+                                    self.progress['maximum'] = total
+                                    self.progress['value'] = current
+                                    self.status_var.set(status)
+                                except Exception:
+                                    pass
+                            self.frame.after(0, _update)
+
+                        progress_cb = progress_cb_local if (self.show_progress.get() and algo in ("Bubble Sort", "Insertion Sort", "Merge Sort")) else None
+
+                        timer_cb = self.update_timer if self.show_timer.get() else None
+                        # every repetition sorts a fresh copy; the copy is made outside the timed region
+                        if profiler:
+                            # profiles need the algorithm in this process; the progress
+                            # total is counted once, outside the timed runs
+                            total = work_total(algo, self.dataset, reverse_flag) if progress_cb else None
+                            stats, sorted_array = measure(
+                                lambda data, _algo=algo: ALGORITHMS[_algo](
+                                    data,
+                                    timer_cb=timer_cb,
+                                    stop_cb=lambda: not self.is_sorting,
+                                    progress_cb=progress_cb,
+                                    reverse=reverse_flag,
+                                    work_total=total
+                                ),
+                                self.dataset,
+                                repeats,
+                                stop_cb=lambda: not self.is_sorting
+                            )
+                        else:
+                            # the repetitions run in a child process that Stop terminates at once
+                            run = IsolatedSort(algo, self.dataset, reverse_flag, repeats).run(
+                                timer_cb, progress_cb, stop_cb=lambda: not self.is_sorting)
+                            stats, sorted_array = (run.stats, run.values) if run else (None, None)
+
+                    if stats is None or not self.is_sorting:
+                        return
+                    stats_by_algo[algo] = stats
+                    results[algo] = stats.median
                     self.sorted_arrays[algo] = sorted_array
+                    # Compare All never reads the cache (it is a timing run), but its outputs
+                    # make a later Run Selected of the same data instant
+                    if data_fingerprint is not None:
+                        self.result_cache.put(ResultCache.key_for(data_fingerprint, "values", algo, reverse_flag),
+                                              sorted_array, stats.median)
+
+                    if self.count_ops.get():
+                        # separate untimed pass so counting never skews the timings
+                        counters = OpCounters()
+                        run_isolated(algo, self.dataset, stop_cb=lambda: not self.is_sorting,
+                                     reverse=reverse_flag, counters=counters)
+                        counts[algo] = counters
 
                     if self.show_progress.get():
                         try:
@@ -827,30 +994,106 @@ class PrelimLab2:
                         except Exception:
                             pass
 
+                # Size sweep on prefixes of the dataset (sizes doubling up to n/2) for the
+                # complexity fit; the full-size median above is the last point. Every size
+                # runs in a child process, killed by Stop or once it runs past the limit
+                fits = {}
+                n = len(self.dataset)
+                if n >= self.FIT_MIN_SIZE:
+                    sizes = [size for size in geometric_sizes(max(32, n // 64), n // 2) if size < n]
+                    fit_repeats = min(repeats, 3)
+                    for algo in algorithms:
+                        self.results_text.insert(tk.END, f"Fitting {algo} over {len(sizes)} sizes...\n")
+                        self.frame.update()
+                        points = probe_points(
+                            algo, self.dataset, sizes, reverse_flag,
+                            time_limit=self.FIT_TIME_LIMIT, repeats=fit_repeats,
+                            timeout=self.FIT_TIME_LIMIT * fit_repeats, stop_cb=lambda: not self.is_sorting
+                        )
+                        if points is None or not self.is_sorting:
+                            return
+                        try:
+                            fits[algo] = ComplexityFit(points + [(n, results[algo])])
+                        except ValueError:
+                            pass
+
+                if profiler:
+                    profiler.stop()
+
+                # all timing is done; check every result in the background
+                original = self.dataset
+                verifications = {
+                    algo: verify_in_background(
+                        lambda _algo=algo: verify_values(original, self.sorted_arrays[_algo], reverse_flag),
+                        lambda fn: self.frame.after(0, fn)
+                    )
+                    for algo in algorithms
+                }
+
                 # prepare comparative output lines (do not insert directly)
                 lines = []
                 lines.append("\n\n" + "="*70 + "\n")
                 lines.append("🦴 COMPARATIVE ANALYSIS 🦴\n")
                 lines.append("="*70 + "\n\n")
-                lines.append(f"Dataset Size: {len(self.dataset)} elements\n\n")
-                lines.append(f"{'Algorithm':<20} {'Time (sec)':<15} {'Time (ms)':<15} {'Complexity'}\n")
-                lines.append("-"*70 + "\n")
+                lines.append(f"Dataset Size: {len(self.dataset)} elements\n")
+                lines.append(f"Repetitions: {repeats} per algorithm (perf_counter, GC paused, fresh copy each run)\n")
+                if concurrent:
+                    _, wall, cpus = concurrent
+                    back_to_back = sum(sum(stats.samples_ns) for stats in stats_by_algo.values()) / 1e9
+                    pinned = (f"pinned to CPUs {', '.join(map(str, cpus))}" if None not in cpus
+                              else "not pinned (CPU affinity unavailable or too few CPUs)")
+                    lines.append(f"Mode: concurrent, one process per algorithm, {pinned}\n")
+                    lines.append(f"Wall time: {wall:.3f}s (the timed runs add up to {back_to_back:.3f}s)\n")
+                lines.append("\n")
+                lines.append(f"{'Algorithm':<16} {'Median (s)':<12} {'Min (s)':<12} {'p95 (s)':<12} {'Std Dev':<12} {'Complexity'}\n")
+                lines.append("-"*78 + "\n")
                 complexities = {
                     "Bubble Sort": "O(n²)",
                     "Insertion Sort": "O(n²)",
                     "Merge Sort": "O(n log n)"
                 }
                 for algo in algorithms:
-                    time_sec = results[algo]
-                    time_ms = time_sec * 1000
+                    stats = stats_by_algo[algo]
                     complexity = complexities[algo]
-                    lines.append(f"{algo:<20} {time_sec:<15.4f} {time_ms:<15.2f} {complexity}\n")
+                    lines.append(f"{algo:<16} {stats.median:<12.6f} {stats.min:<12.6f} {stats.p95:<12.6f} {stats.stddev:<12.6f} {complexity}\n")
+                if repeats > 1:
+                    lines.append("\n95% confidence intervals (mean):\n")
+                    for algo in algorithms:
+                        stats = stats_by_algo[algo]
+                        lines.append(f"  {algo:<16} {stats.ci_low:.6f}s .. {stats.ci_high:.6f}s\n")
+
+                if counts:
+                    lines.append("\nOPERATION COUNTS (separate untimed run)\n")
+                    lines.append(f"{'Algorithm':<16} {'Comparisons':>15} {'Swaps':>13} {'Moves':>15} {'Allocs':>9} {'Peak aux':>12}\n")
+                    lines.append("-"*84 + "\n")
+                    for algo, c in counts.items():
+                        lines.append(f"{algo:<16} {c.comparisons:>15,} {c.swaps:>13,} {c.moves:>15,} "
+                                     f"{c.allocations:>9,} {c.peak_aux_bytes / 1024:>9.1f} KB\n")
+
+                lines.append("\nVERIFICATION (order + permutation, after timing)\n")
+                for algo in algorithms:
+                    lines.append(f"  {algo:<16} {PENDING}\n")
 
                 fastest = min(results, key=results.get)
-                lines.append(f"\n🏆 Fastest: {fastest} ({results[fastest]:.4f}s)\n")
-                if results["Bubble Sort"] > 0 and results["Merge Sort"] > 0:
-                    ratio = results["Bubble Sort"] / results["Merge Sort"]
-                    lines.append(f"📊 Merge Sort is {ratio:.2f}x faster than Bubble Sort!\n")
+                lines.append(f"\n🏆 Fastest: {fastest} (median {results[fastest]:.6f}s)\n")
+                for algo in algorithms:
+                    if algo != fastest and results[fastest] > 0:
+                        ratio = results[algo] / results[fastest]
+                        lines.append(f"📊 {fastest} is {ratio:.2f}x faster than {algo}!\n")
+
+                if fits:
+                    lines.append("\n" + "="*70 + "\nEMPIRICAL COMPLEXITY (fit of median time vs. size)\n" + "="*70 + "\n")
+                    lines.append(f"{'Algorithm':<16} {'Exponent k':<12} {'Closest':<12} {'Constant c':<12} {'Error':<8} {'Points'}\n")
+                    lines.append("-"*70 + "\n")
+                    for algo, fit in fits.items():
+                        c, error = fit.models[fit.best]
+                        lines.append(f"{algo:<16} {fit.exponent:<12.2f} {fit.best:<12} {c:<12.3e} {error*100:<7.1f}% {len(fit.points)}\n")
+                    lines.append(f"\nExtrapolated runtime (power law t = a·n^k):\n")
+                    for algo, fit in fits.items():
+                        lines.append(
+                            f"  {algo:<16} n={n:,}: {format_duration(fit.predict(n))} (measured {format_duration(results[algo])})"
+                            f" | n={n*10:,}: {format_duration(fit.predict(n*10))}\n"
+                        )
 
                 if self.show_first_10.get():
                     lines.append("\n\n" + "="*70 + "\nFIRST 10 RECORDS FROM EACH ALGORITHM\n" + "="*70 + "\n\n")
@@ -860,6 +1103,11 @@ class PrelimLab2:
                             lines.append(f"{num}\n")
                         lines.append("\n")
 
+                if profiler:
+                    lines.append("\n" + "="*70 + f"\nPROFILE ({profiler.mode}, top {profiler.top} by self time)\n" + "="*70 + "\n")
+                    lines.extend(line + "\n" for line in profiler.summary)
+                    lines.append(f"Saved: {os.path.abspath(profiler.path)}\n")
+
                 lines.append("\n🐾 All done! Good dogs! 🐾\n")
 
                 # show overlay and render chunked
@@ -873,6 +1121,8 @@ class PrelimLab2:
                         except Exception:
                             pass
                     self.status_var.set("All algorithms completed! ✅")
+                    for algo, verification in verifications.items():
+                        verification.when_done(lambda outcome, _algo=algo: fill_placeholder(self.results_text, f"  {_algo:<16} ", outcome))
                     messagebox.showinfo("Success! 🐕", "All algorithms completed!")
                     self.is_sorting = False
                     try:
@@ -880,7 +1130,7 @@ class PrelimLab2:
                     except Exception:
                         pass
 
-                self.frame.after(1, lambda: self.render_lines_chunked(lines, chunk_size=200, on_complete=on_render_done))
+                self.frame.after(1, lambda: self.render_lines_chunked(lines, on_complete=on_render_done))
 
             except Exception as e:
                 self.hide_loading_overlay()
@@ -890,6 +1140,9 @@ class PrelimLab2:
                     self.frame.after(300, lambda: self.progress.config(value=0))
                 except Exception:
                     pass
+            finally:
+                if profiler:
+                    profiler.stop(save=False)
 
         threading.Thread(target=compare_thread, daemon=True).start()
 
@@ -906,8 +1159,9 @@ class PrelimLab2:
 
         if path:
             try:
+                # every page of the sorted array is written, not just the one on screen
                 with open(path, 'w', encoding='utf-8') as f:
-                    f.write(self.results_text.get("1.0", tk.END))
+                    f.writelines(self.results_pager.export_chunks())
 
                 messagebox.showinfo("Saved! 🐕", "Report exported!")
             except Exception as e:
@@ -921,20 +1175,32 @@ class PrelimLab2:
         folder = filedialog.askdirectory(title="Select Export Folder")
 
         if folder:
-            try:
-                for algo_name, sorted_array in self.sorted_arrays.items():
-                    filename = f"sorted_{algo_name.replace(' ', '_').lower()}.txt"
-                    filepath = os.path.join(folder, filename)
-
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        for num in sorted_array:
-                            f.write(f"{num}\n")
+            arrays = dict(self.sorted_arrays)
+            self.status_var.set(f"Exporting {len(arrays)} sorted arrays... 🐕")
 
+            def job():
+                targets = {
+                    os.path.join(folder, f"sorted_{algo_name.replace(' ', '_').lower()}.txt"): sorted_array
+                    for algo_name, sorted_array in arrays.items()
+                }
+                # identical results are written once and hard-linked for the rest
+                return export.write_deduplicated(targets)
+
+            def on_done(summary, elapsed):
+                written, shared = summary["written"], summary["shared"]
+                self.status_var.set(f"Exported {summary['bytes']:,} bytes in {elapsed:.3f}s ✅")
+                details = f"{len(written)} written"
+                if shared:
+                    details += f", {len(shared)} identical (hard-linked or copied)"
                 messagebox.showinfo("Saved! 🐕",
-                    f"Exported {len(self.sorted_arrays)} sorted arrays!")
-            except Exception as e:
+                    f"Exported {len(arrays)} sorted arrays!\n{details}")
+
+            def on_error(e):
+                self.status_var.set("Export failed 😿")
                 messagebox.showerror("Error! 😿", str(e))
 
+            export.export_in_background(job, lambda fn: self.frame.after(0, fn), on_done, on_error)
+
 
 class ArfArfSort:
     """🐕 Specialized Application for Prelim Lab Work 2 🦴"""
@@ -1,13 +1,37 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import time
-import random
-import csv
-from typing import List, Tuple, Optional, Callable
+from typing import Tuple, Optional, Callable
 import os
 import threading
 import subprocess
 import sys
+import argparse
+from array import array
+from contextlib import contextmanager, nullcontext
+
+# Shared helpers live in <repo>/labkit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..')))
+
+from labkit.ingest import load_csv_columns, default_workers
+from labkit.isolated import run_isolated
+from labkit import sizesweep
+from labkit.sizesweep import DEFAULT_BUDGET, PROBE_ROWS, budgeted_sweep, parse_sizes, probe
+from labkit import datagen, export
+from labkit.bench import run_benchmarks, shape_matrix_lines
+from labkit.sorting import ALGORITHMS, OpCounters
+from labkit.timing import timed
+from labkit.complexity import ComplexityFit, format_duration
+from labkit.history import HistoryStore, machine_fingerprint
+from labkit.memprof import MemoryProfile, format_bytes, profile_call
+from labkit.profiling import MODES as PROFILE_MODES, make_profiler
+from labkit.spans import Spans
+from labkit.verify import PENDING, describe_outcome, fill_placeholder, verify_in_background, verify_records
+from labkit.viewport import Viewport
+from labkit.paging import PagedLines, TextPager
+from labkit.progress import ProgressEta, work_total
+from labkit.resultcache import ResultCache, fingerprint
+from labkit.uiqueue import UIQueue
 
 DOG_COLORS = {
     'primary': '#8B4513',       # Saddle Brown (professional dog theme)
@@ -25,124 +49,106 @@ DOG_COLORS = {
     'table_alt': '#FFF8DC'      # Cornsilk for alternating rows
 }
 
-class SortingAlgorithms:
-    """Contains implementations of various sorting algorithms with progress tracking"""
+PROCESS_SPAN = "Sort process overhead"  # latency stage around an isolated sort
+
+class VirtualTable:
+    """Shows a long sequence of records in a ttk.Treeview without an item per record.
+
+    Only the rows that fit in the widget exist as Treeview items. Scrolling
+    rewrites their values from rows[first:first + visible], so showing a
+    million records costs the same as showing ten.
+    """
     
-    @staticmethod
-    def bubble_sort(arr: List, timer_cb: Optional[Callable] = None, stop_cb: Optional[Callable] = None, 
-                    progress_cb: Optional[Callable] = None, reverse: bool = False) -> List:
-        """Bubble Sort - O(n^2)"""
-        n = len(arr)
-        arr_copy = arr.copy()
-        start_time = time.time()
-        
-        for i in range(n):
-            swapped = False
-            for j in range(0, n - i - 1):
-                if (arr_copy[j] > arr_copy[j + 1]) if not reverse else (arr_copy[j] < arr_copy[j + 1]):
-                    arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
-                    swapped = True
-            
-            if not swapped:
-                break
-            
-            if stop_cb and stop_cb():
-                return arr_copy
-            
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-            
-            if progress_cb and i % max(1, n // 100) == 0:
-                progress_cb((i + 1) / n * 100)
-        
-        return arr_copy
+    HEADING_HEIGHT = 25
+    WHEEL_ROWS = 3
     
-    @staticmethod
-    def insertion_sort(arr: List, timer_cb: Optional[Callable] = None, stop_cb: Optional[Callable] = None,
-                       progress_cb: Optional[Callable] = None, reverse: bool = False) -> List:
-        """Insertion Sort - O(n^2)"""
-        arr_copy = arr.copy()
-        n = len(arr_copy)
-        start_time = time.time()
-        
-        for i in range(1, n):
-            key = arr_copy[i]
-            j = i - 1
-            
-            while j >= 0 and ((arr_copy[j] > key) if not reverse else (arr_copy[j] < key)):
-                arr_copy[j + 1] = arr_copy[j]
-                j -= 1
-            
-            arr_copy[j + 1] = key
-            
-            if stop_cb and stop_cb():
-                return arr_copy
-            
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-            
-            if progress_cb and i % max(1, n // 100) == 0:
-                progress_cb(i / n * 100)
-        
-        return arr_copy
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, formatter: Callable[[int, dict], tuple]):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.formatter = formatter  # (index, record) -> Treeview values
+        self.rows = []
+        self.view = Viewport(0, int(tree.cget("height")))
+        rowheight = ttk.Style().lookup("Treeview", "rowheight")
+        self.row_height = int(rowheight) if rowheight else 20
+        
+        tree.configure(yscrollcommand="")
+        scrollbar.config(command=self.yview)
+        tree.bind("<Configure>", self._on_resize)
+        tree.bind("<MouseWheel>", lambda e: self._scroll(self.view.scroll(-self.WHEEL_ROWS if e.delta > 0 else self.WHEEL_ROWS)))
+        tree.bind("<Button-4>", lambda e: self._scroll(self.view.scroll(-self.WHEEL_ROWS)))
+        tree.bind("<Button-5>", lambda e: self._scroll(self.view.scroll(self.WHEEL_ROWS)))
+        tree.bind("<Prior>", lambda e: self._scroll(self.view.page(-1)))
+        tree.bind("<Next>", lambda e: self._scroll(self.view.page(1)))
+        tree.bind("<Home>", lambda e: self._scroll(self.view.scroll_to(0)))
+        tree.bind("<End>", lambda e: self._scroll(self.view.scroll_to(len(self.rows))))
     
-    @staticmethod
-    def merge_sort(arr: List, timer_cb: Optional[Callable] = None, stop_cb: Optional[Callable] = None,
-                   progress_cb: Optional[Callable] = None, reverse: bool = False) -> List:
-        """Merge Sort - O(n log n)"""
-        if len(arr) <= 1:
-            return arr.copy()
-        
-        start_time = time.time()
-        progress_counter = [0]
-        total_operations = len(arr)
-        
-        def merge(left: List, right: List) -> List:
-            result = []
-            i = j = 0
-            
-            while i < len(left) and j < len(right):
-                if (left[i] <= right[j]) if not reverse else (left[i] >= right[j]):
-                    result.append(left[i])
-                    i += 1
-                else:
-                    result.append(right[j])
-                    j += 1
-            
-            result.extend(left[i:])
-            result.extend(right[j:])
-            return result
-        
-        def merge_sort_recursive(arr: List) -> List:
-            if len(arr) <= 1:
-                return arr
-            
-            if stop_cb and stop_cb():
-                return arr
-            
-            mid = len(arr) // 2
-            left = merge_sort_recursive(arr[:mid])
-            right = merge_sort_recursive(arr[mid:])
-            
-            result = merge(left, right)
-            
-            progress_counter[0] += len(arr)
-            if progress_cb and progress_counter[0] % max(1, total_operations // 100) == 0:
-                progress_cb(min(100, (progress_counter[0] / total_operations) * 100))
-            
-            if timer_cb:
-                timer_cb(time.time() - start_time)
-            
-            return result
-        
-        return merge_sort_recursive(arr.copy())
+    def set_rows(self, rows):
+        """Show rows (any sequence of records) from the top"""
+        self.rows = rows
+        self.view.reset(len(rows))
+        self.refresh()
+    
+    def clear(self):
+        self.set_rows([])
+    
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units' | 'pages')"""
+        if args[0] == "moveto":
+            self._scroll(self.view.moveto(args[1]))
+        elif args[0] == "scroll":
+            steps = int(args[1])
+            self._scroll(self.view.page(steps) if args[2] == "pages" else self.view.scroll(steps))
+    
+    def _scroll(self, moved):
+        if moved:
+            self.refresh()
+        return "break"
+    
+    def _on_resize(self, event):
+        visible = max(1, (event.height - self.HEADING_HEIGHT) // self.row_height)
+        if visible != self.view.visible:
+            self.view.resize(visible)
+            self.refresh()
+    
+    def refresh(self):
+        """Rewrite the visible items from rows and update the scrollbar"""
+        window = self.view.window()
+        items = list(self.tree.get_children())
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+            del items[len(window):]
+        while len(items) < len(window):
+            items.append(self.tree.insert('', tk.END))
+        for item, index in zip(items, window):
+            tag = 'evenrow' if (index + 1) % 2 == 0 else 'oddrow'
+            self.tree.item(item, values=self.formatter(index, self.rows[index]), tags=(tag,))
+        self.scrollbar.set(*self.view.fractions())
+
+
+def record_values(index: int, record) -> tuple:
+    """Treeview values of one CSV record shown as row index + 1"""
+    return (index + 1, record['ID'], record['FirstName'], record['LastName'])
+
+
+def report_line(index: int, record) -> str:
+    """Report/export line of one sorted record shown as row index + 1"""
+    return f"{index + 1:5d}. ID:{record['ID']:>6} | {record['FirstName']:>10} {record['LastName']:<12}"
 
 
 class PrelimExam:
     """🏆 Prelim Lab Exam - Sorting with CSV data"""
     
-    def __init__(self, parent_frame):
+    BENCHMARK_SIZES = "1000, 10000, 100000"  # default sweep; the user can edit the list
+    MATRIX_WARN_ROWS = 5000  # quadratic sorts x 9 shapes get slow past this
+    HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'benchmark_history.sqlite')
+    PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'profiles')
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'result_cache')
+
+    def __init__(self, parent_frame, workers: Optional[int] = None):
         self.frame = parent_frame
+        self.ui = UIQueue(parent_frame.after).start()  # worker threads post UI updates here
+        self.sort_eta = ProgressEta()  # percent and time left of the running sort
+        self.workers = workers or default_workers()
         self.csv_data = []
         self.sorted_data = []
         self.csv_file_path = None
@@ -154,7 +160,17 @@ class PrelimExam:
         self.last_algorithm = ""
         self.last_rows = 0
         self.last_column = ""
-        self.is_rendering = False
+        self.last_counters = None
+        self.last_verification = None  # BackgroundVerify of the last sort
+        self.count_ops = tk.BooleanVar(value=False)
+        self.profile_memory = tk.BooleanVar(value=False)
+        self.profile_mode = tk.StringVar(value="Off")
+        self.use_cache = tk.BooleanVar(value=True)
+        self.persist_cache = tk.BooleanVar(value=False)  # also save results under CACHE_DIR
+        self.result_cache = ResultCache(directory=self.CACHE_DIR if self.persist_cache.get() else None)
+        self.load_memory = None  # StageMemory of the last load, when profiled
+        self.load_spans = None   # Spans of the last load
+        self.last_spans = None   # Spans of the last sort, extended by exports
         self.sort_order = tk.StringVar(value="Ascending")
         
         self.setup_ui()
@@ -319,6 +335,43 @@ class PrelimExam:
             anchor=tk.W
         )
         self.file_label.pack(side=tk.LEFT, padx=20, fill=tk.X, expand=True)
+        
+        # Generator settings
+        gen_frame = tk.Frame(panel, bg=DOG_COLORS['bg'])
+        gen_frame.pack(padx=15, pady=(0, 15), fill=tk.X)
+        
+        tk.Label(gen_frame, text="Sample Size:", font=("Segoe UI", 9), bg=DOG_COLORS['bg']).pack(side=tk.LEFT)
+        self.gen_size_var = tk.StringVar(value="100000")
+        tk.Entry(
+            gen_frame,
+            textvariable=self.gen_size_var,
+            font=("Segoe UI", 9),
+            width=11,
+            relief=tk.SOLID,
+            borderwidth=1
+        ).pack(side=tk.LEFT, padx=(5, 15))
+        
+        tk.Label(gen_frame, text="ID Distribution:", font=("Segoe UI", 9), bg=DOG_COLORS['bg']).pack(side=tk.LEFT)
+        self.gen_dist_var = tk.StringVar(value="uniform")
+        ttk.Combobox(
+            gen_frame,
+            textvariable=self.gen_dist_var,
+            values=list(datagen.DISTRIBUTIONS),
+            state="readonly",
+            font=("Segoe UI", 9),
+            width=13
+        ).pack(side=tk.LEFT, padx=(5, 15))
+        
+        tk.Label(gen_frame, text="Seed:", font=("Segoe UI", 9), bg=DOG_COLORS['bg']).pack(side=tk.LEFT)
+        self.gen_seed_var = tk.StringVar(value="")
+        tk.Entry(
+            gen_frame,
+            textvariable=self.gen_seed_var,
+            font=("Segoe UI", 9),
+            width=10,
+            relief=tk.SOLID,
+            borderwidth=1
+        ).pack(side=tk.LEFT, padx=5)
     
     def create_control_panel(self, parent):
         """Create control panel with professional styling"""
@@ -469,7 +522,85 @@ class PrelimExam:
             bg=DOG_COLORS['bg'],
             font=("Segoe UI", 9)
         )
-        self.display_check.pack(side=tk.LEFT)
+        self.display_check.pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.count_check = tk.Checkbutton(
+            row5,
+            text="Count operations (slower)",
+            variable=self.count_ops,
+            bg=DOG_COLORS['bg'],
+            font=("Segoe UI", 9)
+        )
+        self.count_check.pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.memory_check = tk.Checkbutton(
+            row5,
+            text="Profile memory (tracemalloc, slower)",
+            variable=self.profile_memory,
+            bg=DOG_COLORS['bg'],
+            font=("Segoe UI", 9)
+        )
+        self.memory_check.pack(side=tk.LEFT)
+        
+        row6 = tk.Frame(left_frame, bg=DOG_COLORS['bg'])
+        row6.pack(fill=tk.X, pady=5)
+        
+        tk.Label(row6, text="Profile this run:", bg=DOG_COLORS['bg'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
+        self.profile_combo = ttk.Combobox(
+            row6,
+            textvariable=self.profile_mode,
+            values=PROFILE_MODES,
+            state="readonly",
+            width=10
+        )
+        self.profile_combo.pack(side=tk.LEFT, padx=10)
+        
+        self.cache_check = tk.Checkbutton(
+            row6,
+            text="Reuse cached results (not for benchmarks)",
+            variable=self.use_cache,
+            bg=DOG_COLORS['bg'],
+            font=("Segoe UI", 9)
+        )
+        self.cache_check.pack(side=tk.LEFT, padx=(10, 0))
+        
+        self.persist_check = tk.Checkbutton(
+            row6,
+            text="Keep on disk",
+            variable=self.persist_cache,
+            command=self.apply_cache_setting,
+            bg=DOG_COLORS['bg'],
+            font=("Segoe UI", 9)
+        )
+        self.persist_check.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Benchmark sweep: custom sizes and a time budget per size
+        row7 = tk.Frame(left_frame, bg=DOG_COLORS['bg'])
+        row7.pack(fill=tk.X, pady=5)
+        
+        tk.Label(row7, text="Benchmark sizes:", bg=DOG_COLORS['bg'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
+        self.bench_sizes_var = tk.StringVar(value=self.BENCHMARK_SIZES)
+        self.bench_sizes_entry = tk.Entry(
+            row7,
+            textvariable=self.bench_sizes_var,
+            font=("Segoe UI", 9),
+            width=22,
+            relief=tk.SOLID,
+            borderwidth=1
+        )
+        self.bench_sizes_entry.pack(side=tk.LEFT, padx=10)
+        
+        tk.Label(row7, text="Budget per size (s):", bg=DOG_COLORS['bg'], font=("Segoe UI", 9)).pack(side=tk.LEFT)
+        self.bench_budget_var = tk.StringVar(value=f"{DEFAULT_BUDGET:g}")
+        self.bench_budget_entry = tk.Entry(
+            row7,
+            textvariable=self.bench_budget_var,
+            font=("Segoe UI", 9),
+            width=6,
+            relief=tk.SOLID,
+            borderwidth=1
+        )
+        self.bench_budget_entry.pack(side=tk.LEFT, padx=10)
         
         # Right side - action buttons
         right_frame = tk.Frame(inner_frame, bg=DOG_COLORS['bg'])
@@ -517,6 +648,20 @@ class PrelimExam:
             command=self.run_benchmark
         )
         self.benchmark_button.pack(pady=5)
+        
+        self.matrix_button = tk.Button(
+            right_frame,
+            text="🧪 Shape Matrix",
+            font=("Segoe UI", 11, "bold"),
+            bg=DOG_COLORS['secondary'],
+            fg="white",
+            padx=12,
+            pady=12,
+            relief=tk.FLAT,
+            cursor="hand2",
+            command=self.run_shape_matrix
+        )
+        self.matrix_button.pack(pady=5)
     
     def create_progress_panel(self, parent):
         """Create progress and timer panel"""
@@ -567,7 +712,8 @@ class PrelimExam:
             bg=DOG_COLORS['bg'],
             fg=DOG_COLORS['text'],
             font=("Segoe UI", 10),
-            width=6
+            width=20,
+            anchor='w'
         )
         self.progress_label.pack(side=tk.LEFT, padx=(10, 0))
     
@@ -592,7 +738,52 @@ class PrelimExam:
             relief=tk.FLAT,
             bg=DOG_COLORS['light']
         )
-        self.report_text.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        self.report_text.pack(padx=10, pady=(10, 0), fill=tk.BOTH, expand=True)
+        
+        # Pager for the sorted records section: only the page on screen is formatted
+        pager_bar = tk.Frame(panel, bg=DOG_COLORS['bg'])
+        pager_bar.pack(fill=tk.X, padx=10, pady=(5, 10))
+        
+        self.pager_status = tk.StringVar(value="No records")
+        self.report_pager = TextPager(self.report_text, on_change=self.pager_status.set)
+        
+        for text, command in (("◀", self.report_pager.prev_page), ("▶", self.report_pager.next_page)):
+            tk.Button(pager_bar, text=text, font=("Segoe UI", 9), bg=DOG_COLORS['light'], relief=tk.FLAT,
+                      cursor="hand2", command=command).pack(side=tk.LEFT, padx=(0, 2))
+        tk.Label(pager_bar, textvariable=self.pager_status, bg=DOG_COLORS['bg'],
+                 font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=8)
+        
+        self.find_var = tk.StringVar()
+        find_entry = tk.Entry(pager_bar, textvariable=self.find_var, width=12, font=("Segoe UI", 9))
+        tk.Button(pager_bar, text="🔍 Find", font=("Segoe UI", 9), bg=DOG_COLORS['light'], relief=tk.FLAT,
+                  cursor="hand2", command=self.find_in_report).pack(side=tk.RIGHT)
+        find_entry.pack(side=tk.RIGHT, padx=(8, 2))
+        find_entry.bind("<Return>", lambda e: self.find_in_report())
+        
+        self.jump_var = tk.StringVar()
+        jump_entry = tk.Entry(pager_bar, textvariable=self.jump_var, width=8, font=("Segoe UI", 9))
+        tk.Button(pager_bar, text="Go to #", font=("Segoe UI", 9), bg=DOG_COLORS['light'], relief=tk.FLAT,
+                  cursor="hand2", command=self.jump_in_report).pack(side=tk.RIGHT)
+        jump_entry.pack(side=tk.RIGHT, padx=2)
+        jump_entry.bind("<Return>", lambda e: self.jump_in_report())
+    
+    def jump_in_report(self):
+        """Show the report page holding record number jump_var (1-based)"""
+        try:
+            index = int(self.jump_var.get().replace(",", "")) - 1
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Enter a record number to jump to")
+            return
+        if not self.report_pager.jump_to(index):
+            messagebox.showinfo("No Records", "Run a sort first!")
+    
+    def find_in_report(self):
+        """Jump to the next sorted record containing find_var (ID or name)"""
+        needle = self.find_var.get().strip()
+        if not needle or not self.report_pager.attached:
+            return
+        if self.report_pager.find(needle) < 0:
+            messagebox.showinfo("Not Found", f"No sorted record contains '{needle}'")
     
     def create_data_tables_panel(self, parent):
         """Create data tables panel for right side - Original and Sorted"""
@@ -646,6 +837,7 @@ class PrelimExam:
         # Striped rows for original
         self.original_table.tag_configure('oddrow', background=DOG_COLORS['table_bg'])
         self.original_table.tag_configure('evenrow', background=DOG_COLORS['table_alt'])
+        self.original_view = VirtualTable(self.original_table, original_vsb, record_values)
         
         # Sorted Results (Bottom 50%)
         sorted_panel = tk.LabelFrame(
@@ -659,26 +851,6 @@ class PrelimExam:
         )
         sorted_panel.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
         
-        # Loading frame
-        self.loading_frame = tk.Frame(sorted_panel, bg=DOG_COLORS['light'])
-        
-        tk.Label(
-            self.loading_frame,
-            text="⏳ Rendering results...",
-            font=("Segoe UI", 14, "bold"),
-            bg=DOG_COLORS['light'],
-            fg=DOG_COLORS['primary']
-        ).pack(pady=20)
-        
-        self.loading_label = tk.Label(
-            self.loading_frame,
-            text="Please wait",
-            font=("Segoe UI", 11),
-            bg=DOG_COLORS['light'],
-            fg=DOG_COLORS['text']
-        )
-        self.loading_label.pack(pady=10)
-        
         # Create Treeview for sorted table display
         self.table_frame = tk.Frame(sorted_panel, bg=DOG_COLORS['table_bg'])
         self.table_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
@@ -718,6 +890,7 @@ class PrelimExam:
         # Striped rows
         self.results_table.tag_configure('oddrow', background=DOG_COLORS['table_bg'])
         self.results_table.tag_configure('evenrow', background=DOG_COLORS['table_alt'])
+        self.results_view = VirtualTable(self.results_table, vsb, record_values)
     
     def create_export_panel(self, parent):
         """Create export panel"""
@@ -752,6 +925,10 @@ class PrelimExam:
         )
         self.export_csv_button.pack(side=tk.LEFT)
     
+    def apply_cache_setting(self):
+        """Save cached results under CACHE_DIR only while "Keep on disk" is ticked"""
+        self.result_cache.directory = self.CACHE_DIR if self.persist_cache.get() else None
+    
     def update_timer_visibility(self):
         """Update timer visibility"""
         if self.show_timer.get():
@@ -775,8 +952,16 @@ class PrelimExam:
         self.timer_check.config(state=tk.DISABLED)
         self.progress_check.config(state=tk.DISABLED)
         self.display_check.config(state=tk.DISABLED)
+        self.count_check.config(state=tk.DISABLED)
+        self.memory_check.config(state=tk.DISABLED)
+        self.profile_combo.config(state=tk.DISABLED)
+        self.cache_check.config(state=tk.DISABLED)
+        self.persist_check.config(state=tk.DISABLED)
+        self.bench_sizes_entry.config(state=tk.DISABLED)
+        self.bench_budget_entry.config(state=tk.DISABLED)
         self.run_button.config(state=tk.DISABLED)
         self.benchmark_button.config(state=tk.DISABLED)
+        self.matrix_button.config(state=tk.DISABLED)
         self.load_button.config(state=tk.DISABLED)
         self.generate_button.config(state=tk.DISABLED)
         self.export_report_button.config(state=tk.DISABLED)
@@ -791,8 +976,16 @@ class PrelimExam:
         self.timer_check.config(state=tk.NORMAL)
         self.progress_check.config(state=tk.NORMAL)
         self.display_check.config(state=tk.NORMAL)
+        self.count_check.config(state=tk.NORMAL)
+        self.memory_check.config(state=tk.NORMAL)
+        self.profile_combo.config(state="readonly")
+        self.cache_check.config(state=tk.NORMAL)
+        self.persist_check.config(state=tk.NORMAL)
+        self.bench_sizes_entry.config(state=tk.NORMAL)
+        self.bench_budget_entry.config(state=tk.NORMAL)
         self.run_button.config(state=tk.NORMAL)
         self.benchmark_button.config(state=tk.NORMAL)
+        self.matrix_button.config(state=tk.NORMAL)
         self.load_button.config(state=tk.NORMAL)
         self.generate_button.config(state=tk.NORMAL)
         self.export_report_button.config(state=tk.NORMAL)
@@ -838,16 +1031,14 @@ class PrelimExam:
         try:
             start_time = time.time()
             
-            with open(csv_path, 'r') as csvfile:
-                reader = csv.DictReader(csvfile)
-                self.csv_data = list(reader)
+            self.csv_data = self.load_columns(csv_path)
             
             load_time = time.time() - start_time
             
             # Verify data structure
             if self.csv_data and all(key in self.csv_data[0] for key in ['ID', 'FirstName', 'LastName']):
                 self.report_text.insert(tk.END, f"✓ Successfully loaded {len(self.csv_data):,} records\n")
-                self.report_text.insert(tk.END, f"✓ Load time: {load_time:.4f}s\n")
+                self.report_text.insert(tk.END, f"✓ Load time: {load_time:.4f}s ({self.workers} workers)\n")
                 self.report_text.insert(tk.END, f"✓ Data verification: PASSED\n")
                 self.report_text.insert(tk.END, f"✓ Columns: ID, FirstName, LastName\n\n")
                 
@@ -867,7 +1058,17 @@ class PrelimExam:
             self.file_label.config(text="Failed to load", fg=DOG_COLORS['danger'])
     
     def generate_sample_csv(self):
-        """Generate 100,000 record CSV with shuffled IDs"""
+        """Generate a seeded sample CSV (100,000 shuffled IDs by default)"""
+        try:
+            size = int(self.gen_size_var.get())
+            distribution = self.gen_dist_var.get()
+            seed_text = self.gen_seed_var.get().strip()
+            seed = datagen.resolve_seed(int(seed_text) if seed_text else None)
+            datagen.validate(size, distribution)
+        except ValueError as e:
+            messagebox.showerror("Invalid Input", str(e))
+            return
+        
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv")],
@@ -879,33 +1080,25 @@ class PrelimExam:
         
         try:
             self.report_text.delete("1.0", tk.END)
-            self.report_text.insert("1.0", "🎲 Generating 100,000 random records...\n")
+            self.report_text.insert("1.0", f"🎲 Generating {size:,} {distribution} records (seed {seed})...\n")
             self.frame.update()
             
-            first_names = ["John", "Jane", "Michael", "Emily", "David", "Sarah", "Robert", "Lisa",
-                          "James", "Mary", "William", "Patricia", "Richard", "Jennifer", "Joseph",
-                          "Linda", "Thomas", "Barbara", "Charles", "Elizabeth"]
+            step = max(size // 10, 1)
+            next_report = [step]
             
-            last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
-                         "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
-                         "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"]
-
-            ids = list(range(1, 100001))
-            random.shuffle(ids)
+            def progress_cb(written, total):
+                if written >= next_report[0] or written == total:
+                    self.report_text.insert(tk.END, f"Generated {written:,}...\n")
+                    self.frame.update()
+                    next_report[0] = written + step
             
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['ID', 'FirstName', 'LastName'])
-                
-                for count, i in enumerate(ids, 1):
-                    writer.writerow([i, random.choice(first_names), random.choice(last_names)])
-                    
-                    if count % 10000 == 0:
-                        self.report_text.insert(tk.END, f"Generated {count:,}...\n")
-                        self.frame.update()
+            start_time = time.perf_counter()
+            datagen.write_people_csv(file_path, size, distribution, seed, progress_cb)
+            gen_time = time.perf_counter() - start_time
             
-            self.report_text.insert(tk.END, "\n✓ Successfully generated 100,000 random records!\n")
+            self.report_text.insert(tk.END, f"\n✓ Successfully generated {size:,} records in {gen_time:.2f}s!\n")
             self.report_text.insert(tk.END, f"File: {file_path}\n")
+            self.report_text.insert(tk.END, f"Seed: {seed} (enter it again to reproduce this file)\n")
             
             self.csv_file_path = file_path
             self.load_csv_data()
@@ -915,6 +1108,17 @@ class PrelimExam:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate CSV: {e}")
     
+    def load_columns(self, path):
+        """load_csv_columns, traced by tracemalloc when memory profiling is on"""
+        self.load_spans = Spans()
+        # reading and parsing happen together inside the parse workers
+        with self.load_spans.span("Load + parse CSV"):
+            if not self.profile_memory.get():
+                self.load_memory = None
+                return load_csv_columns(path, self.workers)
+            data, self.load_memory = profile_call("Load CSV", load_csv_columns, path, self.workers)
+        return data
+    
     def load_csv(self):
         """Load CSV file"""
         file_path = filedialog.askopenfilename(
@@ -929,10 +1133,8 @@ class PrelimExam:
         """Load data from CSV"""
         try:
             # Clear previous results
-            for item in self.results_table.get_children():
-                self.results_table.delete(item)
-            for item in self.original_table.get_children():
-                self.original_table.delete(item)
+            self.results_view.clear()
+            self.original_view.clear()
             self.sorted_data = []
             
             self.report_text.delete("1.0", tk.END)
@@ -941,16 +1143,14 @@ class PrelimExam:
             
             start_time = time.time()
             
-            with open(self.csv_file_path, 'r') as csvfile:
-                reader = csv.DictReader(csvfile)
-                self.csv_data = list(reader)
+            self.csv_data = self.load_columns(self.csv_file_path)
             
             load_time = time.time() - start_time
             
             # Verify data
             if self.csv_data and all(key in self.csv_data[0] for key in ['ID', 'FirstName', 'LastName']):
                 self.report_text.insert(tk.END, f"\n✓ Loaded {len(self.csv_data):,} records\n")
-                self.report_text.insert(tk.END, f"✓ Load time: {load_time:.4f}s\n")
+                self.report_text.insert(tk.END, f"✓ Load time: {load_time:.4f}s ({self.workers} workers)\n")
                 self.report_text.insert(tk.END, f"✓ Data verification: PASSED\n")
                 
                 # Show first 10 records in original table (as they appear in file - unsorted)
@@ -969,68 +1169,42 @@ class PrelimExam:
             self.file_label.config(text="Failed to load", fg=DOG_COLORS['danger'])
     
     def update_timer(self, elapsed):
-        if self.show_timer.get():
-            self.timer_label.config(text=f"{elapsed:.4f}s")
-            self.frame.update_idletasks()
+        """Timer callback for worker threads; only the newest value per UI tick is drawn"""
+        self.ui.latest("timer", self.timer_label.config, text=f"{elapsed:.4f}s")
     
-    def update_progress(self, percent):
-        if self.show_progress.get():
-            self.progress_bar['value'] = percent
-            self.progress_label.config(text=f"{int(percent)}%")
-            self.frame.update_idletasks()
+    def update_progress(self, current, total):
+        """Progress callback for worker threads; only the newest value per UI tick is drawn
+        
+        current/total are the sort's work units (labkit.progress), so the
+        percent and time remaining track the comparisons actually left.
+        """
+        eta = self.sort_eta.update(current, total)
+        self.ui.latest("progress", self._draw_progress, eta.fraction * 100, eta.describe())
     
-    def populate_table(self, data):
-        """Populate the results table with loading animation"""
-        self.is_rendering = True
-        self.loading_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-        self.table_frame.pack_forget()
-        
-        def render_thread():
-            try:
-                # Clear existing data
-                for item in self.results_table.get_children():
-                    self.results_table.delete(item)
-                
-                total = len(data)
-                batch_size = 100
-                
-                # Insert new data in batches
-                for i, record in enumerate(data, 1):
-                    tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-                    self.results_table.insert('', tk.END, values=(
-                        i,
-                        record['ID'],
-                        record['FirstName'],
-                        record['LastName']
-                    ), tags=(tag,))
-                    
-                    if i % batch_size == 0 or i == total:
-                        percent = (i / total) * 100
-                        self.loading_label.config(text=f"Rendering: {i:,} / {total:,} ({percent:.0f}%)")
-                        self.frame.update_idletasks()
-                
-                self.loading_frame.pack_forget()
-                self.table_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-            finally:
-                self.is_rendering = False
-        
-        threading.Thread(target=render_thread, daemon=True).start()
+    def set_progress(self, percent):
+        self.ui.latest("progress", self._draw_progress, percent)
+    
+    def _draw_progress(self, percent, text=None):
+        self.progress_bar['value'] = percent
+        self.progress_label.config(text=text or f"{int(percent)}%")
+    
+    def populate_table(self, data, on_complete: Optional[Callable[[float], None]] = None):
+        """Show data in the results table; on_complete gets the render seconds.
+        
+        Only the visible rows become Treeview items (see VirtualTable), so
+        this is instant for any number of records.
+        """
+        def render():
+            start = time.perf_counter()
+            self.results_view.set_rows(data)
+            if on_complete:
+                on_complete(time.perf_counter() - start)
+        
+        self.ui.post(render)
     
     def populate_original_table(self, data):
         """Populate the original dataset table"""
-        # Clear existing data
-        for item in self.original_table.get_children():
-            self.original_table.delete(item)
-        
-        # Insert new data
-        for i, record in enumerate(data, 1):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.original_table.insert('', tk.END, values=(
-                i,
-                record['ID'],
-                record['FirstName'],
-                record['LastName']
-            ), tags=(tag,))
+        self.original_view.set_rows(data)
     
     def run_sort(self):
         """Run sorting on CSV data"""
@@ -1066,118 +1240,221 @@ class PrelimExam:
             self.timer_label.config(text="0.0000s")
             self.progress_bar['value'] = 0
             self.progress_label.config(text="0%")
+            self.sort_eta.reset()
             self.stop_button.config(state=tk.NORMAL)
             
             self.report_text.delete("1.0", tk.END)
             self.report_text.insert("1.0", f"⚙ Processing {n_rows:,} rows with {algorithm} ({sort_order})...\n\n")
             self.frame.update()
             
-            # Show original data in the original table
+            # Show original data in the original table (a view of the loaded columns, no rows copied)
             data_subset = self.csv_data[:n_rows]
             data_to_show_original = data_subset[:10] if self.show_first_10.get() else data_subset
             self.populate_original_table(data_to_show_original)
             
+            # Tk variables are read here; the worker only posts events to self.ui
+            profile_mode = self.profile_mode.get()
+            profile_memory = self.profile_memory.get()
+            count_ops = self.count_ops.get()
+            use_cache = self.use_cache.get()
+            first_10 = self.show_first_10.get()
+            timer_cb = self.update_timer if self.show_timer.get() else None
+            progress_cb = self.update_progress if self.show_progress.get() else None
+            
             def sort_thread():
+                profiler = make_profiler(profile_mode, self.PROFILE_DIR, f"run_sort-{algorithm.split()[0].lower()}")
                 try:
-                    data_subset = self.csv_data[:n_rows]
-                    
-                    # Extract keys
-                    if column == "ID":
-                        keys = [int(row['ID']) for row in data_subset]
-                    else:
-                        keys = [row[column] for row in data_subset]
-                    
-                    # Sort
-                    start_time = time.time()
+                    if profiler:
+                        profiler.start()
+                    memory = MemoryProfile() if profile_memory else None
+                    spans = Spans()
+                    spans.prepend(self.load_spans)
                     
-                    algo_map = {
-                        "Bubble Sort": SortingAlgorithms.bubble_sort,
-                        "Insertion Sort": SortingAlgorithms.insertion_sort,
-                        "Merge Sort": SortingAlgorithms.merge_sort
-                    }
+                    @contextmanager
+                    def stage(name):
+                        with spans.span(name), (memory.stage(name) if memory else nullcontext()):
+                            yield
                     
-                    sort_func = algo_map[algorithm]
-                    sorted_keys = sort_func(
-                        keys,
-                        self.update_timer if self.show_timer.get() else None,
-                        lambda: not self.is_sorting,
-                        self.update_progress if self.show_progress.get() else None,
-                        reverse
-                    )
+                    # Extract keys straight from the column: IDs packed into an int64 array
+                    # (copied as-is into the sort process), names as the loaded strings
+                    with stage("Key extraction"):
+                        if column == "ID":
+                            keys = self.csv_data.int_column("ID", n_rows)
+                        else:
+                            keys = self.csv_data.column(column, n_rows)
                     
-                    sort_time = time.time() - start_time
-                    
-                    # Show completion notification immediately after sort completes
-                    messagebox.showinfo("Complete! 🐕", f"Sorted {n_rows:,} records in {sort_time:.4f}s")
+                    # Sort (perf_counter with the GC paused; key extraction is not timed)
+                    counters = OpCounters() if count_ops else None
+                    # profiles and counts need a real run; otherwise the same keys, column,
+                    # algorithm and order give the result sorted before
+                    cache_key = cached = None
+                    if use_cache and not profiler and memory is None and counters is None:
+                        with stage("Cache lookup"):
+                            cache_key = self.result_cache.key(keys, column, algorithm, reverse)
+                            cached = self.result_cache.get(cache_key)
+                    if cached is not None:
+                        sorted_keys, sort_time = cached.values, cached.seconds
+                    elif profiler or memory:
+                        # profiles need the algorithm in this process; the progress
+                        # total is counted before timed() starts the clock
+                        total = None
+                        if progress_cb:
+                            with stage("Progress count"):
+                                total = work_total(algorithm, keys, reverse)
+                        with stage("Sort"):
+                            sorted_keys, sort_time = timed(
+                                ALGORITHMS[algorithm],
+                                keys,
+                                timer_cb,
+                                lambda: not self.is_sorting,
+                                progress_cb,
+                                reverse,
+                                counters=counters,
+                                work_total=total
+                            )
+                    else:
+                        # a child process keeps the window responsive and Stop kills it at once;
+                        # its wall time is split into the timed sort (the Execution Time) and the
+                        # spawn, data transfer and progress count around it
+                        child_start = time.perf_counter()
+                        sorted_keys, sort_time = run_isolated(
+                            algorithm,
+                            keys,
+                            timer_cb,
+                            lambda: not self.is_sorting,
+                            progress_cb,
+                            reverse,
+                            counters=counters,
+                            as_array=True
+                        )
+                        spans.add("Sort", sort_time)
+                        spans.add(PROCESS_SPAN, max(0.0, time.perf_counter() - child_start - sort_time))
+                        if cache_key and self.is_sorting:
+                            self.result_cache.put(cache_key, sorted_keys, sort_time)
                     
                     # Create sorted data
-                    key_to_rows = {}
-                    for i, row in enumerate(data_subset):
-                        key = keys[i]
-                        if key not in key_to_rows:
-                            key_to_rows[key] = []
-                        key_to_rows[key].append(row)
+                    with stage("Row reconstruction"):
+                        # rows with the same key, chained in input order: first_row[key] is the
+                        # next unused one and next_row[i] the one after row i (-1 at the end)
+                        first_row = {}
+                        next_row = array('q', [-1]) * len(keys)
+                        for i in range(len(keys) - 1, -1, -1):
+                            key = keys[i]
+                            next_row[i] = first_row.get(key, -1)
+                            first_row[key] = i
+                        
+                        # original row index of each sorted row (equal keys keep their order)
+                        order = array('q')
+                        for key in sorted_keys:
+                            i = first_row.get(key, -1)
+                            if i >= 0:
+                                order.append(i)
+                                first_row[key] = next_row[i]
+                        # the sorted table is a view through order, not a copy of the rows
+                        sorted_data = self.csv_data.take(order)
                     
-                    self.sorted_data = []
-                    for key in sorted_keys:
-                        if key in key_to_rows and key_to_rows[key]:
-                            self.sorted_data.append(key_to_rows[key].pop(0))
+                    # Order, permutation and stability checks run after timing, off this thread
+                    verification = verify_in_background(lambda: verify_records(keys, order, reverse), self.ui.post)
                     
-                    # Store for export
-                    self.last_sort_time = sort_time
-                    self.last_algorithm = algorithm
-                    self.last_rows = n_rows
-                    self.last_column = column
+                    if profiler:
+                        profiler.stop()
                     
-                    # Update report with sorted data
-                    self.report_text.delete("1.0", tk.END)
-                    self.report_text.insert("1.0", "="*60 + "\n")
-                    self.report_text.insert(tk.END, "               SORTING REPORT\n")
-                    self.report_text.insert(tk.END, "="*60 + "\n\n")
-                    self.report_text.insert(tk.END, f"Algorithm:        {algorithm}\n")
-                    self.report_text.insert(tk.END, f"Records Sorted:   {n_rows:,}\n")
-                    self.report_text.insert(tk.END, f"Sort Column:      {column}\n")
-                    self.report_text.insert(tk.END, f"Sort Order:       {sort_order}\n")
-                    self.report_text.insert(tk.END, f"Execution Time:   {sort_time:.4f}s ({sort_time*1000:.2f}ms)\n")
-                    self.report_text.insert(tk.END, f"Status:           ✓ Completed\n\n")
-                    self.report_text.insert(tk.END, "="*60 + "\n")
-                    
-                    # Add sorted data to report
-                    data_to_show_report = self.sorted_data[:10] if self.show_first_10.get() else self.sorted_data
-                    header = f"FIRST 10 SORTED RECORDS" if self.show_first_10.get() else f"ALL {len(self.sorted_data):,} SORTED RECORDS"
-                    self.report_text.insert(tk.END, f"{header}\n")
-                    self.report_text.insert(tk.END, "="*60 + "\n\n")
-                    
-                    for i, record in enumerate(data_to_show_report, 1):
-                        self.report_text.insert(tk.END, 
-                            f"{i:5d}. ID:{record['ID']:>6} | "
-                            f"{record['FirstName']:>10} {record['LastName']:<12}\n")
+                    # Report summary, built here and written by the UI thread in one event
+                    lines = ["="*60, "               SORTING REPORT", "="*60, "",
+                             f"Algorithm:        {algorithm}",
+                             f"Records Sorted:   {n_rows:,}",
+                             f"Sort Column:      {column}",
+                             f"Sort Order:       {sort_order}",
+                             f"Execution Time:   {sort_time:.4f}s ({sort_time*1000:.2f}ms)"]
+                    if cached is not None:
+                        lines.append("                  (cached result; time measured when it was first sorted)")
+                    if counters is not None:
+                        lines.append("                  (timed with operation counting on)")
+                        lines.append(self.format_counters(counters).rstrip("\n"))
+                    lines.append("Status:           ✓ Completed")
+                    lines.append(f"Verification:     {PENDING}")
+                    lines.append("")
+                    if memory:
+                        memory.add(self.load_memory)
+                        lines.append("MEMORY PROFILE (tracemalloc, this process only; times include tracing)")
+                        lines.extend(memory.report_lines())
+                        lines.append(f"Highest stage peak: {format_bytes(memory.peak_bytes)}")
+                        lines.append("")
+                    if profiler:
+                        lines.append(f"PROFILE ({profiler.mode}, top {profiler.top} by self time)")
+                        lines.extend(profiler.summary)
+                        lines.append(f"Saved: {os.path.abspath(profiler.path)}")
+                        lines.append("")
+                    lines.append("="*60)
+                    shown = sorted_data[:10] if first_10 else sorted_data
+                    lines.append("FIRST 10 SORTED RECORDS" if first_10 else f"ALL {len(sorted_data):,} SORTED RECORDS")
+                    lines.append("="*60)
+                    lines.append("")
                     
-                    self.report_text.insert(tk.END, "\n" + "="*60 + "\n")
-                    self.report_text.insert(tk.END, "🐾 Complete! Good dog! 🐾\n")
-                    self.report_text.insert(tk.END, "="*60 + "\n")
+                    def show_results():
+                        # Store for export
+                        self.sorted_data = sorted_data
+                        self.last_sort_time = sort_time
+                        self.last_algorithm = algorithm
+                        self.last_rows = n_rows
+                        self.last_column = column
+                        self.last_counters = counters
+                        self.last_verification = verification
+                        
+                        report_start = time.perf_counter()
+                        self.report_text.delete("1.0", tk.END)
+                        self.report_text.insert("1.0", "\n".join(lines) + "\n")
+                        verification.when_done(lambda outcome: fill_placeholder(self.report_text, "Verification:     ", outcome))
+                        # Sorted records, one page at a time (◀ ▶, Go to #, Find)
+                        self.report_pager.attach(PagedLines(shown, report_line))
+                        self.report_text.insert(tk.END, "\n" + "="*60 + "\n🐾 Complete! Good dog! 🐾\n" + "="*60 + "\n")
+                        spans.add("Report text", time.perf_counter() - report_start)
+                        
+                        def on_rendered(seconds):
+                            spans.add("Render table", seconds)
+                            self.last_spans = spans
+                            self.report_text.insert(tk.END, "\nLATENCY BREAKDOWN (dialogs excluded)\n")
+                            for line in spans.breakdown_lines():
+                                self.report_text.insert(tk.END, line + "\n")
+                            if spans.seconds(PROCESS_SPAN):
+                                self.report_text.insert(tk.END, f"({PROCESS_SPAN}: starting the sort process, copying the data in and out "
+                                                                "and the progress count; not part of the Execution Time)\n")
+                        
+                        self.populate_table(shown, on_rendered)
+                        self.timer_label.config(text=f"{sort_time:.4f}s")
+                        self.progress_bar['value'] = 100
+                        self.progress_label.config(text="100%")
+                        
+                        # the dialog blocks, so it is queued behind the table render
+                        if cached is not None:
+                            self.ui.post(messagebox.showinfo, "Complete! 🐕", f"Reused the cached sort of {n_rows:,} records (first sorted in {sort_time:.4f}s)")
+                        else:
+                            self.ui.post(messagebox.showinfo, "Complete! 🐕", f"Sorted {n_rows:,} records in {sort_time:.4f}s")
                     
-                    # Update table
-                    data_to_show_table = self.sorted_data[:10] if self.show_first_10.get() else self.sorted_data
-                    self.populate_table(data_to_show_table)
-                    
-                    # Update timer and progress
-                    self.timer_label.config(text=f"{sort_time:.4f}s")
-                    self.progress_bar['value'] = 100
-                    self.progress_label.config(text="100%")
+                    self.ui.post(show_results)
                 
                 except Exception as e:
-                    messagebox.showerror("Error! 😿", str(e))
+                    self.ui.post(messagebox.showerror, "Error! 😿", str(e))
                 finally:
+                    if profiler:
+                        profiler.stop(save=False)
                     self.is_sorting = False
-                    self.stop_button.config(state=tk.DISABLED)
-                    self.enable_controls()
+                    self.ui.post(self.finish_run)
             
             threading.Thread(target=sort_thread, daemon=True).start()
         
         except ValueError as e:
             messagebox.showerror("Invalid Input", str(e))
     
+    def post_report(self, text):
+        """Append text to the report from any thread"""
+        self.ui.post(self.report_text.insert, tk.END, text)
+    
+    def finish_run(self):
+        """Re-enable the controls once a background run is over"""
+        self.stop_button.config(state=tk.DISABLED)
+        self.enable_controls()
+    
     def stop_sort(self):
         """Stop the current sorting operation"""
         if self.is_sorting:
@@ -1188,7 +1465,7 @@ class PrelimExam:
             messagebox.showinfo("Stopped", "Sorting operation has been stopped!")
     
     def run_benchmark(self):
-        """Run comprehensive benchmark"""
+        """Run the benchmark size sweep, several sizes at once, each within a time budget"""
         if not self.csv_data:
             messagebox.showwarning("No Data", "Please load CSV data first!")
             return
@@ -1197,17 +1474,24 @@ class PrelimExam:
             messagebox.showwarning("Busy", "Already processing!")
             return
         
+        try:
+            sizes = parse_sizes(self.bench_sizes_var.get())
+            budget = float(self.bench_budget_var.get())
+            if budget <= 0:
+                raise ValueError("The budget must be a positive number of seconds")
+        except ValueError as e:
+            messagebox.showerror("Invalid Benchmark", str(e))
+            return
+        
+        too_big = [size for size in sizes if size > len(self.csv_data)]
+        sizes = [size for size in sizes if size <= len(self.csv_data)]
+        if not sizes:
+            messagebox.showwarning("No Sizes", f"Every size is larger than the {len(self.csv_data):,} loaded records!")
+            return
+        
         algorithm = self.algorithm_var.get()
+        workers = sizesweep.default_workers(len(sizes))
         
-        # Safety Check
-        if algorithm in ["Bubble Sort", "Insertion Sort"]:
-            response = messagebox.askyesno(
-                "Performance Warning",
-                f"Benchmarking 100,000 records with {algorithm} could take hours.\n\nContinue?"
-            )
-            if not response:
-                return
-
         self.is_sorting = True
         self.disable_controls()
         self.stop_button.config(state=tk.NORMAL)
@@ -1216,107 +1500,257 @@ class PrelimExam:
         self.progress_label.config(text="0%")
         
         self.report_text.delete("1.0", tk.END)
-        self.report_text.insert("1.0", f"📊 Running benchmark for {algorithm}...\n\n")
-        self.frame.update()
+        self.report_text.insert("1.0", f"📊 Running benchmark for {algorithm}: {len(sizes)} sizes, "
+                                       f"{workers} at a time, {budget:g}s budget each...\n\n")
+        if too_big:
+            self.report_text.insert(tk.END, f"Skipped (more than the loaded records): {', '.join(f'{n:,}' for n in too_big)}\n\n")
+        
+        show_progress = self.show_progress.get()
+        show_timer = self.show_timer.get()
+        count_ops = self.count_ops.get()
         
         def benchmark_thread():
             try:
-                sizes = [1000, 10000, 100000]
-                results = {}
+                benchmark_start_time = time.perf_counter()
+                keys = self.csv_data.int_column("ID", max(sizes))
                 
-                algo_map = {
-                    "Bubble Sort": SortingAlgorithms.bubble_sort,
-                    "Insertion Sort": SortingAlgorithms.insertion_sort,
-                    "Merge Sort": SortingAlgorithms.merge_sort
-                }
-                sort_func = algo_map[algorithm]
+                # Quick probe on small prefixes predicts which sizes cannot fit the budget;
+                # it runs in child processes too, so Stop ends it at once
+                predicted = {}
+                try:
+                    probed = probe(algorithm, keys[:PROBE_ROWS], sizes,
+                                   stop_cb=lambda: not self.is_sorting)
+                    if probed is None:
+                        return
+                    fit, predicted = probed
+                    self.post_report(f"📏 Probe fit n^{fit.exponent:.2f} (closest {fit.best}); predicted: "
+                                     + ", ".join(f"{n:,}: ~{format_duration(t)}" for n, t in predicted.items()) + "\n")
+                except ValueError:
+                    pass
+                over = [n for n in sizes if predicted.get(n, 0) > budget]
+                if over:
+                    self.post_report(f"⏭ Over budget, not started: {', '.join(f'{n:,}' for n in over)}\n")
+                self.post_report("\n")
                 
-                # Track overall benchmark
-                benchmark_start_time = time.time()
-                total_records = sum(sizes[:len([s for s in sizes if s <= len(self.csv_data)])])
-                records_processed = 0
-
-                for idx, size in enumerate(sizes):
-                    if not self.is_sorting:
-                        break
-                    
-                    if size > len(self.csv_data):
-                        continue
-                    
-                    self.report_text.insert(tk.END, f"Testing {size:,} rows...\n")
-                    self.frame.update()
-                    
-                    data_subset = self.csv_data[:size]
-                    keys = [int(row['ID']) for row in data_subset]
-                    
-                    # Individual test with progress tracking
-                    start_time = time.time()
-                    
-                    # Create a progress callback that updates based on total records
-                    def progress_callback(percent):
-                        if self.show_progress.get():
-                            # Calculate overall progress based on records processed
-                            base_progress = (records_processed / total_records) * 100
-                            current_test_contribution = (size / total_records) * 100
-                            overall_progress = base_progress + (percent / 100) * current_test_contribution
-                            self.progress_bar['value'] = overall_progress
-                            self.progress_label.config(text=f"{int(overall_progress)}%")
-                            self.frame.update_idletasks()
-                    
-                    sort_func(keys, None, lambda: not self.is_sorting, progress_callback if self.show_progress.get() else None)
-                    exec_time = time.time() - start_time
-                    
-                    results[size] = exec_time
-                    records_processed += size
-                    
-                    # Update timer to show total elapsed time
-                    total_elapsed = time.time() - benchmark_start_time
-                    if self.show_timer.get():
-                        self.timer_label.config(text=f"{total_elapsed:.4f}s")
-                    
-                    self.report_text.insert(tk.END, f"  ✓ Completed in {exec_time:.4f}s\n")
-                    self.frame.update()
+                def on_point(point):
+                    self.post_report(f"  ✓ {point.size:,} rows in {point.seconds:.4f}s\n")
+                    if show_timer:
+                        self.update_timer(time.perf_counter() - benchmark_start_time)
+                
+                points = budgeted_sweep(
+                    algorithm, keys, sizes, budget,
+                    count_ops=count_ops,
+                    workers=workers,
+                    predicted=predicted,
+                    progress_cb=(lambda fraction: self.set_progress(fraction * 100)) if show_progress else None,
+                    done_cb=on_point,
+                    stop_cb=lambda: not self.is_sorting
+                )
+                if points is None:
+                    return
+                
+                results = {size: p.seconds for size, p in points.items() if not p.timed_out}
+                counts = {size: p.counters for size, p in points.items() if p.counters is not None}
                 
                 # Calculate total elapsed time
-                total_elapsed = time.time() - benchmark_start_time
+                total_elapsed = time.perf_counter() - benchmark_start_time
+                
+                # Results, written by the UI thread in one event
+                report = "="*60 + "\n"
+                report += f"           BENCHMARK: {algorithm.upper()}\n"
+                report += "="*60 + "\n\n"
+                report += f"{'Size':<15} {'Time (sec)':<20} {'Time (ms)':<20}\n"
+                report += "-"*60 + "\n"
                 
-                # Show completion notification immediately
-                if self.is_sorting:
-                    messagebox.showinfo("Complete! 🐕", f"{algorithm} benchmark completed in {total_elapsed:.4f}s!")
+                for size, point in points.items():
+                    if point.timed_out:
+                        report += f"{size:<15,} {point.describe()}\n"
+                    else:
+                        report += f"{size:<15,} {point.seconds:<20.4f} {point.seconds * 1000:<20.2f}\n"
+                if any(p.timed_out for p in points.values()):
+                    report += f"\n(budget {budget:g}s per size; extrapolated from the sizes that finished, or the probe)\n"
                 
-                # Display Results
-                self.report_text.delete("1.0", tk.END)
-                self.report_text.insert("1.0", "="*60 + "\n")
-                self.report_text.insert(tk.END, f"           BENCHMARK: {algorithm.upper()}\n")
-                self.report_text.insert(tk.END, "="*60 + "\n\n")
-                self.report_text.insert(tk.END, f"{'Size':<15} {'Time (sec)':<20} {'Time (ms)':<20}\n")
-                self.report_text.insert(tk.END, "-"*60 + "\n")
+                if counts:
+                    report += "\nOPERATION COUNTS (timings above include counting)\n"
+                    report += f"{'Size':<10} {'Comparisons':>15} {'Swaps':>13} {'Moves':>15} {'Allocs':>9} {'Peak aux':>12}\n"
+                    report += "-"*78 + "\n"
+                    for size, c in counts.items():
+                        report += (f"{size:<10,} {c.comparisons:>15,} {c.swaps:>13,} {c.moves:>15,} "
+                                   f"{c.allocations:>9,} {c.peak_aux_bytes / 1024:>9.1f} KB\n")
                 
-                for size in sizes:
-                    if size in results:
-                        time_sec = results[size]
-                        time_ms = time_sec * 1000
-                        self.report_text.insert(tk.END, f"{size:<15,} {time_sec:<20.4f} {time_ms:<20.2f}\n")
+                if len(results) >= 2:
+                    fit = ComplexityFit(sorted(results.items()))
+                    report += f"\nFitted growth: {fit.describe()}\n"
+                    report += f"Extrapolated {len(self.csv_data):,} rows: ~{format_duration(fit.predict(len(self.csv_data)))}\n"
                 
-                self.report_text.insert(tk.END, "\n" + "="*60 + "\n")
-                self.report_text.insert(tk.END, f"\nTotal benchmark time: {total_elapsed:.4f}s\n")
-                self.report_text.insert(tk.END, "🐾 Benchmark complete! 🐾\n")
+                if results:
+                    report += self.save_benchmark_history(algorithm, results)
                 
-                self.progress_bar['value'] = 100
-                self.progress_label.config(text="100%")
+                report += "\n" + "="*60 + "\n"
+                report += f"\nTotal benchmark time: {total_elapsed:.4f}s ({workers} sizes at a time)\n"
+                report += "🐾 Benchmark complete! 🐾\n"
                 
-                if self.show_timer.get():
-                    self.timer_label.config(text=f"{total_elapsed:.4f}s")
+                def show_results():
+                    self.report_text.delete("1.0", tk.END)
+                    self.report_text.insert("1.0", report)
+                    self._draw_progress(100)
+                    if show_timer:
+                        self.timer_label.config(text=f"{total_elapsed:.4f}s")
+                    # the dialog blocks, so it comes after the results are on screen
+                    self.ui.post(messagebox.showinfo, "Complete! 🐕", f"{algorithm} benchmark completed in {total_elapsed:.4f}s!")
+                
+                self.ui.post(show_results)
                     
             except Exception as e:
-                messagebox.showerror("Error", str(e))
+                self.ui.post(messagebox.showerror, "Error", str(e))
             finally:
                 self.is_sorting = False
-                self.stop_button.config(state=tk.DISABLED)
-                self.enable_controls()
+                self.ui.post(self.finish_run)
         
         threading.Thread(target=benchmark_thread, daemon=True).start()
     
+    def run_shape_matrix(self):
+        """Run every algorithm against the adversarial input shapes (not the CSV)"""
+        if self.is_sorting:
+            messagebox.showwarning("Busy", "Already processing!")
+            return
+        
+        try:
+            n_rows = int(self.rows_var.get())
+            datagen.validate(n_rows, "uniform")
+        except ValueError as e:
+            messagebox.showerror("Invalid Input", str(e))
+            return
+        
+        if n_rows > self.MATRIX_WARN_ROWS:
+            response = messagebox.askyesno(
+                "Performance Warning",
+                f"The shape matrix sorts {n_rows:,} values {len(datagen.ADVERSARIAL_SUITE)} times with each "
+                f"algorithm, including Bubble and Insertion Sort.\n\nContinue?"
+            )
+            if not response:
+                return
+        
+        order = self.sort_order.get()
+        self.is_sorting = True
+        self.disable_controls()
+        self.stop_button.config(state=tk.NORMAL)
+        self.progress_bar['value'] = 0
+        self.progress_label.config(text="0%")
+        
+        self.report_text.delete("1.0", tk.END)
+        self.report_text.insert("1.0", f"🧪 Running {len(ALGORITHMS)} algorithms x "
+                                       f"{len(datagen.ADVERSARIAL_SUITE)} input shapes at {n_rows:,} values ({order})...\n\n")
+        self.frame.update()
+        
+        def matrix_thread():
+            total = len(ALGORITHMS) * len(datagen.ADVERSARIAL_SUITE)
+            done = [0]
+            
+            def log(line):
+                done[0] += 1
+                self.post_report(f"  ✓ {line}\n")
+                self.set_progress(done[0] / total * 100)
+            
+            try:
+                start = time.perf_counter()
+                results = run_benchmarks(list(ALGORITHMS), [n_rows], datagen.ADVERSARIAL_SUITE,
+                                         repeat=1, warmup=0, reverse=(order == "Descending"),
+                                         log=log, stop_cb=lambda: not self.is_sorting)
+                elapsed = time.perf_counter() - start
+                stopped = not self.is_sorting
+                
+                def show():
+                    self.report_text.delete("1.0", tk.END)
+                    self.report_text.insert("1.0", "="*60 + "\n")
+                    self.report_text.insert(tk.END, "           SHAPE MATRIX: BEST / WORST CASES\n")
+                    self.report_text.insert(tk.END, "="*60 + "\n\n")
+                    self.report_text.insert(tk.END, "\n".join(shape_matrix_lines(results)) + "\n")
+                    if stopped:
+                        self.report_text.insert(tk.END, "⏹ Stopped early - the matrix is incomplete.\n")
+                    self.report_text.insert(tk.END, f"Total matrix time: {elapsed:.4f}s\n")
+                    self.report_text.insert(tk.END, "🐾 Shape matrix complete! 🐾\n")
+                self.ui.post(show)
+            except Exception as e:
+                self.ui.post(messagebox.showerror, "Error", str(e))
+            finally:
+                self.is_sorting = False
+                self.ui.post(self.finish_run)
+        
+        threading.Thread(target=matrix_thread, daemon=True).start()
+    
+    def save_benchmark_history(self, algorithm: str, results: dict) -> str:
+        """Save a finished benchmark to the SQLite history and compare it like-for-like.
+
+        The reference is the saved baseline when there is one, else the last
+        exam run of the same algorithm on the same data; either must come
+        from this machine and Python. The distribution names the data (a hash of the loaded ID
+        column), so cells only match runs over the same dataset.
+        """
+        data_id = "csv:" + fingerprint(self.csv_data.int_column("ID", len(self.csv_data)))[:10]
+        rows = [{"algorithm": algorithm, "size": size, "distribution": data_id, "repeats": 1,
+                 "min_s": t, "median_s": t, "mean_s": t, "max_s": t} for size, t in results.items()]
+        try:
+            with HistoryStore(self.HISTORY_PATH) as store:
+                machine = machine_fingerprint()
+                reference, what = store.baseline(), "baseline"
+                if reference is None:
+                    reference, what = next((row["id"] for row in store.runs()
+                                            if row["source"] == "exam" and row["label"] == algorithm
+                                            and row["fingerprint"] == machine
+                                            and any(r["distribution"] == data_id
+                                                    for r in store.results(row["id"]))), None), "previous run"
+                run_id = store.save_run(rows, label=algorithm, source="exam")
+                lines = f"\n💾 Saved to benchmark history as run #{run_id}\n"
+                if reference is None:
+                    return lines
+                if store.run(reference)["fingerprint"] != machine:
+                    return lines + f"   Not compared: {what} #{reference} was measured on another machine/Python\n"
+                comparisons = store.compare(reference, run_id)
+                if not comparisons:
+                    return lines + f"   Not compared: {what} #{reference} has no results for this data and these sizes\n"
+                for comparison in comparisons:
+                    lines += f"   vs {what} #{reference}: {comparison.describe()}\n"
+                return lines
+        except Exception as e:
+            return f"\n⚠ Could not save benchmark history: {e}\n"
+    
+    @staticmethod
+    def format_counters(counters: OpCounters) -> str:
+        """Report lines for the operation counts of one run"""
+        return (
+            f"Comparisons:      {counters.comparisons:,}\n"
+            f"Swaps:            {counters.swaps:,}\n"
+            f"Element Moves:    {counters.moves:,}\n"
+            f"Allocations:      {counters.allocations:,}\n"
+            f"Peak Aux Memory:  {counters.peak_aux:,} slots (~{counters.peak_aux_bytes / 1024:.1f} KB)\n"
+        )
+    
+    def _export_in_background(self, path, job, what):
+        """Run an export job off the Tk thread and report when it is done"""
+        self.export_report_button.config(state=tk.DISABLED)
+        self.export_csv_button.config(state=tk.DISABLED)
+        self.report_text.insert(tk.END, f"\n💾 Exporting {what} to {os.path.basename(path)}...\n")
+        
+        def finish():
+            if not self.is_sorting:
+                self.export_report_button.config(state=tk.NORMAL)
+                self.export_csv_button.config(state=tk.NORMAL)
+        
+        def on_done(written, elapsed):
+            finish()
+            self.report_text.insert(tk.END, f"✓ Exported {what} ({written:,} bytes) in {elapsed:.3f}s\n")
+            if self.last_spans is not None:
+                self.last_spans.add(f"Export {os.path.splitext(path)[1] or 'file'}", elapsed)
+                self.report_text.insert(tk.END, f"⏱ End-to-end including exports: {self.last_spans.total * 1000:.2f} ms\n")
+            messagebox.showinfo("Saved", f"Exported {what} successfully!")
+        
+        def on_error(e):
+            finish()
+            messagebox.showerror("Error", str(e))
+        
+        export.export_in_background(job, self.ui.post, on_done, on_error)
+    
     def export_report(self):
         """Export full report"""
         if not self.sorted_data:
@@ -1325,32 +1759,36 @@ class PrelimExam:
         
         path = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt")],
+            filetypes=export.filetypes("Text files", ".txt"),
             initialfile="sort_report.txt"
         )
         
         if path:
-            try:
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write("="*70 + "\n")
-                    f.write("                    SORTING REPORT\n")
-                    f.write("="*70 + "\n\n")
-                    f.write(f"Algorithm:        {self.last_algorithm}\n")
-                    f.write(f"Records Sorted:   {self.last_rows:,}\n")
-                    f.write(f"Sort Column:      {self.last_column}\n")
-                    f.write(f"Execution Time:   {self.last_sort_time:.4f}s ({self.last_sort_time*1000:.2f}ms)\n\n")
-                    f.write("="*70 + "\n")
-                    f.write(f"                SORTED DATA ({len(self.sorted_data):,} records)\n")
-                    f.write("="*70 + "\n\n")
-                    
-                    for i, record in enumerate(self.sorted_data, 1):
-                        f.write(f"{i:5d}. ID:{record['ID']:>6} | {record['FirstName']:>10} {record['LastName']:<12}\n")
-                    
-                    f.write("\n" + "="*70 + "\n")
-                
-                messagebox.showinfo("Saved", "Report exported successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            records = self.sorted_data
+            header = (
+                "="*70 + "\n"
+                "                    SORTING REPORT\n" +
+                "="*70 + "\n\n"
+                f"Algorithm:        {self.last_algorithm}\n"
+                f"Records Sorted:   {self.last_rows:,}\n"
+                f"Sort Column:      {self.last_column}\n"
+                f"Execution Time:   {self.last_sort_time:.4f}s ({self.last_sort_time*1000:.2f}ms)\n" +
+                (f"Verification:     {describe_outcome(self.last_verification.outcome)}\n"
+                 if self.last_verification and self.last_verification.done else "") +
+                (self.format_counters(self.last_counters) if self.last_counters else "") + "\n" +
+                ("LATENCY BREAKDOWN\n" + "\n".join(self.last_spans.breakdown_lines()) + "\n\n"
+                 if self.last_spans else "") +
+                "="*70 + "\n"
+                f"                SORTED DATA ({len(records):,} records)\n" +
+                "="*70 + "\n\n"
+            )
+            footer = "\n" + "="*70 + "\n"
+            
+            self._export_in_background(
+                path,
+                lambda: export.write_lines(path, enumerate(records), lambda item: report_line(*item), header, footer),
+                "report"
+            )
     
     def export_sorted_csv(self):
         """Export sorted CSV file"""
@@ -1360,27 +1798,25 @@ class PrelimExam:
         
         path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv")],
+            filetypes=export.filetypes("CSV files", ".csv"),
             initialfile="sorted_data.csv"
         )
         
         if path:
-            try:
-                with open(path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=['ID', 'FirstName', 'LastName'])
-                    writer.writeheader()
-                    writer.writerows(self.sorted_data)
-                
-                messagebox.showinfo("Saved", f"Exported {len(self.sorted_data):,} sorted records to CSV!")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            records = self.sorted_data
+            self._export_in_background(
+                path,
+                lambda: export.write_blocks(path, export.csv_blocks(records, ['ID', 'FirstName', 'LastName'])),
+                f"{len(records):,} sorted records"
+            )
 
 
 class ArfArfSort:
     """🐕 Main application class"""
     
-    def __init__(self, root):
+    def __init__(self, root, workers: Optional[int] = None):
         self.root = root
+        self.workers = workers
         self.root.title("ArfArf Sort - Professional Edition")
         self.root.geometry("1200x1000")
         self.root.configure(bg=DOG_COLORS['bg'])
@@ -1511,13 +1947,21 @@ class ArfArfSort:
         exam_frame = tk.Frame(self.main_container, bg=DOG_COLORS['bg'])
         exam_frame.pack(fill=tk.BOTH, expand=True)
         
-        PrelimExam(exam_frame)
+        PrelimExam(exam_frame, workers=self.workers)
         self.create_back_button(exam_frame)
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="ArfArf Sort - Prelim Lab Exam")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes used to parse large CSV files (default: CPU count)")
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
     root = tk.Tk()
-    app = ArfArfSort(root)
+    app = ArfArfSort(root, workers=args.workers)
     root.mainloop()
 
 
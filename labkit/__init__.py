@@ -0,0 +1,5 @@
+"""🐕 labkit - shared, GUI-independent helpers for the lab applications
+
+The Prelim and Midterm GUIs add the repository root to ``sys.path`` and
+import from here, so everything in this package must work without Tk.
+"""
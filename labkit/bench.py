@@ -0,0 +1,279 @@
+"""Headless benchmark runner for the sorting engine
+
+Runs every combination of algorithm x size x distribution with warmup runs
+and repetitions (each on a fresh copy of the same input) and writes the
+results as JSON and/or CSV, so it can run on build agents without Tk.
+
+    python -m labkit.bench --algorithms merge,insertion --sizes 1000,10000 \\
+        --distributions uniform,reversed --repeat 5 --warmup 1 --json out.json
+
+``--suite adversarial`` runs every algorithm against the best/worst-case
+input shapes (sorted, reversed, organ pipe, sawtooth, all equal, few
+unique, 1% perturbed, median-of-3 quicksort killer) and prints a matrix of
+each shape's median time relative to uniform random input.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from labkit import datagen
+from labkit.complexity import ComplexityFit
+from labkit.history import HistoryStore
+from labkit.memprof import format_bytes, profile_call
+from labkit.timing import TimingStats, measure
+from labkit.sorting import ALGORITHMS, resolve_algorithm
+from labkit.verify import verify_values
+
+SUITES = {"adversarial": datagen.ADVERSARIAL_SUITE}
+BASELINE_SHAPE = "uniform"
+
+CSV_FIELDS = ["algorithm", "size", "distribution", "reverse", "repeat", "warmup",
+              "min_s", "median_s", "p95_s", "mean_s", "stddev_s", "ci95_low_s", "ci95_high_s", "max_s",
+              "input_peak_bytes", "sort_peak_bytes", "sort_retained_bytes", "verified"]
+
+
+def _split(text: str) -> List[str]:
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+def time_runs(sort_func: Callable, data: List, repeat: int, warmup: int, reverse: bool = False,
+              stop_cb: Optional[Callable[[], bool]] = None) -> Tuple[Optional[TimingStats], object]:
+    """Time sort_func on fresh copies of data; warmup runs are executed but discarded.
+
+    Returns (stats, output of the last run).
+    """
+    return measure(lambda fresh: sort_func(fresh, stop_cb=stop_cb, reverse=reverse),
+                   data, repeat, warmup, stop_cb)
+
+
+def run_benchmarks(algorithms: Sequence[str], sizes: Sequence[int], distributions: Sequence[str],
+                   repeat: int = 3, warmup: int = 1, seed: int = 0, reverse: bool = False,
+                   log: Optional[Callable[[str], None]] = None, memory: bool = False,
+                   stop_cb: Optional[Callable[[], bool]] = None) -> List[Dict]:
+    """Run the full matrix and return one result dict per combination.
+
+    With memory=True every combination gets one extra, untimed run under
+    tracemalloc for its peak and retained bytes. When stop_cb returns True
+    the run ends early with the results finished so far. The output of the
+    last timed run is checked with labkit.verify once timing is done.
+    """
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            if stop_cb and stop_cb():
+                return results
+            if memory:
+                data, input_stage = profile_call("Generate", datagen.generate, size, distribution, seed)
+            else:
+                data = datagen.generate(size, distribution, seed)
+            for name in algorithms:
+                stats, output = time_runs(ALGORITHMS[name], data, repeat, warmup, reverse, stop_cb)
+                if stats is None or (stop_cb and stop_cb()):
+                    return results
+                verification = verify_values(data, output, reverse)
+                result = {
+                    "algorithm": name,
+                    "size": size,
+                    "distribution": distribution,
+                    "reverse": reverse,
+                    "repeat": repeat,
+                    "warmup": warmup,
+                }
+                result.update(stats.as_dict())
+                result.update(verification.as_dict())
+                if memory:
+                    _, sort_stage = profile_call("Sort", ALGORITHMS[name], data, reverse=reverse)
+                    result.update({
+                        "input_peak_bytes": input_stage.peak_bytes,
+                        "sort_peak_bytes": sort_stage.peak_bytes,
+                        "sort_retained_bytes": sort_stage.retained_bytes,
+                    })
+                results.append(result)
+                if log:
+                    log(f"{name:<16} {distribution:<14} {size:>10,}  {stats.describe()}")
+                    if not verification.passed:
+                        log(f"{'':<16} {'':<14} {'':>10}  {verification.describe()}")
+                    if memory:
+                        log(f"{'':<16} {'':<14} {'':>10}  memory: input {format_bytes(input_stage.peak_bytes)}, "
+                            f"sort peak {format_bytes(sort_stage.peak_bytes)}, "
+                            f"retained {format_bytes(sort_stage.retained_bytes)}")
+    return results
+
+
+def fit_results(results: List[Dict]) -> List[Dict]:
+    """Fit median time vs. size for each algorithm x distribution with 2+ sizes"""
+    series: Dict = {}
+    for r in results:
+        series.setdefault((r["algorithm"], r["distribution"]), []).append((r["size"], r["median_s"]))
+    fits = []
+    for (name, distribution), points in series.items():
+        try:
+            fit = ComplexityFit(points)
+        except ValueError:
+            continue
+        fits.append({
+            "algorithm": name,
+            "distribution": distribution,
+            "exponent": fit.exponent,
+            "coefficient": fit.coefficient,
+            "closest_model": fit.best,
+            "models": {model: {"constant": c, "relative_error": err} for model, (c, err) in fit.models.items()},
+            "summary": fit.describe(),
+        })
+    return fits
+
+
+def shape_matrix_lines(results: List[Dict]) -> List[str]:
+    """Input shape x algorithm table of median times for each size.
+
+    Each cell also shows the time relative to uniform random input of the
+    same size; the fastest and slowest shape of every algorithm are marked
+    ▼ (best case) and ▲ (worst case).
+    """
+    cells: Dict = {}
+    for r in results:
+        cells[(r["size"], r["distribution"], r["algorithm"])] = r["median_s"]
+    algorithms = list(dict.fromkeys(r["algorithm"] for r in results))
+    shapes = list(dict.fromkeys(r["distribution"] for r in results))
+    width = 16 + 24 * len(algorithms)
+
+    lines = []
+    for size in dict.fromkeys(r["size"] for r in results):
+        marks = {}
+        for name in algorithms:
+            times = {shape: cells[(size, shape, name)] for shape in shapes if (size, shape, name) in cells}
+            if len(times) > 1:
+                marks[(min(times, key=times.get), name)] = "▼"
+                marks[(max(times, key=times.get), name)] = "▲"
+        lines.append(f"Input shapes at n = {size:,} (median, x vs {BASELINE_SHAPE}; ▼ best, ▲ worst)")
+        lines.append(f"{'Shape':<16}" + "".join(f"{name:>24}" for name in algorithms))
+        lines.append("-" * width)
+        for shape in shapes:
+            row = f"{shape:<16}"
+            for name in algorithms:
+                seconds = cells.get((size, shape, name))
+                if seconds is None:
+                    row += f"{'-':>24}"
+                    continue
+                base = cells.get((size, BASELINE_SHAPE, name))
+                ratio = (f"{seconds / base:.2f}x" if seconds >= base / 100 else f"{seconds / base:.3f}x") if base else ""
+                row += f"{seconds * 1000:>11.2f} ms {ratio:>8} {marks.get((shape, name), ' ')}"
+            lines.append(row)
+        lines.append("-" * width)
+        lines.append("")
+    return lines
+
+
+def environment() -> Dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_json(path: str, meta: Dict, results: List[Dict], fits: Optional[List[Dict]] = None):
+    payload = {"meta": meta, "results": results}
+    if fits is not None:
+        payload["fits"] = fits
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
+def write_csv(path: str, results: List[Dict]):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the lab sorting algorithms without a GUI")
+    parser.add_argument("--algorithms", default="bubble,insertion,merge",
+                        help="comma separated: bubble, insertion, merge")
+    parser.add_argument("--sizes", default="1000,5000",
+                        help="comma separated input sizes")
+    parser.add_argument("--distributions", default="uniform",
+                        help=f"comma separated, from: {', '.join(datagen.DISTRIBUTIONS)}")
+    parser.add_argument("--suite", choices=sorted(SUITES),
+                        help="run a named set of input shapes instead of --distributions and print a shape matrix")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per combination")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before timing")
+    parser.add_argument("--seed", type=int, default=0, help="dataset seed (same seed, same inputs)")
+    parser.add_argument("--descending", action="store_true", help="sort in descending order")
+    parser.add_argument("--memory", action="store_true",
+                        help="add one untimed tracemalloc run per combination (peak/retained bytes)")
+    parser.add_argument("--fit", action="store_true",
+                        help="fit n / n log n / n^2 models to the timings across --sizes")
+    parser.add_argument("--json", dest="json_path", help="write results as JSON")
+    parser.add_argument("--csv", dest="csv_path", help="write results as CSV")
+    parser.add_argument("--history", dest="history_path",
+                        help="also save the run to this SQLite history (see python -m labkit.history)")
+    parser.add_argument("--label", default="", help="label stored with the run in --history")
+    parser.add_argument("--quiet", action="store_true", help="only print errors")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        algorithms = [resolve_algorithm(name) for name in _split(args.algorithms)]
+        sizes = [int(size) for size in _split(args.sizes)]
+        distributions = list(SUITES[args.suite]) if args.suite else _split(args.distributions)
+        for size in sizes:
+            datagen.validate(size, "uniform")
+        for distribution in distributions:
+            datagen.validate(1, distribution)
+        if args.repeat < 1 or args.warmup < 0:
+            raise ValueError("--repeat must be >= 1 and --warmup >= 0")
+    except ValueError as e:
+        parser.error(str(e))
+
+    log = None if args.quiet else print
+    meta = environment()
+    meta.update({"seed": args.seed, "repeat": args.repeat, "warmup": args.warmup})
+    if args.suite:
+        meta["suite"] = args.suite
+
+    results = run_benchmarks(algorithms, sizes, distributions, args.repeat, args.warmup,
+                             args.seed, args.descending, log, args.memory)
+
+    failed = [r for r in results if not r["verified"]]
+    if failed:
+        print(f"{len(failed)} result(s) failed verification", file=sys.stderr)
+
+    if args.suite and log:
+        log("")
+        for line in shape_matrix_lines(results):
+            log(line)
+
+    fits = None
+    if args.fit:
+        fits = fit_results(results)
+        for fit in fits:
+            if log:
+                log(f"{fit['algorithm']:<16} {fit['distribution']:<14} {fit['summary']}")
+
+    if args.json_path:
+        write_json(args.json_path, meta, results, fits)
+    if args.csv_path:
+        write_csv(args.csv_path, results)
+    if args.history_path:
+        with HistoryStore(args.history_path) as store:
+            run_id = store.save_run(results, args.label, "bench", args.seed)
+        if log:
+            log(f"Saved as run #{run_id} in {args.history_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Empirical complexity fitting for the sorting engine
+
+Times an algorithm over a geometric sweep of input sizes and fits the
+measurements two ways:
+
+- a power law ``t = a * n^k`` (least squares in log-log space), which gives
+  the observed growth exponent k, and
+- the fixed models n, n log n and n^2 (``t = c * f(n)``), each with its
+  constant c and RMS relative error, so the closest model can be named.
+
+The fit is then used to extrapolate the runtime for a larger n.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from labkit.timing import measure
+
+MODELS: Dict[str, Callable[[float], float]] = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n) if n > 1 else 1.0,
+    "O(n²)": lambda n: n * n,
+}
+
+
+def geometric_sizes(start: int, stop: int, factor: float = 2.0) -> List[int]:
+    """start, start*factor, ... up to and including stop"""
+    sizes = []
+    size = max(1, int(start))
+    while size < stop:
+        sizes.append(size)
+        size = max(size + 1, int(size * factor))
+    sizes.append(int(stop))
+    return sizes
+
+
+def sweep(sort_func: Callable[[List], object], data: Sequence, sizes: Sequence[int],
+          repeats: int = 3, time_limit: Optional[float] = None,
+          stop_cb: Optional[Callable[[], bool]] = None) -> List[Tuple[int, float]]:
+    """Median time of sort_func on data[:size] for each size.
+
+    Prefixes of the same data keep the input shape constant across sizes. The
+    sweep ends early once a median exceeds time_limit seconds (that point is
+    kept) or stop_cb returns True.
+    """
+    points = []
+    for size in sizes:
+        if size > len(data):
+            break
+        stats, _ = measure(sort_func, data[:size], repeats, stop_cb=stop_cb)
+        if stats is None:
+            break
+        points.append((size, stats.median))
+        if time_limit is not None and stats.median > time_limit:
+            break
+    return points
+
+
+class ComplexityFit:
+    """Power-law and fixed-model fits of (size, seconds) points"""
+
+    def __init__(self, points: Sequence[Tuple[int, float]]):
+        self.points = [(n, t) for n, t in points if n > 0 and t > 0]
+        if len(self.points) < 2:
+            raise ValueError("Need at least two timed sizes to fit a complexity model")
+
+        # log t = log a + k log n
+        xs = [math.log(n) for n, _ in self.points]
+        ys = [math.log(t) for _, t in self.points]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        sxx = sum((x - mean_x) ** 2 for x in xs)
+        if sxx == 0:
+            raise ValueError("Need at least two different sizes to fit a complexity model")
+        self.exponent = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+        self.coefficient = math.exp(mean_y - self.exponent * mean_x)
+
+        # t = c * f(n), minimising relative error so small sizes count as much as large ones
+        self.models: Dict[str, Tuple[float, float]] = {}
+        for name, f in MODELS.items():
+            ratios = [f(n) / t for n, t in self.points]
+            c = sum(ratios) / sum(r * r for r in ratios)
+            error = math.sqrt(sum((c * r - 1) ** 2 for r in ratios) / len(ratios))
+            self.models[name] = (c, error)
+        self.best = min(self.models, key=lambda name: self.models[name][1])
+
+    def predict(self, n: int, model: Optional[str] = None) -> float:
+        """Extrapolated seconds for n, from a named model or the power law"""
+        if model is None:
+            return self.coefficient * n ** self.exponent
+        c, _ = self.models[model]
+        return c * MODELS[model](n)
+
+    def describe(self) -> str:
+        c, error = self.models[self.best]
+        return (f"t ≈ {self.coefficient:.3e}·n^{self.exponent:.2f}, "
+                f"closest {self.best} (c={c:.3e}, error {error * 100:.1f}%)")
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.1f} ms"
+    if seconds < 120:
+        return f"{seconds:.1f} s"
+    if seconds < 7200:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds / 3600:.1f} h"
+
+
+def estimate(sort_func: Callable[[List], object], data: Sequence, targets: Sequence[int],
+             start: int = 250, time_limit: float = 0.25, repeats: int = 1) -> Tuple[ComplexityFit, Dict[int, float]]:
+    """Quick sweep on prefixes of data, then extrapolate each target size.
+
+    The sweep doubles the size from start until one run takes time_limit
+    seconds, so the probe stays short even for quadratic algorithms.
+    """
+    stop = min(len(data), max(targets))
+    points = sweep(sort_func, data, geometric_sizes(start, stop), repeats, time_limit)
+    fit = ComplexityFit(points)
+    return fit, {n: fit.predict(n) for n in targets}
@@ -0,0 +1,238 @@
+"""Seeded synthetic dataset generator
+
+Data is produced in batches using C-level helpers (``randbytes`` + ``array``,
+``choices``, ``map``) instead of one ``randint`` call per value, and written
+with one ``write``/``writerows`` call per batch.
+
+Command line::
+
+    python -m labkit.datagen OUT --size 1000000 --distribution zipf --seed 7
+"""
+
+import argparse
+import csv
+import random
+from array import array
+from itertools import accumulate
+from typing import Callable, Iterator, List, Optional
+
+DISTRIBUTIONS = ("uniform", "sorted", "reversed", "nearly_sorted", "few_unique", "zipf",
+                 "organ_pipe", "sawtooth", "all_equal", "perturbed", "quicksort_killer")
+# Input shapes that probe best and worst cases (uniform is the baseline)
+ADVERSARIAL_SUITE = ("uniform", "sorted", "reversed", "organ_pipe", "sawtooth", "all_equal",
+                     "few_unique", "perturbed", "quicksort_killer")
+MAX_SIZE = 100_000_000
+BATCH_SIZE = 65_536
+
+FIRST_NAMES = ["John", "Jane", "Michael", "Emily", "David", "Sarah", "Robert", "Lisa",
+               "James", "Mary", "William", "Patricia", "Richard", "Jennifer", "Joseph",
+               "Linda", "Thomas", "Barbara", "Charles", "Elizabeth"]
+
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+              "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
+              "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"]
+
+FEW_UNIQUE_COUNT = 8
+ZIPF_EXPONENT = 1.2
+ZIPF_MAX_RANKS = 10_000
+NEARLY_SORTED_SWAP_RATE = 0.01
+PERTURB_RATE = 0.01
+SAWTOOTH_TEETH = 16
+
+
+def resolve_seed(seed: Optional[int]) -> int:
+    """Return seed, or a fresh random one so every run can be reproduced"""
+    return random.SystemRandom().randrange(2 ** 32) if seed is None else int(seed)
+
+
+def validate(size: int, distribution: str, low: int = 1, high: int = 100000):
+    if size <= 0:
+        raise ValueError("Size must be positive")
+    if size > MAX_SIZE:
+        raise ValueError(f"Size must be at most {MAX_SIZE:,}")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}' (choose from {', '.join(DISTRIBUTIONS)})")
+    if high < low:
+        raise ValueError("high must be >= low")
+
+
+def _uniform_batch(rng: random.Random, count: int, low: int, span: int) -> List[int]:
+    raw = array('I')
+    raw.frombytes(rng.randbytes(4 * count))
+    return list(map(low.__add__, map(span.__rmod__, raw)))
+
+
+def _spaced_batch(start: int, end: int, size: int, low: int, span: int) -> List[int]:
+    """Evenly spaced, non-decreasing values covering [low, low + span)"""
+    return [low + (i * span) // size for i in range(start, end)]
+
+
+def _rank_values(ranks: List[int], size: int, low: int, span: int) -> List[int]:
+    """Map 0-based ranks (0..size-1) onto [low, low + span) keeping their order"""
+    return [low + (r * span) // size for r in ranks]
+
+
+def _median_of_3_killer(size: int) -> List[int]:
+    """Musser's permutation that drives median-of-3 quicksort to O(n^2); 0-based ranks
+
+    The construction is a permutation only for a multiple of 4 elements, so
+    it covers the largest such prefix and the (at most 3) largest ranks
+    follow in order.
+    """
+    base = size - size % 4
+    k = base // 2
+    ranks = [0] * base
+    for i in range(1, k + 1):
+        ranks[i - 1] = i if i % 2 else k + i - 1
+        ranks[k + i - 1] = 2 * i
+    return [r - 1 for r in ranks] + list(range(base, size))
+
+
+def _whole_shape(size: int, distribution: str, rng: random.Random, low: int, span: int) -> List[int]:
+    """Shapes defined over the whole array rather than batch by batch"""
+    if distribution == "organ_pipe":
+        half = (size + 1) // 2
+        ranks = [2 * i for i in range(half)] + [2 * (size - 1 - i) + 1 for i in range(half, size)]
+        return _rank_values(ranks, 2 * size, low, span)
+    if distribution == "sawtooth":
+        tooth = max(2, -(-size // SAWTOOTH_TEETH))
+        return _rank_values([(i % tooth) * size // tooth for i in range(size)], size, low, span)
+    if distribution == "all_equal":
+        return [low + span // 2] * size
+    if distribution == "perturbed":
+        values = _spaced_batch(0, size, size, low, span)
+        for i in rng.sample(range(size), max(1, int(size * PERTURB_RATE))):
+            values[i] = low + rng.randrange(span)
+        return values
+    # quicksort_killer
+    return _rank_values(_median_of_3_killer(size), size, low, span)
+
+
+WHOLE_SHAPES = ("organ_pipe", "sawtooth", "all_equal", "perturbed", "quicksort_killer")
+
+
+def iter_batches(size: int, distribution: str = "uniform", seed: Optional[int] = None,
+                 low: int = 1, high: int = 100000, batch_size: int = BATCH_SIZE) -> Iterator[List[int]]:
+    """Yield integers in [low, high] following distribution, batch by batch"""
+    validate(size, distribution, low, high)
+    rng = random.Random(resolve_seed(seed))
+    span = high - low + 1
+
+    if distribution == "few_unique":
+        pool = sorted(rng.sample(range(low, high + 1), min(FEW_UNIQUE_COUNT, span)))
+    elif distribution == "zipf":
+        ranks = min(span, ZIPF_MAX_RANKS)
+        pool = rng.sample(range(low, high + 1), ranks)
+        cum_weights = list(accumulate(1.0 / (r ** ZIPF_EXPONENT) for r in range(1, ranks + 1)))
+    elif distribution in WHOLE_SHAPES:
+        values = _whole_shape(size, distribution, rng, low, span)
+        for start in range(0, size, batch_size):
+            yield values[start:start + batch_size]
+        return
+
+    for start in range(0, size, batch_size):
+        end = min(size, start + batch_size)
+        count = end - start
+
+        if distribution == "uniform":
+            batch = _uniform_batch(rng, count, low, span)
+        elif distribution == "sorted":
+            batch = _spaced_batch(start, end, size, low, span)
+        elif distribution == "reversed":
+            batch = _spaced_batch(size - end, size - start, size, low, span)
+            batch.reverse()
+        elif distribution == "nearly_sorted":
+            batch = _spaced_batch(start, end, size, low, span)
+            for _ in range(max(1, int(count * NEARLY_SORTED_SWAP_RATE)) if count > 1 else 0):
+                a = rng.randrange(count)
+                b = rng.randrange(count)
+                batch[a], batch[b] = batch[b], batch[a]
+        elif distribution == "few_unique":
+            batch = rng.choices(pool, k=count)
+        else:  # zipf
+            batch = rng.choices(pool, cum_weights=cum_weights, k=count)
+
+        yield batch
+
+
+def generate(size: int, distribution: str = "uniform", seed: Optional[int] = None,
+             low: int = 1, high: int = 100000) -> List[int]:
+    """Return a full list of integers (see iter_batches)"""
+    data = []
+    for batch in iter_batches(size, distribution, seed, low, high):
+        data.extend(batch)
+    return data
+
+
+def write_txt(path: str, size: int, distribution: str = "uniform", seed: Optional[int] = None,
+              low: int = 1, high: int = 100000,
+              progress_cb: Optional[Callable[[int, int], None]] = None) -> int:
+    """Write one integer per line; returns the number of values written"""
+    written = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for batch in iter_batches(size, distribution, seed, low, high):
+            f.write("\n".join(map(str, batch)))
+            f.write("\n")
+            written += len(batch)
+            if progress_cb:
+                progress_cb(written, size)
+    return written
+
+
+def _id_batches(size: int, distribution: str, rng: random.Random) -> Iterator[List[int]]:
+    """IDs for the people CSV: uniform means a shuffled permutation of 1..size"""
+    if distribution == "uniform":
+        ids = list(range(1, size + 1))
+        rng.shuffle(ids)
+        for start in range(0, size, BATCH_SIZE):
+            yield ids[start:start + BATCH_SIZE]
+    else:
+        yield from iter_batches(size, distribution, rng.getrandbits(32), 1, size)
+
+
+def iter_people_batches(size: int, distribution: str = "uniform",
+                        seed: Optional[int] = None) -> Iterator[List[tuple]]:
+    """Yield (ID, FirstName, LastName) rows in batches"""
+    validate(size, distribution)
+    rng = random.Random(resolve_seed(seed))
+    for ids in _id_batches(size, distribution, rng):
+        count = len(ids)
+        yield list(zip(ids, rng.choices(FIRST_NAMES, k=count), rng.choices(LAST_NAMES, k=count)))
+
+
+def write_people_csv(path: str, size: int = 100000, distribution: str = "uniform",
+                     seed: Optional[int] = None,
+                     progress_cb: Optional[Callable[[int, int], None]] = None) -> int:
+    """Write an ID,FirstName,LastName CSV; returns the number of rows written"""
+    written = 0
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['ID', 'FirstName', 'LastName'])
+        for rows in iter_people_batches(size, distribution, seed):
+            writer.writerows(rows)
+            written += len(rows)
+            if progress_cb:
+                progress_cb(written, size)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate benchmark datasets")
+    parser.add_argument("out", help="output file (.csv writes ID,FirstName,LastName rows)")
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--low", type=int, default=1)
+    parser.add_argument("--high", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    seed = resolve_seed(args.seed)
+    if args.out.lower().endswith(".csv"):
+        count = write_people_csv(args.out, args.size, args.distribution, seed)
+    else:
+        count = write_txt(args.out, args.size, args.distribution, seed, args.low, args.high)
+    print(f"Wrote {count:,} {args.distribution} values to {args.out} (seed {seed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Streaming, block-buffered export writers
+
+Records are formatted and joined into large blocks (one ``str.join`` per
+block) and each block is written with a single call, so exports are bound by
+I/O rather than per-line formatting. Output paths ending in ``.gz`` are gzip
+compressed; ``.zst`` uses the optional ``zstandard`` package.
+"""
+
+import csv
+import gzip
+import io
+import operator
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+from labkit.resultcache import fingerprint
+
+BLOCK_LINES = 50_000
+
+
+def compression_for(path: str) -> Optional[str]:
+    lower = path.lower()
+    if lower.endswith(".gz"):
+        return "gzip"
+    if lower.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def filetypes(label: str, ext: str) -> List[Tuple[str, str]]:
+    """filedialog filetypes for ext plus the compressed variants available here"""
+    types = [(label, f"*{ext}"), (f"{label} (gzip)", f"*{ext}.gz")]
+    if zstandard is not None:
+        types.append((f"{label} (zstd)", f"*{ext}.zst"))
+    return types
+
+
+def open_output(path: str, compression: Optional[str] = None):
+    """Open path for binary writing, compressed according to compression or its extension"""
+    compression = compression or compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd export needs the 'zstandard' package (pip install zstandard)")
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb", buffering=1024 * 1024)
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def line_blocks(items: Iterable, formatter: Callable = str,
+                block_lines: int = BLOCK_LINES) -> Iterator[bytes]:
+    """Yield newline-terminated, utf-8 encoded blocks of formatted items"""
+    for chunk in _chunks(items, block_lines):
+        yield ("\n".join(map(formatter, chunk)) + "\n").encode("utf-8")
+
+
+def csv_blocks(rows: Iterable[dict], fieldnames: Sequence[str],
+               block_lines: int = BLOCK_LINES, header: bool = True) -> Iterator[bytes]:
+    """Yield CSV blocks (with an optional header) for dict rows"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    for chunk in _chunks(rows, block_lines):
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_blocks(path: str, blocks: Iterable[bytes], compression: Optional[str] = None) -> int:
+    """Write pre-encoded blocks to path; returns the number of bytes written"""
+    total = 0
+    with open_output(path, compression) as f:
+        for block in blocks:
+            f.write(block)
+            total += len(block)
+    return total
+
+
+def write_lines(path: str, items: Iterable, formatter: Callable = str,
+                header: str = "", footer: str = "", compression: Optional[str] = None) -> int:
+    """Write header, one formatted line per item, then footer"""
+    def blocks():
+        if header:
+            yield header.encode("utf-8")
+        yield from line_blocks(items, formatter)
+        if footer:
+            yield footer.encode("utf-8")
+    return write_blocks(path, blocks(), compression)
+
+
+def same_values(a: Sequence, b: Sequence) -> bool:
+    """Element-by-element equality, also between a list and an array"""
+    if type(a) is type(b):
+        return a == b
+    return len(a) == len(b) and all(map(operator.eq, a, b))
+
+
+def group_identical(named: Dict[str, Sequence]) -> List[List[str]]:
+    """Group names whose sequences are equal.
+
+    Candidates are bucketed by (length, content fingerprint, see
+    ``labkit.resultcache.fingerprint``, which hashes packed bytes without
+    copying the values) and then confirmed element by element, so hash
+    collisions never merge groups.
+    """
+    buckets: Dict[Tuple[int, str], List[List[str]]] = {}
+    for name, values in named.items():
+        key = (len(values), fingerprint(values))
+        for group in buckets.setdefault(key, []):
+            if same_values(named[group[0]], values):
+                group.append(name)
+                break
+        else:
+            buckets[key].append([name])
+    return [group for groups in buckets.values() for group in groups]
+
+
+def _temp_path(path: str) -> str:
+    """A temporary name in path's directory, so os.replace onto path is atomic"""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def replace_with(path: str, write: Callable[[str], object]) -> object:
+    """Run write(temp) and move the temporary file over path only if it succeeded
+
+    An export that fails leaves the previous file at path untouched.
+    """
+    temp = _temp_path(path)
+    try:
+        result = write(temp)
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.lexists(temp):
+            os.remove(temp)
+        raise
+    return result
+
+
+def link_or_copy(source: str, target: str) -> str:
+    """Hard-link target to source, falling back to a copy; returns 'link' or 'copy'"""
+    def make(temp):
+        try:
+            os.link(source, temp)
+            return "link"
+        except OSError:
+            shutil.copyfile(source, temp)
+            return "copy"
+    return replace_with(target, make)
+
+
+def write_deduplicated(targets: Dict[str, Sequence], formatter: Callable = str,
+                       max_workers: Optional[int] = None) -> Dict[str, object]:
+    """Write several line exports, storing identical contents only once.
+
+    targets maps output path -> values. Distinct contents are written
+    concurrently on a thread pool; every other path with the same contents is
+    hard-linked (or copied) to the file that was written.
+    """
+    groups = group_identical(targets)
+    workers = max_workers or min(len(groups), 4) or 1
+
+    def write(path):
+        # a new file replaces path, so files of an earlier export that share one
+        # inode are never written through, and a failed write keeps the old file
+        return replace_with(path, lambda temp: write_lines(temp, targets[path], formatter,
+                                                           compression=compression_for(path)))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {group[0]: pool.submit(write, group[0]) for group in groups}
+        written = sum(future.result() for future in futures.values())
+
+    shared = {}
+    for group in groups:
+        for path in group[1:]:
+            shared[path] = (group[0], link_or_copy(group[0], path))
+
+    return {"bytes": written, "written": [group[0] for group in groups], "shared": shared}
+
+
+class BackgroundExport:
+    """Runs an export job on a worker thread and reports back through schedule.
+
+    schedule must hand a callable to the UI thread, e.g.
+    ``lambda fn: frame.after(0, fn)``.
+    """
+
+    def __init__(self, job: Callable[[], object], schedule: Callable[[Callable], None],
+                 on_done: Optional[Callable[[object, float], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self.job = job
+        self.schedule = schedule
+        self.on_done = on_done
+        self.on_error = on_error
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "BackgroundExport":
+        self.thread.start()
+        return self
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            result = self.job()
+        except Exception as e:
+            if self.on_error:
+                self.schedule(lambda e=e: self.on_error(e))
+            return
+        elapsed = time.perf_counter() - start
+        if self.on_done:
+            self.schedule(lambda: self.on_done(result, elapsed))
+
+
+def export_in_background(job: Callable[[], object], schedule: Callable[[Callable], None],
+                         on_done: Optional[Callable[[object, float], None]] = None,
+                         on_error: Optional[Callable[[Exception], None]] = None) -> BackgroundExport:
+    return BackgroundExport(job, schedule, on_done, on_error).start()
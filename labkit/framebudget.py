@@ -0,0 +1,87 @@
+"""Frame-budgeted chunked rendering for long outputs
+
+Inserting a huge output into a Tk widget in one go freezes the window, and
+a fixed chunk size is either too slow on a fast machine or too janky on a
+slow one. ``ChunkScheduler`` times every chunk it hands to the widget and
+sizes the next one so a chunk takes about one frame budget (12 ms), then
+yields to the event loop so input and redraws keep up:
+
+    job = ChunkScheduler(frame.after, lines,
+                         lambda chunk: text.insert("end", "".join(chunk)),
+                         on_complete=done).start()
+    ...
+    job.cancel()   # e.g. when a new run replaces the output
+"""
+
+import time
+from typing import Callable, Optional, Sequence
+
+FRAME_BUDGET = 0.012
+FIRST_CHUNK = 64
+MAX_GROWTH = 4.0  # the next chunk is at most this many times larger than the last
+
+
+class ChunkScheduler:
+    """Feeds items to sink in chunks that each fit the frame budget"""
+
+    def __init__(self, after: Callable[[int, Callable], object], items: Sequence,
+                 sink: Callable[[Sequence], None], on_complete: Optional[Callable[[], None]] = None,
+                 budget: float = FRAME_BUDGET, first_chunk: int = FIRST_CHUNK,
+                 max_chunk: int = 100_000, gap_ms: int = 1):
+        self.after = after
+        self.items = items
+        self.sink = sink
+        self.on_complete = on_complete
+        self.budget = budget
+        self.chunk = max(1, first_chunk)
+        self.max_chunk = max_chunk
+        self.gap_ms = gap_ms
+        self.position = 0
+        self.chunks = 0
+        self.busy_seconds = 0.0  # time spent inside sink
+        self.cancelled = False
+
+    @property
+    def done(self) -> bool:
+        return self.position >= len(self.items)
+
+    def start(self) -> "ChunkScheduler":
+        self.after(1, self._step)
+        return self
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _step(self):
+        if self.cancelled:
+            return
+        end = min(len(self.items), self.position + self.chunk)
+        start = time.perf_counter()
+        if end > self.position:
+            self.sink(self.items[self.position:end])
+        elapsed = time.perf_counter() - start
+        count = end - self.position
+        self.position = end
+        self.chunks += 1
+        self.busy_seconds += elapsed
+        if self.done:
+            if self.on_complete:
+                self.on_complete()
+            return
+        self.chunk = self.next_chunk(count, elapsed)
+        self.after(self.gap_ms, self._step)
+
+    def next_chunk(self, count: int, elapsed: float) -> int:
+        """Items that should fill the budget at the measured rate, growing at most MAX_GROWTH x"""
+        if elapsed <= 0:
+            target = count * MAX_GROWTH
+        else:
+            target = count * self.budget / elapsed
+        target = min(target, count * MAX_GROWTH, self.max_chunk)
+        return max(1, int(target))
+
+
+def render_chunked(after: Callable[[int, Callable], object], items: Sequence,
+                   sink: Callable[[Sequence], None],
+                   on_complete: Optional[Callable[[], None]] = None) -> ChunkScheduler:
+    return ChunkScheduler(after, items, sink, on_complete).start()
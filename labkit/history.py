@@ -0,0 +1,270 @@
+"""SQLite history of benchmark runs, with baselines and regression checks
+
+Every saved run records the machine fingerprint and Python version next to
+the timing statistics, so runs are only compared like-for-like. Compare a
+run against a named baseline from the command line (exit code 1 on a
+regression, so it can gate a build):
+
+    python -m labkit.bench --sizes 1000,5000 --repeat 5 --history bench.sqlite
+    python -m labkit.history --db bench.sqlite list
+    python -m labkit.history --db bench.sqlite baseline 1
+    python -m labkit.history --db bench.sqlite compare --threshold 0.10
+"""
+
+import argparse
+import hashlib
+import os
+import platform
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_PATH = os.environ.get("LABKIT_HISTORY", "benchmark_history.sqlite")
+DEFAULT_BASELINE = "default"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    label TEXT,
+    source TEXT,
+    machine TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    python TEXT NOT NULL,
+    implementation TEXT,
+    platform TEXT,
+    seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    distribution TEXT NOT NULL,
+    reverse INTEGER NOT NULL DEFAULT 0,
+    repeats INTEGER,
+    min_s REAL,
+    median_s REAL NOT NULL,
+    p95_s REAL,
+    mean_s REAL,
+    stddev_s REAL,
+    ci95_low_s REAL,
+    ci95_high_s REAL,
+    max_s REAL
+);
+CREATE INDEX IF NOT EXISTS results_run ON results(run_id);
+CREATE TABLE IF NOT EXISTS baselines (
+    name TEXT PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE
+);
+"""
+
+RESULT_FIELDS = ["algorithm", "size", "distribution", "reverse", "repeats", "min_s", "median_s",
+                 "p95_s", "mean_s", "stddev_s", "ci95_low_s", "ci95_high_s", "max_s"]
+
+
+def machine_fingerprint() -> str:
+    """Short stable hash of the hardware/OS/interpreter a run was measured on"""
+    parts = [
+        platform.node(),
+        platform.system(),
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count()),
+        platform.python_implementation(),
+        platform.python_version(),
+    ]
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class Comparison:
+    """One (algorithm, size, distribution, order) cell of a baseline comparison"""
+
+    def __init__(self, key: tuple, baseline: Dict, candidate: Dict, threshold: float):
+        self.key = key
+        self.baseline = baseline
+        self.candidate = candidate
+        self.ratio = candidate["median_s"] / baseline["median_s"] if baseline["median_s"] else float("inf")
+        # A change only counts once it exceeds the threshold and the 95% CIs do not overlap
+        separated = True
+        if None not in (baseline.get("ci95_high_s"), candidate.get("ci95_low_s"),
+                        baseline.get("ci95_low_s"), candidate.get("ci95_high_s")):
+            separated = (candidate["ci95_low_s"] > baseline["ci95_high_s"]
+                         or candidate["ci95_high_s"] < baseline["ci95_low_s"])
+        if self.ratio > 1 + threshold and separated:
+            self.status = "regression"
+        elif self.ratio < 1 - threshold and separated:
+            self.status = "improvement"
+        else:
+            self.status = "ok"
+
+    def describe(self) -> str:
+        algorithm, size, distribution, reverse = self.key
+        order = "desc" if reverse else "asc"
+        return (f"{algorithm:<16} {distribution:<14} {size:>10,} {order:<4} "
+                f"{self.baseline['median_s']:.6f}s -> {self.candidate['median_s']:.6f}s "
+                f"({(self.ratio - 1) * 100:+.1f}%) {self.status.upper()}")
+
+
+class HistoryStore:
+    """Benchmark runs kept in one SQLite file"""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def save_run(self, results: Sequence[Dict], label: str = "", source: str = "bench",
+                 seed: Optional[int] = None) -> int:
+        """Store one benchmark run (result dicts as produced by labkit.bench); returns its id"""
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (created_at, label, source, machine, fingerprint, python, "
+                "implementation, platform, seed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (datetime.now(timezone.utc).isoformat(timespec="seconds"), label, source,
+                 platform.machine(), machine_fingerprint(), platform.python_version(),
+                 platform.python_implementation(), platform.platform(), seed)
+            )
+            run_id = cur.lastrowid
+            self.conn.executemany(
+                f"INSERT INTO results (run_id, {', '.join(RESULT_FIELDS)}) "
+                f"VALUES (?, {', '.join('?' * len(RESULT_FIELDS))})",
+                [(run_id, *(self._field(r, name) for name in RESULT_FIELDS)) for r in results]
+            )
+        return run_id
+
+    @staticmethod
+    def _field(result: Dict, name: str):
+        if name == "repeats":
+            return result.get("repeats", result.get("repeat"))
+        if name == "reverse":
+            return int(bool(result.get("reverse", False)))
+        if name == "distribution":
+            return result.get("distribution", "uniform")
+        return result.get(name)
+
+    def runs(self, limit: Optional[int] = None) -> List[sqlite3.Row]:
+        sql = ("SELECT runs.*, COUNT(results.run_id) AS result_count FROM runs "
+               "LEFT JOIN results ON results.run_id = runs.id GROUP BY runs.id ORDER BY runs.id DESC")
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self.conn.execute(sql).fetchall()
+
+    def run(self, run_id: int) -> Optional[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+
+    def latest_run_id(self) -> Optional[int]:
+        row = self.conn.execute("SELECT MAX(id) FROM runs").fetchone()
+        return row[0]
+
+    def results(self, run_id: int) -> List[Dict]:
+        rows = self.conn.execute("SELECT * FROM results WHERE run_id = ? ORDER BY algorithm, distribution, size",
+                                 (run_id,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def set_baseline(self, run_id: int, name: str = DEFAULT_BASELINE):
+        if self.run(run_id) is None:
+            raise ValueError(f"No run with id {run_id}")
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO baselines (name, run_id) VALUES (?, ?)", (name, run_id))
+
+    def baseline(self, name: str = DEFAULT_BASELINE) -> Optional[int]:
+        row = self.conn.execute("SELECT run_id FROM baselines WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def compare(self, baseline_id: int, candidate_id: int, threshold: float = 0.10) -> List[Comparison]:
+        """Compare every cell present in both runs"""
+        def keyed(run_id):
+            return {(r["algorithm"], r["size"], r["distribution"], bool(r["reverse"])): r
+                    for r in self.results(run_id)}
+        base, cand = keyed(baseline_id), keyed(candidate_id)
+        return [Comparison(key, base[key], cand[key], threshold) for key in base if key in cand]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Browse benchmark history and check for regressions")
+    parser.add_argument("--db", default=DEFAULT_PATH, help=f"history database (default: {DEFAULT_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = sub.add_parser("list", help="show saved runs")
+    list_cmd.add_argument("--limit", type=int, default=20)
+
+    show_cmd = sub.add_parser("show", help="show the results of one run")
+    show_cmd.add_argument("run_id", type=int)
+
+    base_cmd = sub.add_parser("baseline", help="mark a run as a named baseline")
+    base_cmd.add_argument("run_id", type=int)
+    base_cmd.add_argument("--name", default=DEFAULT_BASELINE)
+
+    cmp_cmd = sub.add_parser("compare", help="compare a run against a baseline")
+    cmp_cmd.add_argument("--baseline", default=DEFAULT_BASELINE,
+                         help="baseline name or run id (default: 'default')")
+    cmp_cmd.add_argument("--run", type=int, help="run to check (default: latest)")
+    cmp_cmd.add_argument("--threshold", type=float, default=0.10,
+                         help="relative slowdown that counts as a regression (default: 0.10)")
+    cmp_cmd.add_argument("--allow-other-machine", action="store_true",
+                         help="compare even if the machine fingerprints differ")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    with HistoryStore(args.db) as store:
+        if args.command == "list":
+            for row in store.runs(args.limit):
+                print(f"#{row['id']:<5} {row['created_at']}  {row['source']:<6} {row['fingerprint']}  "
+                      f"Python {row['python']:<8} {row['result_count']:>4} results  {row['label'] or ''}")
+            return 0
+
+        if args.command == "show":
+            for r in store.results(args.run_id):
+                print(f"{r['algorithm']:<16} {r['distribution']:<14} {r['size']:>10,}  median {r['median_s']:.6f}s")
+            return 0
+
+        if args.command == "baseline":
+            try:
+                store.set_baseline(args.run_id, args.name)
+            except ValueError as e:
+                parser.error(str(e))
+            print(f"Baseline '{args.name}' -> run #{args.run_id}")
+            return 0
+
+        baseline_id = int(args.baseline) if args.baseline.isdigit() else store.baseline(args.baseline)
+        candidate_id = args.run or store.latest_run_id()
+        if baseline_id is None or store.run(baseline_id) is None:
+            parser.error(f"Unknown baseline '{args.baseline}' (set one with: baseline <run_id>)")
+        if candidate_id is None or store.run(candidate_id) is None:
+            parser.error("No run to compare")
+
+        base_run, cand_run = store.run(baseline_id), store.run(candidate_id)
+        if base_run["fingerprint"] != cand_run["fingerprint"] and not args.allow_other_machine:
+            parser.error(f"Run #{candidate_id} was measured on a different machine/Python than baseline "
+                         f"#{baseline_id} ({cand_run['fingerprint']} vs {base_run['fingerprint']}); "
+                         "use --allow-other-machine to compare anyway")
+
+        comparisons = store.compare(baseline_id, candidate_id, args.threshold)
+        if not comparisons:
+            parser.error(f"Runs #{baseline_id} and #{candidate_id} have no results in common")
+        print(f"Run #{candidate_id} vs baseline #{baseline_id} (threshold {args.threshold:.0%})")
+        for comparison in comparisons:
+            print(comparison.describe())
+        regressions = [c for c in comparisons if c.status == "regression"]
+        print(f"{len(regressions)} regression(s) in {len(comparisons)} comparisons")
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""Run a sort in a child process, with shared-memory data and hard stop
+
+A sort on a worker thread holds the GIL for the whole run, so Tk redraws
+and clicks crawl, and Stop only works when the algorithm next polls
+stop_cb. ``IsolatedSort`` moves the algorithm into its own process:
+
+- the input is written once into a ``SharedMemory`` block (a packed int64
+  or float64 array when the values allow it, a pickle otherwise; an int64
+  or float64 ``array``/``memoryview`` is copied straight from its buffer)
+  and the child writes the sorted output into a block of its own;
+- progress and timer callbacks are streamed back over a ``Pipe``;
+- stop terminates the child immediately instead of waiting for a poll.
+
+Timing happens inside the child (``labkit.timing.measure``), so process
+start-up and data transfer are never part of a measurement. A child can be
+pinned to one CPU (Linux) so concurrent runs (``run_concurrently``) do not
+migrate between cores and disturb each other's timings.
+
+``run_isolated`` is a drop-in for ``timed(ALGORITHMS[name], values, ...)``:
+
+    sorted_values, seconds = run_isolated("Merge Sort", values,
+                                          stop_cb=lambda: not self.is_sorting)
+"""
+
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from array import array
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from labkit.progress import work_total
+from labkit.sorting import ALGORITHMS, OpCounters
+from labkit.timing import TimingStats, measure
+
+# spawn, not fork: the GUIs call this from worker threads, and a forked child
+# can inherit a lock another thread was holding (e.g. the resource tracker's)
+_CONTEXT = multiprocessing.get_context("spawn")
+
+POLL_INTERVAL = 0.05   # seconds between stop checks while waiting for the child
+TIMER_INTERVAL = 0.05  # the child sends at most one timer update per interval
+
+
+def pack(values: Sequence) -> Tuple[str, bytes]:
+    """(kind, payload) for values: 'q'/'d' packed arrays for plain ints/floats, else 'pickle'
+
+    For an array or memoryview that is already int64/float64 the payload is
+    a byte view of its buffer, not a copy.
+    """
+    if isinstance(values, (array, memoryview)):
+        view = memoryview(values)
+        if view.format in ("q", "d") and view.c_contiguous:
+            return view.format, view.cast("B")
+    for typecode, kind in (("q", int), ("d", float)):
+        if all(type(v) is kind for v in values):
+            try:
+                return typecode, array(typecode, values).tobytes()
+            except OverflowError:
+                break  # ints beyond 64 bits
+    if not isinstance(values, list):
+        values = list(values)
+    return "pickle", pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def unpack(kind: str, buffer, as_list: bool = True) -> Sequence:
+    """Values packed by pack; packed numbers stay an array (8 bytes each) unless as_list"""
+    if kind == "pickle":
+        return pickle.loads(buffer)
+    values = array(kind)
+    values.frombytes(buffer)
+    return values.tolist() if as_list else values
+
+
+def _to_shared(payload: bytes) -> shared_memory.SharedMemory:
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(payload)))
+    block.buf[:len(payload)] = payload
+    return block
+
+
+def spread_cpus(count: int) -> List[Optional[int]]:
+    """A distinct CPU for each of count processes, keeping one free for the GUI when possible
+
+    None entries mean "not pinned": the platform has no sched_setaffinity
+    or there are fewer CPUs than processes.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return [None] * count
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) > count:
+        return cpus[1:count + 1]
+    if len(cpus) == count:
+        return cpus
+    return [None] * count
+
+
+def _child(conn, algorithm: str, block_name: str, kind: str, size: int, reverse: bool,
+           repeats: int, count_ops: bool, want_progress: bool, want_timer: bool, cpu: Optional[int]):
+    """Child process: sort the shared input, send the output block's name back, wait for the ack"""
+    try:
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        block = shared_memory.SharedMemory(name=block_name)
+        try:
+            with block.buf[:size] as view:
+                # measure hands the algorithm a fresh list per run, so the input can stay packed
+                values = unpack(kind, view, as_list=False)
+        finally:
+            block.close()
+
+        last_timer = [0.0]
+
+        def timer_cb(elapsed):
+            # elapsed restarts with every repetition
+            if elapsed < last_timer[0] or elapsed - last_timer[0] >= TIMER_INTERVAL:
+                last_timer[0] = elapsed
+                conn.send(("timer", elapsed))
+
+        def progress_cb(done, total):
+            conn.send(("progress", done, total))
+
+        counters = OpCounters() if count_ops else None
+        # the progress total needs a pass over the input; do it before the timing starts
+        total = work_total(algorithm, values, reverse) if want_progress else None
+        stats, result = measure(
+            lambda data: ALGORITHMS[algorithm](
+                data,
+                timer_cb=timer_cb if want_timer else None,
+                progress_cb=progress_cb if want_progress else None,
+                reverse=reverse,
+                counters=counters,
+                work_total=total
+            ),
+            values,
+            repeats
+        )
+
+        out_kind, payload = pack(result)
+        out = _to_shared(payload)
+        try:
+            conn.send(("done", out.name, out_kind, len(payload), stats.samples_ns,
+                       vars(counters) if counters is not None else None))
+            # keep the block open until the parent has read it (Windows frees it on last close)
+            conn.recv()
+        finally:
+            out.close()
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class IsolatedResult:
+    """Output and timings of one child-process run"""
+
+    def __init__(self, values: List, stats: TimingStats, counters: Optional[OpCounters]):
+        self.values = values
+        self.stats = stats
+        self.counters = counters
+
+    @property
+    def seconds(self) -> float:
+        return self.stats.median
+
+
+class IsolatedSort:
+    """One algorithm over one dataset in a child process"""
+
+    def __init__(self, algorithm: str, values: Sequence, reverse: bool = False,
+                 repeats: int = 1, count_ops: bool = False, cpu: Optional[int] = None,
+                 as_array: bool = False):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm '{algorithm}'")
+        self.algorithm = algorithm
+        self.values = values
+        self.reverse = reverse
+        self.repeats = max(1, repeats)
+        self.count_ops = count_ops
+        self.cpu = cpu  # pin the child to this CPU (see spread_cpus)
+        self.as_array = as_array  # sorted numbers come back as an array instead of a list
+        self.process: Optional[multiprocessing.Process] = None
+        self.stopped = False
+        self.timed_out = False
+
+    def run(self, timer_cb: Optional[Callable[[float], None]] = None,
+            progress_cb: Optional[Callable[[int, int], None]] = None,
+            stop_cb: Optional[Callable[[], bool]] = None,
+            timeout: Optional[float] = None) -> Optional[IsolatedResult]:
+        """Sort in the child and wait for it (call from a worker thread)
+
+        Returns None if stopped, or if the child ran longer than timeout
+        seconds (then timed_out is set). The callbacks run on the calling
+        thread as the child's messages arrive.
+        """
+        kind, payload = pack(self.values)
+        block = _to_shared(payload)
+        parent_conn, child_conn = _CONTEXT.Pipe()
+        try:
+            self.process = _CONTEXT.Process(
+                target=_child,
+                args=(child_conn, self.algorithm, block.name, kind, len(payload), self.reverse,
+                      self.repeats, self.count_ops, progress_cb is not None, timer_cb is not None,
+                      self.cpu),
+                daemon=True
+            )
+            self.process.start()
+            child_conn.close()
+            return self._wait(parent_conn, timer_cb, progress_cb, stop_cb,
+                              None if timeout is None else time.perf_counter() + timeout)
+        finally:
+            if self.process is not None:
+                # a finished child exits on its own once it has the ack
+                self.process.join(None if self.stopped else 1.0)
+                if self.process.is_alive():
+                    self.process.terminate()
+                    self.process.join()
+            parent_conn.close()
+            block.close()
+            block.unlink()
+
+    def _wait(self, conn, timer_cb, progress_cb, stop_cb, deadline) -> Optional[IsolatedResult]:
+        while True:
+            if self.stopped or (stop_cb and stop_cb()):
+                self.terminate()
+                return None
+            if deadline is not None and time.perf_counter() > deadline:
+                self.timed_out = True
+                self.terminate()
+                return None
+            if not conn.poll(POLL_INTERVAL):
+                if not self.process.is_alive() and not conn.poll():
+                    raise RuntimeError(f"{self.algorithm} process exited with code {self.process.exitcode}")
+                continue
+            try:
+                message = conn.recv()
+            except EOFError:
+                raise RuntimeError(f"{self.algorithm} process exited with code {self.process.exitcode}")
+            tag = message[0]
+            if tag == "progress" and progress_cb:
+                progress_cb(message[1], message[2])
+            elif tag == "timer" and timer_cb:
+                timer_cb(message[1])
+            elif tag == "error":
+                raise RuntimeError(message[1])
+            elif tag == "done":
+                return self._collect(conn, *message[1:])
+
+    def _collect(self, conn, name, kind, size, samples_ns, counter_state) -> IsolatedResult:
+        out = shared_memory.SharedMemory(name=name)
+        try:
+            with out.buf[:size] as view:
+                values = unpack(kind, view, as_list=not self.as_array)
+        finally:
+            out.close()
+            out.unlink()
+            conn.send("ack")
+        counters = None
+        if counter_state is not None:
+            counters = OpCounters()
+            vars(counters).update(counter_state)
+        return IsolatedResult(values, TimingStats(samples_ns), counters)
+
+    def terminate(self):
+        """Kill the child now; safe to call from any thread"""
+        self.stopped = True
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+
+
+def run_isolated(algorithm: str, values: Sequence,
+                 timer_cb: Optional[Callable[[float], None]] = None,
+                 stop_cb: Optional[Callable[[], bool]] = None,
+                 progress_cb: Optional[Callable[[int, int], None]] = None,
+                 reverse: bool = False,
+                 counters: Optional[OpCounters] = None,
+                 as_array: bool = False) -> Tuple[List, float]:
+    """Like timed(ALGORITHMS[algorithm], values, ...), but in a child process.
+
+    Returns (sorted copy, seconds). A stopped run returns (unsorted copy,
+    seconds until the stop). counters, if given, receives the child's counts.
+    With as_array, sorted ints or floats come back as a packed array.
+    """
+    started = time.perf_counter()
+    job = IsolatedSort(algorithm, values, reverse, count_ops=counters is not None, as_array=as_array)
+    result = job.run(timer_cb, progress_cb, stop_cb)
+    if result is None:
+        return list(values), time.perf_counter() - started
+    if counters is not None and result.counters is not None:
+        vars(counters).update(vars(result.counters))
+    return result.values, result.seconds
+
+
+def run_concurrently(jobs: Dict, progress_cb: Optional[Callable[[object, int, int], None]] = None,
+                     done_cb: Optional[Callable[[object, IsolatedResult], None]] = None,
+                     stop_cb: Optional[Callable[[], bool]] = None,
+                     workers: Optional[int] = None, timeout: Optional[float] = None) -> Dict:
+    """Run the jobs' child processes at the same time and wait for all of them.
+
+    At most workers children run at once (default: all of them), each for
+    at most timeout seconds. progress_cb(name, done, total) and
+    done_cb(name, result) are called from one waiting thread per job, as
+    each child reports or finishes. Returns {name: result, or None if
+    stopped or timed out (see job.timed_out)}; the first error is raised
+    once every job has ended.
+    """
+    results: Dict = {}
+    errors: List[Exception] = []
+    slots = threading.Semaphore(workers or len(jobs) or 1)
+
+    def wait(name, job: IsolatedSort):
+        try:
+            progress = (lambda done, total: progress_cb(name, done, total)) if progress_cb else None
+            with slots:
+                if job.stopped or (stop_cb and stop_cb()):
+                    results[name] = None  # stopped while waiting for a free slot
+                else:
+                    results[name] = job.run(progress_cb=progress, stop_cb=stop_cb, timeout=timeout)
+            if results[name] is not None and done_cb:
+                done_cb(name, results[name])
+        except Exception as e:
+            errors.append(e)
+            for other in jobs.values():
+                other.terminate()
+
+    threads = [threading.Thread(target=wait, args=item, daemon=True) for item in jobs.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
@@ -0,0 +1,104 @@
+"""Per-stage memory profiling with tracemalloc
+
+Wrap each stage of a run in ``profile.stage(name)`` to record its peak (the
+most memory the stage had allocated at once, above where it started) and
+retained bytes (what it still holds when it ends). tracemalloc slows Python
+allocations noticeably, so times measured while profiling are not
+comparable with normal runs. Only the current process is traced.
+
+    with MemoryProfile() as profile:
+        with profile.stage("Load"):
+            rows = load(...)
+        with profile.stage("Sort"):
+            result = sort(rows)
+    print("\\n".join(profile.report_lines()))
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+def format_bytes(n: float) -> str:
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{sign}{n:.0f} {unit}" if unit == "B" else f"{sign}{n:.1f} {unit}"
+        n /= 1024
+    return f"{sign}{n:.2f} GB"
+
+
+class StageMemory:
+    """Memory used by one profiled stage, in bytes"""
+
+    def __init__(self, name: str, peak_bytes: int, retained_bytes: int, seconds: float):
+        self.name = name
+        self.peak_bytes = peak_bytes
+        self.retained_bytes = retained_bytes
+        self.seconds = seconds
+
+    def as_dict(self) -> Dict:
+        return {"stage": self.name, "peak_bytes": self.peak_bytes,
+                "retained_bytes": self.retained_bytes, "seconds": self.seconds}
+
+
+class MemoryProfile:
+    """Collects StageMemory records; tracing runs while the profile is entered"""
+
+    def __init__(self):
+        self.stages: List[StageMemory] = []
+        self._depth = 0
+        self._started_tracing = False
+
+    def __enter__(self) -> "MemoryProfile":
+        if self._depth == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0 and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str):
+        with self:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                elapsed = time.perf_counter() - start
+                current, peak = tracemalloc.get_traced_memory()
+                self.stages.append(StageMemory(name, peak - before, current - before, elapsed))
+
+    def add(self, stage: Optional[StageMemory]):
+        """Include a stage measured earlier (e.g. the load that preceded this run)"""
+        if stage is not None:
+            self.stages.insert(0, stage)
+
+    @property
+    def peak_bytes(self) -> int:
+        return max((s.peak_bytes for s in self.stages), default=0)
+
+    def report_lines(self) -> List[str]:
+        lines = [f"{'Stage':<22} {'Peak':>12} {'Retained':>12} {'Time':>10}"]
+        lines.append("-" * 60)
+        for s in self.stages:
+            lines.append(f"{s.name:<22} {format_bytes(s.peak_bytes):>12} "
+                         f"{format_bytes(s.retained_bytes):>12} {s.seconds:>9.4f}s")
+        return lines
+
+
+def profile_call(name: str, func, *args, **kwargs):
+    """Run func under a one-stage profile; returns (result, StageMemory)"""
+    with MemoryProfile() as profile:
+        with profile.stage(name):
+            result = func(*args, **kwargs)
+    return result, profile.stages[0]
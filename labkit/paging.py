@@ -0,0 +1,174 @@
+"""Paged, lazily formatted report sections for very large results
+
+``PagedLines`` formats records on demand: only the page being shown (or the
+record a search is looking at) is ever turned into a string, so a report
+over a million results never builds a million lines.
+
+``TextPager`` keeps the current page in one region of a Tk ``Text`` widget
+and swaps it when the page changes. It only calls Text methods (insert,
+delete, index, tag_*, mark_*, see), so this module does not import Tk.
+"""
+
+from typing import Callable, Iterator, List, Optional, Sequence
+
+PAGE_SIZE = 500
+
+
+class PagedLines:
+    """Records split into pages, formatted one page at a time"""
+
+    def __init__(self, records: Sequence, formatter: Callable[[int, object], str] = None,
+                 page_size: int = PAGE_SIZE):
+        self.records = records
+        self.formatter = formatter or (lambda index, record: str(record))
+        self.page_size = max(1, page_size)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.records) // self.page_size))
+
+    def page_of(self, index: int) -> int:
+        return min(max(0, index), max(0, len(self.records) - 1)) // self.page_size
+
+    def bounds(self, page: int) -> range:
+        start = page * self.page_size
+        return range(start, min(len(self.records), start + self.page_size))
+
+    def lines(self, page: int) -> List[str]:
+        return [self.formatter(i, self.records[i]) for i in self.bounds(page)]
+
+    def iter_lines(self) -> Iterator[str]:
+        """Every formatted line, one at a time (for exports)"""
+        for i, record in enumerate(self.records):
+            yield self.formatter(i, record)
+
+    def find(self, needle: str, start: int = 0, forward: bool = True) -> int:
+        """Index of the next record whose line contains needle (case-insensitive), wrapping; -1 if none"""
+        total = len(self.records)
+        if not needle or not total:
+            return -1
+        needle = needle.lower()
+        step = 1 if forward else -1
+        for offset in range(total):
+            i = (start + offset * step) % total
+            if needle in self.formatter(i, self.records[i]).lower():
+                return i
+        return -1
+
+
+class TextPager:
+    """Shows one page of a PagedLines inside a Text widget, in place"""
+
+    TAG = "pager_page"
+    HIT_TAG = "pager_hit"
+    MARK = "pager_start"
+
+    def __init__(self, text, on_change: Optional[Callable[[str], None]] = None):
+        self.text = text
+        self.on_change = on_change  # gets status() whenever the page changes
+        self.paged: Optional[PagedLines] = None
+        self.page = 0
+        self.hit = -1
+        self._shown = False  # whether the current page put any text in the widget
+        text.tag_configure(self.HIT_TAG, background="#FFE066")
+
+    def attach(self, paged: PagedLines, at: str = "end-1c"):
+        """Start a paged section at index at (default: the end of the text)"""
+        self.paged = paged
+        self.hit = -1
+        self._shown = False
+        self.text.mark_set(self.MARK, at)
+        self.text.mark_gravity(self.MARK, "left")
+        self.show(0)
+
+    def detach(self):
+        self.paged = None
+        self._changed()
+
+    @property
+    def attached(self) -> bool:
+        return self.paged is not None
+
+    def _region(self):
+        ranges = self.text.tag_ranges(self.TAG)
+        return (ranges[0], ranges[-1]) if ranges else None
+
+    def show(self, page: int) -> bool:
+        """Replace the shown page; False if nothing is attached"""
+        if self.paged is None:
+            return False
+        region = self._region()
+        if region is None and self._shown:
+            # the section was deleted together with the rest of the text
+            self.detach()
+            return False
+        page = min(max(0, page), self.paged.page_count - 1)
+        if region is not None:
+            self.text.delete(*region)
+        lines = self.paged.lines(page)
+        if lines:
+            self.text.insert(self.MARK, "\n".join(lines) + "\n", self.TAG)
+        self.page = page
+        self._shown = bool(lines)
+        self._highlight()
+        self._changed()
+        return True
+
+    def next_page(self):
+        self.show(self.page + 1)
+
+    def prev_page(self):
+        self.show(self.page - 1)
+
+    def jump_to(self, index: int) -> bool:
+        """Show the page holding record index (0-based) and highlight it"""
+        if self.paged is None or not len(self.paged):
+            return False
+        self.hit = min(max(0, index), len(self.paged) - 1)
+        return self.show(self.paged.page_of(self.hit))
+
+    def find(self, needle: str, forward: bool = True) -> int:
+        """Jump to the next record matching needle after the current hit; -1 if none"""
+        if self.paged is None:
+            return -1
+        start = self.hit + (1 if forward else -1) if self.hit >= 0 else self.paged.bounds(self.page).start
+        index = self.paged.find(needle, start, forward)
+        if index >= 0:
+            self.jump_to(index)
+        return index
+
+    def _highlight(self):
+        self.text.tag_remove(self.HIT_TAG, "1.0", "end")
+        if self.hit < 0 or self.hit not in self.paged.bounds(self.page):
+            return
+        first_line = int(str(self.text.index(self.MARK)).split(".")[0])
+        line = first_line + self.hit - self.paged.bounds(self.page).start
+        self.text.tag_add(self.HIT_TAG, f"{line}.0", f"{line}.end")
+        self.text.see(f"{line}.0")
+
+    def status(self) -> str:
+        if self.paged is None:
+            return "No records"
+        shown = self.paged.bounds(self.page)
+        if not shown:
+            return "No records"
+        return (f"Page {self.page + 1:,} / {self.paged.page_count:,} · "
+                f"#{shown.start + 1:,}–{shown.stop:,} of {len(self.paged):,}")
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change(self.status())
+
+    def export_chunks(self) -> Iterator[str]:
+        """The whole text with every page expanded, as chunks to write out"""
+        region = self._region() if self.paged is not None else None
+        if region is None:
+            yield self.text.get("1.0", "end-1c")
+            return
+        yield self.text.get("1.0", region[0])
+        for line in self.paged.iter_lines():
+            yield line + "\n"
+        yield self.text.get(region[1], "end-1c")
@@ -0,0 +1,170 @@
+"""Opt-in CPU profiling around one run of a lab
+
+Two modes:
+
+- ``cProfile``: deterministic, every call is recorded. Writes a ``.pstats``
+  file (``python -m pstats file``, snakeviz, or gprof2dot/flameprof for a
+  flame graph).
+- ``Sampling``: a background thread samples the profiled thread's stack
+  every few milliseconds, so overhead stays low. Writes a ``.folded`` file
+  of collapsed stacks (``a;b;c count``), the input format of flamegraph.pl
+  and speedscope.
+
+Both profile only the thread that calls ``start()`` (or enters the
+``with`` block), which is the worker thread for the threaded runs.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+
+MODES = ("Off", "cProfile", "Sampling")
+TOP_N = 15
+SAMPLE_INTERVAL = 0.005
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class RunProfiler:
+    """Profiles the calling thread between start() and stop()"""
+
+    def __init__(self, mode: str = "cProfile", out_dir: str = ".", label: str = "run",
+                 top: int = TOP_N, interval: float = SAMPLE_INTERVAL):
+        if mode not in MODES[1:]:
+            raise ValueError(f"Unknown profiler mode '{mode}' (choose from {', '.join(MODES[1:])})")
+        self.mode = mode
+        self.out_dir = out_dir
+        self.label = label
+        self.top = top
+        self.interval = interval
+        self.path: Optional[str] = None
+        self.summary: List[str] = []
+        self.elapsed = 0.0
+        self.running = False
+        self._profiler = None
+        self._sampler = None
+        self._samples: Counter = Counter()
+        self._halt = threading.Event()
+        self._paused = threading.Event()
+        self._paused_for = 0.0
+
+    def __enter__(self) -> "RunProfiler":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop(save=exc[0] is None)
+
+    def start(self) -> "RunProfiler":
+        self.running = True
+        self._start = time.perf_counter()
+        if self.mode == "cProfile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._target = threading.get_ident()
+            self._halt.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+            self._sampler.start()
+        return self
+
+    def stop(self, save: bool = True) -> Optional[str]:
+        """Stop profiling; when save is set, write the profile and build the summary"""
+        if not self.running:
+            return self.path
+        self.running = False
+        self.elapsed = time.perf_counter() - self._start - self._paused_for
+        if self.mode == "cProfile":
+            self._profiler.disable()
+        else:
+            self._halt.set()
+            self._sampler.join()
+        if save:
+            os.makedirs(self.out_dir, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            if self.mode == "cProfile":
+                self.path = os.path.join(self.out_dir, f"{self.label}-{stamp}.pstats")
+                self._profiler.dump_stats(self.path)
+                self.summary = self._cprofile_summary()
+            else:
+                self.path = os.path.join(self.out_dir, f"{self.label}-{stamp}.folded")
+                with open(self.path, "w", encoding="utf-8") as f:
+                    for stack, count in self._samples.most_common():
+                        f.write(f"{stack} {count}\n")
+                self.summary = self._sampling_summary()
+        return self.path
+
+    @contextmanager
+    def paused(self):
+        """Leave a block (e.g. a modal dialog) out of the profile"""
+        if not self.running:
+            yield
+            return
+        start = time.perf_counter()
+        if self.mode == "cProfile":
+            self._profiler.disable()
+        self._paused.set()
+        try:
+            yield
+        finally:
+            self._paused.clear()
+            if self.mode == "cProfile":
+                self._profiler.enable()
+            self._paused_for += time.perf_counter() - start
+
+    # ---------- sampling ----------
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while not self._halt.wait(self.interval):
+            if self._paused.is_set():
+                continue
+            frame = sys._current_frames().get(self._target)
+            if frame is None or self._target == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            self._samples[";".join(reversed(stack))] += 1
+
+    def _sampling_summary(self) -> List[str]:
+        total = sum(self._samples.values())
+        if not total:
+            return [f"Sampling profile: no samples in {self.elapsed:.3f}s (run too short)"]
+        own, inclusive = Counter(), Counter()
+        for stack, count in self._samples.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+        lines = [f"Sampling profile: {total:,} samples every {self.interval * 1000:.0f} ms over {self.elapsed:.3f}s",
+                 f"{'Self %':>7} {'Total %':>8}  Function"]
+        for name, count in own.most_common(self.top):
+            lines.append(f"{count / total * 100:>6.1f}% {inclusive[name] / total * 100:>7.1f}%  {name}")
+        return lines
+
+    # ---------- cProfile ----------
+    def _cprofile_summary(self) -> List[str]:
+        stats = pstats.Stats(self._profiler)
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+        lines = [f"cProfile: {stats.total_calls:,} calls in {self.elapsed:.3f}s (profiling overhead included)",
+                 f"{'Self (ms)':>10} {'Cum (ms)':>10} {'Calls':>10}  Function"]
+        for (filename, line, name), (cc, nc, tt, ct, callers) in entries[:self.top]:
+            where = f" ({os.path.basename(filename)}:{line})" if line else ""
+            lines.append(f"{tt * 1000:>10.1f} {ct * 1000:>10.1f} {nc:>10,}  {name}{where}")
+        return lines
+
+
+def make_profiler(mode: str, out_dir: str, label: str) -> Optional[RunProfiler]:
+    """RunProfiler for a GUI mode selection, or None when mode is 'Off'"""
+    if not mode or mode == "Off":
+        return None
+    return RunProfiler(mode, out_dir, label)
@@ -0,0 +1,159 @@
+"""Work-unit progress model and ETA estimate for the sorting algorithms
+
+Reporting the outer-loop index makes O(n²) progress bars lie: the first
+half of bubble sort's passes does three quarters of its comparisons. The
+sorts instead report ``progress_cb(done, total)`` in work units whose total
+is known before the sort starts:
+
+- bubble sort: comparisons. The number of passes that swap is the largest
+  number of larger elements to the left of any element, so the total
+  includes the final swap-free pass and stops there;
+- insertion sort: one unit per element shifted plus one per element
+  placed, i.e. inversions + n - 1;
+- merge sort: elements written by the merges, exact for the midpoint
+  split used by the sorts.
+
+The bubble and insertion totals need one O(n log n) counting pass
+(``inversion_profile``), which only runs when a progress callback is set.
+Timed callers compute it first with ``work_total`` and hand it to the sort
+as ``work_total=``, keeping the pass (about 0.4 s at 100k) out of the timing.
+
+``ProgressEta`` turns the reports into a percent and time remaining:
+
+    eta = ProgressEta()
+    def progress_cb(done, total):
+        eta.update(done, total)
+        status.set(f"Sorting... {eta.describe()}")
+"""
+
+import time
+from functools import lru_cache
+from typing import Callable, Optional, Sequence, Tuple
+
+from labkit.complexity import format_duration
+
+REPORTS = 100          # progress reports per run (one per 1% of the work)
+ETA_WARMUP = 0.25      # seconds of data before a time remaining is shown
+ETA_SMOOTHING = 0.2    # weight of the newest rate sample
+
+
+def inversion_profile(values: Sequence, reverse: bool = False) -> Tuple[int, int]:
+    """(inversions, most inversions of any one element) for a sort in the given order
+
+    An inversion is a pair that is out of order (strictly greater before
+    smaller for ascending, strictly smaller before greater for descending),
+    counted with a Fenwick tree over the ranks of the values.
+    """
+    ranks = {value: rank for rank, value in enumerate(sorted(set(values)), 1)}
+    size = len(ranks)
+    tree = [0] * (size + 1)
+    inversions = worst = 0
+    for seen, value in enumerate(values):
+        rank = ranks[value]
+        if reverse:
+            rank = size + 1 - rank
+        not_after = 0  # earlier values ranked at or below this one
+        k = rank
+        while k:
+            not_after += tree[k]
+            k &= k - 1
+        before = seen - not_after
+        inversions += before
+        if before > worst:
+            worst = before
+        k = rank
+        while k <= size:
+            tree[k] += 1
+            k += k & -k
+    return inversions, worst
+
+
+def bubble_work(values: Sequence, reverse: bool = False) -> int:
+    """Comparisons bubble sort makes on values, including its last swap-free pass"""
+    n = len(values)
+    if n < 2:
+        return 0
+    _, passes = inversion_profile(values, reverse)  # passes that swap something
+    passes = min(n, passes + 1)
+    return passes * (n - 1) - passes * (passes - 1) // 2
+
+
+def insertion_work(values: Sequence, reverse: bool = False) -> int:
+    """Shifts plus placements insertion sort makes on values"""
+    n = len(values)
+    if n < 2:
+        return 0
+    inversions, _ = inversion_profile(values, reverse)
+    return inversions + n - 1
+
+
+@lru_cache(maxsize=None)
+def merge_work(n: int) -> int:
+    """Elements written by all merges of a midpoint-split merge sort over n items"""
+    if n <= 1:
+        return 0
+    mid = n // 2
+    return n + merge_work(mid) + merge_work(n - mid)
+
+
+WORK = {
+    "Bubble Sort": bubble_work,
+    "Insertion Sort": insertion_work,
+    "Merge Sort": lambda values, reverse=False: merge_work(len(values)),
+}
+
+
+def work_total(algorithm: str, values: Sequence, reverse: bool = False) -> int:
+    """Total progress units of algorithm (an ALGORITHMS name) on values"""
+    return max(1, WORK[algorithm](values, reverse))
+
+
+class ProgressEta:
+    """Percent done and a smoothed time-remaining estimate from (done, total) reports"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.done = 0
+        self.total = 0
+        self.started = self.clock()
+        self._last = (self.started, 0)
+        self.rate: Optional[float] = None  # work units per second
+
+    def update(self, done: int, total: int) -> "ProgressEta":
+        if total != self.total or done < self.done:
+            # a new run (or the next repetition) started; its first report is the baseline
+            self.reset()
+            self.total = total
+            self._last = (self.started, done)
+        now = self.clock()
+        last_time, last_done = self._last
+        if now > last_time and done > last_done:
+            sample = (done - last_done) / (now - last_time)
+            self.rate = sample if self.rate is None else (
+                ETA_SMOOTHING * sample + (1 - ETA_SMOOTHING) * self.rate)
+            self._last = (now, done)
+        self.done = done
+        return self
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None until ETA_WARMUP seconds of progress have been seen"""
+        if self.done >= self.total > 0:
+            return 0.0
+        if not self.rate or self.clock() - self.started < ETA_WARMUP:
+            return None
+        return (self.total - self.done) / self.rate
+
+    def describe(self) -> str:
+        text = f"{self.fraction * 100:.1f}%"
+        remaining = self.remaining
+        if remaining is not None and self.done < self.total:
+            text += f" · ~{format_duration(remaining)} left"
+        return text
@@ -0,0 +1,230 @@
+"""Sorted results cached by dataset content, column, algorithm and order
+
+Sorting the same data again (switching the order back, exporting again,
+reloading the same file) repeats work whose answer is already known.
+``ResultCache`` keeps every sorted output under a key made of
+
+- a content fingerprint of the input (blake2b over the packed values, so
+  two loads of the same file give the same key),
+- the column, the algorithm and the order,
+
+and evicts the least recently used results once their estimated size
+passes a memory cap. Given a directory, results are also written there as
+pickles and survive a restart; the directory has a cap of its own. Setting
+``directory`` to None later turns persistence off (the files stay).
+
+    key = cache.key(values, "values", "Merge Sort", reverse)
+    hit = cache.get(key)
+    if hit is None:
+        sorted_values, seconds = run_isolated("Merge Sort", values, reverse=reverse)
+        cache.put(key, sorted_values, seconds)
+
+Hashing is a pass over the whole input; a run that looks up several
+algorithms for the same data fingerprints it once and uses ``key_for``.
+
+A hit measures nothing, so timed benchmark runs must not read from it.
+Cached lists are shared with the caller and must not be modified.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from labkit.memprof import format_bytes
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024       # in memory
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024  # in the directory, when persisting
+SIZE_SAMPLE = 64  # values measured to estimate the size of a result
+
+
+def fingerprint(values: Sequence) -> str:
+    """Content hash of values; equal lists give equal hashes, whatever object they are"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{len(values)}:".encode())
+    if isinstance(values, (array, memoryview)) and memoryview(values).format in ("q", "d"):
+        # hashed straight from the buffer; same bytes as the packed list below
+        view = memoryview(values)
+        digest.update(view.format.encode())
+        digest.update(view.cast("B"))
+        return digest.hexdigest()
+    for typecode, kind in (("q", int), ("d", float)):
+        if all(type(v) is kind for v in values):
+            try:
+                digest.update(typecode.encode() + array(typecode, values).tobytes())
+                return digest.hexdigest()
+            except OverflowError:
+                break  # ints beyond 64 bits
+    # repr keeps 1, 1.0 and '1' apart and escapes the separator inside strings
+    digest.update("\x1f".join(map(repr, values)).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def estimate_bytes(values: Sequence) -> int:
+    """Approximate memory of a list and its items, from a sample of the items"""
+    n = len(values)
+    if not n or isinstance(values, array):
+        return sys.getsizeof(values)  # an array holds its values inline
+    sample = values[::max(1, n // SIZE_SAMPLE)][:SIZE_SAMPLE]
+    per_item = sum(sys.getsizeof(v) for v in sample) / len(sample)
+    return sys.getsizeof(values) + int(per_item * n)
+
+
+class CachedResult:
+    """A sorted output and the time its sort took when it was computed"""
+
+    def __init__(self, values: List, seconds: float, created: Optional[float] = None):
+        self.values = values
+        self.seconds = seconds
+        self.created = time.time() if created is None else created
+
+
+class ResultCache:
+    """LRU of sorted results under a memory cap, optionally persisted to a directory"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[CachedResult, int]]" = OrderedDict()
+        self._lock = threading.Lock()  # the GUIs look results up from worker threads
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(values: Sequence, column: str, algorithm: str, reverse: bool = False) -> Tuple:
+        return ResultCache.key_for(fingerprint(values), column, algorithm, reverse)
+
+    @staticmethod
+    def key_for(data_fingerprint: str, column: str, algorithm: str, reverse: bool = False) -> Tuple:
+        """key() from an already computed fingerprint of the values"""
+        return (data_fingerprint, column, algorithm, bool(reverse))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional[CachedResult]:
+        """The cached result for key (from memory, else from disk), or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        result = self._load(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, result)
+        return result
+
+    def put(self, key: Tuple, values: List, seconds: float) -> CachedResult:
+        """Cache a complete sorted output (never a stopped, partly sorted one)"""
+        result = CachedResult(values, seconds)
+        with self._lock:
+            self._remember(key, result)
+        self._save(key, result)
+        return result
+
+    def clear(self):
+        """Forget every result, in memory and on disk"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+        for path, _, _ in self._disk_files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def describe(self) -> str:
+        return (f"{len(self._entries)} cached, {format_bytes(self.bytes)} of "
+                f"{format_bytes(self.max_bytes)}; {self.hits} hits, {self.misses} misses")
+
+    def _remember(self, key: Tuple, result: CachedResult):
+        size = estimate_bytes(result.values)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self.max_bytes:
+            return  # would evict everything else; the disk copy (if any) still serves it
+        self._entries[key] = (result, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+
+    # ---------- persistence (best effort: a failed read or write is a miss) ----------
+
+    def _path(self, key: Tuple) -> str:
+        name = hashlib.blake2b(repr(key).encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + ".pickle")
+
+    def _load(self, key: Tuple) -> Optional[CachedResult]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, values, seconds, created = pickle.load(f)
+            os.utime(path)  # the directory is pruned least recently used first
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            return None
+        if stored_key != key:
+            return None
+        return CachedResult(values, seconds, created)
+
+    def _save(self, key: Tuple, result: CachedResult):
+        if not self.directory:
+            return
+        path = self._path(key)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp, "wb") as f:
+                pickle.dump((key, result.values, result.seconds, result.created), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, path)  # readers never see a half-written file
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+        self._prune_disk()
+
+    def _disk_files(self) -> List[Tuple[str, float, int]]:
+        """(path, last used, size) of every persisted result"""
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pickle"):
+                path = os.path.join(self.directory, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((path, st.st_mtime, st.st_size))
+        return files
+
+    def _prune_disk(self):
+        files = sorted(self._disk_files(), key=lambda item: item[1])
+        total = sum(size for _, _, size in files)
+        for path, _, size in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
@@ -0,0 +1,184 @@
+"""Benchmark size sweep in parallel child processes with a per-size time budget
+
+Every size of the sweep runs in its own child process (``labkit.isolated``),
+several at once. A size whose predicted time (from a quick ``probe``, itself
+run in child processes) is over the budget is not started, and a size that
+runs past the budget is terminated. Both are reported as ``TIMED_OUT`` with
+a time extrapolated from the sizes that did finish.
+
+The budget is per size and counts from the moment the size starts. With
+more sizes than workers, later sizes wait for a free slot first, so a sweep
+can take up to ceil(sizes / workers) budgets (one budget when every size
+gets a worker of its own):
+
+    fit, predicted = probe("Bubble Sort", keys[:PROBE_ROWS], sizes)
+    points = budgeted_sweep("Bubble Sort", keys, parse_sizes("1k, 10k, 100k"),
+                            budget=30, predicted=predicted)
+    for point in points.values():
+        print(point.size, point.describe())
+"""
+
+import os
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from labkit.complexity import ComplexityFit, format_duration, geometric_sizes
+from labkit.isolated import IsolatedSort, run_concurrently, spread_cpus
+from labkit.sorting import OpCounters
+
+TIMED_OUT = "timed out (extrapolated)"
+DEFAULT_BUDGET = 30.0  # seconds per size
+PROBE_ROWS = 20_000  # largest prefix the probe sorts
+_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000}
+
+
+def parse_sizes(text: str) -> List[int]:
+    """Sizes from text like "1000, 10k 1e5" (commas or spaces), sorted, without duplicates"""
+    sizes = set()
+    for part in re.split(r"[,\s]+", text.strip()):
+        if not part:
+            continue
+        match = re.fullmatch(r"(\d+(?:\.\d+)?(?:e\d+)?)([km]?)", part.lower().replace("_", ""))
+        if not match:
+            raise ValueError(f"'{part}' is not a size (use e.g. 1000, 10k or 1e5)")
+        size = int(float(match.group(1)) * _SUFFIXES[match.group(2)])
+        if size <= 0:
+            raise ValueError("Sizes must be positive")
+        sizes.add(size)
+    if not sizes:
+        raise ValueError("Enter at least one size")
+    return sorted(sizes)
+
+
+def default_workers(jobs: int) -> int:
+    """One process per size, leaving a CPU for the GUI"""
+    return max(1, min(jobs, (os.cpu_count() or 2) - 1))
+
+
+def probe_points(algorithm: str, data: Sequence, sizes: Sequence[int], reverse: bool = False,
+                 time_limit: float = 0.25, repeats: int = 1, timeout: Optional[float] = None,
+                 stop_cb: Optional[Callable[[], bool]] = None) -> Optional[List[Tuple[int, float]]]:
+    """complexity.sweep with every size sorted in a child process; None if stopped.
+
+    Times data[:size] for each size in turn (median of repeats) and ends
+    after the first size over time_limit seconds, keeping that point. A size
+    still running after timeout seconds is killed and ends the sweep
+    without a point, so one slow size cannot hold it up.
+    """
+    points = []
+    for size in sizes:
+        if size > len(data):
+            break
+        job = IsolatedSort(algorithm, data[:size], reverse, repeats)
+        run = job.run(stop_cb=stop_cb, timeout=timeout)
+        if run is None:
+            if job.timed_out:
+                break
+            return None
+        points.append((size, run.seconds))
+        if run.seconds > time_limit:
+            break
+    return points
+
+
+def probe(algorithm: str, data: Sequence, targets: Sequence[int], reverse: bool = False,
+          start: int = 250, time_limit: float = 0.25,
+          stop_cb: Optional[Callable[[], bool]] = None) -> Optional[Tuple[ComplexityFit, Dict[int, float]]]:
+    """complexity.estimate with every prefix sorted in a child process; None if stopped.
+
+    Doubles the prefix from start until one run takes time_limit seconds,
+    then extrapolates each target size. Raises ValueError when fewer than
+    two sizes could be timed.
+    """
+    points = probe_points(algorithm, data, geometric_sizes(start, min(len(data), max(targets))),
+                          reverse, time_limit, stop_cb=stop_cb)
+    if points is None:
+        return None
+    fit = ComplexityFit(points)
+    return fit, {n: fit.predict(n) for n in targets}
+
+
+class SweepPoint:
+    """Result of one size: measured seconds, or an extrapolation when it timed out"""
+
+    def __init__(self, size: int, seconds: Optional[float] = None, timed_out: bool = False,
+                 counters: Optional[OpCounters] = None, skipped: bool = False):
+        self.size = size
+        self.seconds = seconds  # None when timed out and nothing to extrapolate from
+        self.timed_out = timed_out
+        self.skipped = skipped  # predicted over budget, never started
+        self.counters = counters
+
+    def describe(self) -> str:
+        if not self.timed_out:
+            return f"{self.seconds:.4f}s"
+        estimate = f"~{format_duration(self.seconds)}" if self.seconds is not None else "unknown"
+        return f"{TIMED_OUT}: {estimate}"
+
+
+def budgeted_sweep(algorithm: str, data: Sequence, sizes: Sequence[int], budget: float = DEFAULT_BUDGET,
+                   reverse: bool = False, count_ops: bool = False, workers: Optional[int] = None,
+                   predicted: Optional[Dict[int, float]] = None,
+                   progress_cb: Optional[Callable[[float], None]] = None,
+                   done_cb: Optional[Callable[[SweepPoint], None]] = None,
+                   stop_cb: Optional[Callable[[], bool]] = None) -> Optional[Dict[int, SweepPoint]]:
+    """Time algorithm on data[:size] for every size; None if stopped.
+
+    predicted maps sizes to probe estimates; sizes predicted over budget are
+    skipped. Each size that runs gets budget seconds from its own start, so
+    with more sizes than workers the sweep can last up to
+    ceil(sizes / workers) * budget. progress_cb gets the overall fraction done (weighted by size)
+    and done_cb each measured point as it finishes (both from waiting threads).
+    """
+    sizes = [size for size in sizes if size <= len(data)]
+    predicted = predicted or {}
+    points: Dict[int, SweepPoint] = {}
+    run_sizes = []
+    for size in sizes:
+        if predicted.get(size, 0) > budget:
+            points[size] = SweepPoint(size, predicted[size], timed_out=True, skipped=True)
+        else:
+            run_sizes.append(size)
+
+    workers = workers or default_workers(len(run_sizes))
+    # pin only when every size gets a CPU of its own for the whole sweep
+    cpus = spread_cpus(len(run_sizes)) if len(run_sizes) <= workers else [None] * len(run_sizes)
+    jobs = {size: IsolatedSort(algorithm, data[:size], reverse, count_ops=count_ops, cpu=cpu)
+            for size, cpu in zip(run_sizes, cpus)}
+
+    weight = sum(sizes) or 1
+    fractions = {size: 1.0 for size in points}
+
+    def on_progress(size, done, total):
+        fractions[size] = done / total if total else 1.0
+        if progress_cb:
+            progress_cb(sum(size * f for size, f in fractions.items()) / weight)
+
+    def on_done(size, run):
+        point = points[size] = SweepPoint(size, run.seconds, counters=run.counters)
+        on_progress(size, 1, 1)
+        if done_cb:
+            done_cb(point)
+
+    # children only count progress work when asked to: the count runs before the timed
+    # sort, so it never skews a measurement, but it does use up part of the size's budget
+    results = run_concurrently(jobs, on_progress if progress_cb else None, on_done, stop_cb,
+                               workers=workers, timeout=budget)
+    if stop_cb and stop_cb():
+        return None
+    for size, job in jobs.items():
+        if results.get(size) is None and job.timed_out:
+            points[size] = SweepPoint(size, predicted.get(size), timed_out=True)
+
+    # the full-size runs that finished predict the rest better than the probe did
+    measured = [(p.size, p.seconds) for p in points.values() if not p.timed_out]
+    try:
+        fit = ComplexityFit(measured)
+    except ValueError:
+        fit = None
+    for point in points.values():
+        if point.timed_out and fit is not None:
+            extrapolated = fit.predict(point.size)
+            # a size that was cut short is known to take longer than the budget
+            point.seconds = extrapolated if point.skipped else max(budget, extrapolated)
+    return {size: points[size] for size in sizes}
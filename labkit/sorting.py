@@ -0,0 +1,445 @@
+"""Sorting engine shared by the lab GUIs and the command-line benchmark"""
+
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from labkit.progress import REPORTS, bubble_work, insertion_work, merge_work
+
+# Bytes per list slot (one object pointer), used to size auxiliary buffers
+POINTER_SIZE = 8 if sys.maxsize > 2 ** 32 else 4
+
+
+class OpCounters:
+    """Operation counts collected by the instrumented algorithms
+
+    moves counts element writes into a list, swaps counts exchanges of two
+    elements (each swap is also two moves), allocations counts new lists
+    created while sorting and peak_aux is the largest number of list slots
+    alive at once in those lists. The returned copy is not counted.
+    """
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        self.allocations = 0
+        self.peak_aux = 0
+        self._live_aux = 0
+
+    def _alloc(self, slots: int):
+        self.allocations += 1
+        self._live_aux += slots
+        if self._live_aux > self.peak_aux:
+            self.peak_aux = self._live_aux
+
+    def _free(self, slots: int):
+        self._live_aux -= slots
+
+    @property
+    def peak_aux_bytes(self) -> int:
+        return self.peak_aux * POINTER_SIZE
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "moves": self.moves,
+            "allocations": self.allocations,
+            "peak_aux_slots": self.peak_aux,
+            "peak_aux_bytes": self.peak_aux_bytes,
+        }
+
+    def describe(self) -> str:
+        return (f"{self.comparisons:,} comparisons, {self.swaps:,} swaps, {self.moves:,} moves, "
+                f"{self.allocations:,} allocations, peak aux {self.peak_aux:,} slots "
+                f"(~{self.peak_aux_bytes / 1024:.1f} KB)")
+
+
+class SortingAlgorithms:
+    """Contains implementations of various sorting algorithms with progress tracking
+
+    Every algorithm takes the same arguments and returns a sorted copy:
+        timer_cb(elapsed_seconds), stop_cb() -> bool,
+        progress_cb(done, total), reverse (False -> ascending)
+
+    arr can be any sequence (a list, or an array or memoryview over a
+    packed column) and is never modified; nothing is copied before the
+    algorithm builds its own working lists from it.
+
+    progress_cb counts work units (see labkit.progress), so done / total
+    is the true fraction of the work and is reported about every 1%.
+    Bubble and insertion sort need an O(n log n) pass to know the total;
+    callers that time the sort pass it in as work_total (from
+    ``progress.work_total``) so that pass is not part of the timing.
+
+    Passing an OpCounters as counters switches to the matching
+    InstrumentedSorts variant; the plain loops below never check it.
+    """
+
+    @staticmethod
+    def bubble_sort(arr: List,
+                    timer_cb: Optional[Callable] = None,
+                    stop_cb: Optional[Callable] = None,
+                    progress_cb: Optional[Callable[[int, int], None]] = None,
+                    reverse: bool = False,
+                    counters: Optional[OpCounters] = None,
+                    work_total: Optional[int] = None) -> List:
+        """Bubble Sort - O(n^2)"""
+        if counters is not None:
+            return InstrumentedSorts.bubble_sort(arr, timer_cb, stop_cb, progress_cb, reverse, counters, work_total)
+        n = len(arr)
+        arr_copy = list(arr)
+        start_time = time.perf_counter()
+        if progress_cb:
+            total = max(1, work_total or bubble_work(arr_copy, reverse))
+            step = max(1, total // REPORTS)
+            done = next_report = 0
+
+        for i in range(n):
+            swapped = False
+            for j in range(0, n - i - 1):
+                if (arr_copy[j] > arr_copy[j + 1]) if not reverse else (arr_copy[j] < arr_copy[j + 1]):
+                    arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                    swapped = True
+
+            if progress_cb:
+                done += n - i - 1
+                if done >= next_report or not swapped:
+                    next_report = done + step
+                    try:
+                        progress_cb(done if swapped else total, total)
+                    except Exception:
+                        pass
+
+            if not swapped:
+                break
+
+            if stop_cb and stop_cb():
+                return arr_copy
+
+            if timer_cb:
+                timer_cb(time.perf_counter() - start_time)
+
+        return arr_copy
+
+    @staticmethod
+    def insertion_sort(arr: List,
+                       timer_cb: Optional[Callable] = None,
+                       stop_cb: Optional[Callable] = None,
+                       progress_cb: Optional[Callable[[int, int], None]] = None,
+                       reverse: bool = False,
+                       counters: Optional[OpCounters] = None,
+                       work_total: Optional[int] = None) -> List:
+        """Insertion Sort - O(n^2)"""
+        if counters is not None:
+            return InstrumentedSorts.insertion_sort(arr, timer_cb, stop_cb, progress_cb, reverse, counters, work_total)
+        arr_copy = list(arr)
+        n = len(arr_copy)
+        start_time = time.perf_counter()
+        if progress_cb:
+            total = max(1, work_total or insertion_work(arr_copy, reverse))
+            step = max(1, total // REPORTS)
+            done = next_report = 0
+
+        for i in range(1, n):
+            key = arr_copy[i]
+            j = i - 1
+
+            if not reverse:
+                while j >= 0 and arr_copy[j] > key:
+                    arr_copy[j + 1] = arr_copy[j]
+                    j -= 1
+            else:
+                while j >= 0 and arr_copy[j] < key:
+                    arr_copy[j + 1] = arr_copy[j]
+                    j -= 1
+
+            arr_copy[j + 1] = key
+
+            if progress_cb:
+                done += i - j  # shifts plus the placement
+                if done >= next_report or i == n - 1:
+                    next_report = done + step
+                    try:
+                        progress_cb(done, total)
+                    except Exception:
+                        pass
+
+            if stop_cb and stop_cb():
+                return arr_copy
+
+            if timer_cb:
+                timer_cb(time.perf_counter() - start_time)
+
+        return arr_copy
+
+    @staticmethod
+    def merge_sort(arr: List,
+                   timer_cb: Optional[Callable] = None,
+                   stop_cb: Optional[Callable] = None,
+                   progress_cb: Optional[Callable[[int, int], None]] = None,
+                   reverse: bool = False,
+                   counters: Optional[OpCounters] = None,
+                   work_total: Optional[int] = None) -> List:
+        """Merge Sort - O(n log n)"""
+        if counters is not None:
+            return InstrumentedSorts.merge_sort(arr, timer_cb, stop_cb, progress_cb, reverse, counters, work_total)
+        if len(arr) <= 1:
+            return list(arr)
+
+        start_time = time.perf_counter()
+
+        def merge(left: List, right: List) -> List:
+            result = []
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if (not reverse and left[i] <= right[j]) or (reverse and left[i] >= right[j]):
+                    result.append(left[i])
+                    i += 1
+                else:
+                    result.append(right[j])
+                    j += 1
+            result.extend(left[i:])
+            result.extend(right[j:])
+            return result
+
+        # progress: elements written by the merges so far, out of an exact total
+        total = work_total or merge_work(len(arr))
+        merge_counter = {'count': 0, 'total': total, 'step': max(1, total // REPORTS), 'next': 0}
+
+        def merge_sort_recursive(arr_local: List) -> List:
+            if len(arr_local) <= 1:
+                return arr_local
+
+            if stop_cb and stop_cb():
+                return arr_local
+
+            mid = len(arr_local) // 2
+            left = merge_sort_recursive(arr_local[:mid])
+            right = merge_sort_recursive(arr_local[mid:])
+            result = merge(left, right)
+
+            merge_counter['count'] += len(result)
+            if progress_cb and (merge_counter['count'] >= merge_counter['next']
+                                or merge_counter['count'] == merge_counter['total']):
+                merge_counter['next'] = merge_counter['count'] + merge_counter['step']
+                try:
+                    progress_cb(merge_counter['count'], merge_counter['total'])
+                except Exception:
+                    pass
+
+            if timer_cb:
+                timer_cb(time.perf_counter() - start_time)
+
+            return result
+
+        # the recursion only reads arr (the halves are slices), so no up-front copy;
+        # arr itself comes back only when stopped before the first split
+        result = merge_sort_recursive(arr)
+        return list(arr) if result is arr else result
+
+
+class InstrumentedSorts:
+    """Counting copies of the SortingAlgorithms loops
+
+    Same results, callbacks and stop behaviour, with every comparison, move
+    and buffer allocation recorded in an OpCounters. Kept separate so the
+    uninstrumented loops pay nothing for counting.
+    """
+
+    @staticmethod
+    def bubble_sort(arr: List, timer_cb: Optional[Callable], stop_cb: Optional[Callable],
+                    progress_cb: Optional[Callable[[int, int], None]], reverse: bool,
+                    counters: OpCounters, work_total: Optional[int] = None) -> List:
+        n = len(arr)
+        arr_copy = list(arr)
+        start_time = time.perf_counter()
+        if progress_cb:
+            total = max(1, work_total or bubble_work(arr_copy, reverse))
+            step = max(1, total // REPORTS)
+            next_report = 0
+        comparisons = swaps = 0
+
+        try:
+            for i in range(n):
+                swapped = False
+                comparisons += n - i - 1
+                for j in range(0, n - i - 1):
+                    if (arr_copy[j] > arr_copy[j + 1]) if not reverse else (arr_copy[j] < arr_copy[j + 1]):
+                        arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                        swaps += 1
+                        swapped = True
+
+                if progress_cb and (comparisons >= next_report or not swapped):
+                    next_report = comparisons + step
+                    try:
+                        progress_cb(comparisons if swapped else total, total)
+                    except Exception:
+                        pass
+
+                if not swapped:
+                    break
+
+                if stop_cb and stop_cb():
+                    return arr_copy
+
+                if timer_cb:
+                    timer_cb(time.perf_counter() - start_time)
+
+            return arr_copy
+        finally:
+            counters.comparisons += comparisons
+            counters.swaps += swaps
+            counters.moves += 2 * swaps
+
+    @staticmethod
+    def insertion_sort(arr: List, timer_cb: Optional[Callable], stop_cb: Optional[Callable],
+                       progress_cb: Optional[Callable[[int, int], None]], reverse: bool,
+                       counters: OpCounters, work_total: Optional[int] = None) -> List:
+        arr_copy = list(arr)
+        n = len(arr_copy)
+        start_time = time.perf_counter()
+        if progress_cb:
+            total = max(1, work_total or insertion_work(arr_copy, reverse))
+            step = max(1, total // REPORTS)
+            done = next_report = 0
+        comparisons = moves = 0
+
+        try:
+            for i in range(1, n):
+                key = arr_copy[i]
+                j = i - 1
+
+                while j >= 0:
+                    comparisons += 1
+                    if (arr_copy[j] > key) if not reverse else (arr_copy[j] < key):
+                        arr_copy[j + 1] = arr_copy[j]
+                        moves += 1
+                        j -= 1
+                    else:
+                        break
+
+                if j + 1 != i:
+                    arr_copy[j + 1] = key
+                    moves += 1
+
+                if progress_cb:
+                    done += i - j  # shifts plus the placement
+                    if done >= next_report or i == n - 1:
+                        next_report = done + step
+                        try:
+                            progress_cb(done, total)
+                        except Exception:
+                            pass
+
+                if stop_cb and stop_cb():
+                    return arr_copy
+
+                if timer_cb:
+                    timer_cb(time.perf_counter() - start_time)
+
+            return arr_copy
+        finally:
+            counters.comparisons += comparisons
+            counters.moves += moves
+
+    @staticmethod
+    def merge_sort(arr: List, timer_cb: Optional[Callable], stop_cb: Optional[Callable],
+                   progress_cb: Optional[Callable[[int, int], None]], reverse: bool,
+                   counters: OpCounters, work_total: Optional[int] = None) -> List:
+        if len(arr) <= 1:
+            return list(arr)
+
+        start_time = time.perf_counter()
+
+        def merge(left: List, right: List) -> List:
+            result = []
+            counters._alloc(len(left) + len(right))
+            i = j = 0
+            comparisons = 0
+            while i < len(left) and j < len(right):
+                comparisons += 1
+                if (not reverse and left[i] <= right[j]) or (reverse and left[i] >= right[j]):
+                    result.append(left[i])
+                    i += 1
+                else:
+                    result.append(right[j])
+                    j += 1
+            result.extend(left[i:])
+            result.extend(right[j:])
+            counters.comparisons += comparisons
+            counters.moves += len(result)
+            return result
+
+        total = work_total or merge_work(len(arr))
+        merge_counter = {'count': 0, 'total': total, 'step': max(1, total // REPORTS), 'next': 0}
+
+        def split(arr_local: List, lo: int, hi: int) -> List:
+            part = arr_local[lo:hi]
+            counters._alloc(len(part))
+            counters.moves += len(part)
+            return part
+
+        def merge_sort_recursive(arr_local: List) -> List:
+            if len(arr_local) <= 1:
+                return arr_local
+
+            if stop_cb and stop_cb():
+                return arr_local
+
+            mid = len(arr_local) // 2
+            left_part = split(arr_local, 0, mid)
+            left = merge_sort_recursive(left_part)
+            right_part = split(arr_local, mid, len(arr_local))
+            right = merge_sort_recursive(right_part)
+            result = merge(left, right)
+            # both halves (and the slices they came from) are garbage once merged
+            for part, sorted_part in ((left_part, left), (right_part, right)):
+                counters._free(len(part))
+                if sorted_part is not part:
+                    counters._free(len(sorted_part))
+
+            merge_counter['count'] += len(result)
+            if progress_cb and (merge_counter['count'] >= merge_counter['next']
+                                or merge_counter['count'] == merge_counter['total']):
+                merge_counter['next'] = merge_counter['count'] + merge_counter['step']
+                try:
+                    progress_cb(merge_counter['count'], merge_counter['total'])
+                except Exception:
+                    pass
+
+            if timer_cb:
+                timer_cb(time.perf_counter() - start_time)
+
+            return result
+
+        result = merge_sort_recursive(arr)
+        if result is arr:
+            return list(arr)  # stopped before the first split
+        # the final merge buffer is the returned copy, not auxiliary memory
+        counters._free(len(result))
+        return result
+
+
+ALGORITHMS: Dict[str, Callable] = {
+    "Bubble Sort": SortingAlgorithms.bubble_sort,
+    "Insertion Sort": SortingAlgorithms.insertion_sort,
+    "Merge Sort": SortingAlgorithms.merge_sort,
+}
+
+ALIASES = {
+    "bubble": "Bubble Sort",
+    "insertion": "Insertion Sort",
+    "merge": "Merge Sort",
+}
+
+
+def resolve_algorithm(name: str) -> str:
+    """Map 'merge', 'Merge Sort', 'merge_sort'... to the display name"""
+    if name in ALGORITHMS:
+        return name
+    short = name.strip().lower().replace("_", " ").replace(" sort", "")
+    if short in ALIASES:
+        return ALIASES[short]
+    raise ValueError(f"Unknown algorithm '{name}' (choose from {', '.join(ALIASES)})")
@@ -0,0 +1,64 @@
+"""Lightweight spans for a per-stage latency breakdown
+
+    spans = Spans()
+    with spans.span("Key extract"):
+        keys = [...]
+    spans.add("Sort", sort_seconds)        # a duration measured elsewhere
+    print("\\n".join(spans.breakdown_lines()))
+
+Spans are recorded in the order they finish and may be added from worker
+threads. A stage that runs more than once (e.g. two exports) is listed once
+per run.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+BAR_WIDTH = 20
+
+
+class Spans:
+    """Ordered (name, seconds) records for one end-to-end run"""
+
+    def __init__(self):
+        self.records: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float):
+        with self._lock:
+            self.records.append((name, seconds))
+
+    def prepend(self, other: "Spans"):
+        """Prepend the records of an earlier run (e.g. the load before a sort)"""
+        if other is None:
+            return
+        with self._lock:
+            self.records[:0] = other.records
+
+    @property
+    def total(self) -> float:
+        return sum(seconds for _, seconds in self.records)
+
+    def seconds(self, name: str) -> float:
+        return sum(seconds for n, seconds in self.records if n == name)
+
+    def breakdown_lines(self) -> List[str]:
+        total = self.total
+        lines = [f"{'Stage':<24} {'Time (ms)':>12} {'Share':>7}", "-" * 70]
+        for name, seconds in self.records:
+            share = seconds / total if total else 0.0
+            bar = "█" * int(round(share * BAR_WIDTH))
+            lines.append(f"{name:<24} {seconds * 1000:>12.2f} {share * 100:>6.1f}%  {bar}")
+        lines.append("-" * 70)
+        lines.append(f"{'End-to-end (stages)':<24} {total * 1000:>12.2f} {100 if total else 0:>6.1f}%")
+        return lines
@@ -0,0 +1,119 @@
+"""High-resolution timing with repetitions and summary statistics
+
+All measurements use ``time.perf_counter_ns`` and run with the garbage
+collector disabled so a collection pause does not land inside one sample.
+"""
+
+import gc
+import math
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Two-sided 95% Student t critical values by degrees of freedom
+_T95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+
+def t_critical_95(df: int) -> float:
+    if df <= 0:
+        return float("nan")
+    return _T95[df - 1] if df <= len(_T95) else 1.960
+
+
+@contextmanager
+def gc_paused():
+    """Disable the garbage collector for the duration of the block"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of already sorted values"""
+    if not sorted_values:
+        return float("nan")
+    pos = (len(sorted_values) - 1) * pct / 100.0
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class TimingStats:
+    """Summary of repeated timings, in seconds"""
+
+    def __init__(self, samples_ns: Sequence[int]):
+        self.samples_ns = list(samples_ns)
+        samples = sorted(ns / 1e9 for ns in self.samples_ns)
+        self.repeats = len(samples)
+        self.min = samples[0]
+        self.max = samples[-1]
+        self.median = statistics.median(samples)
+        self.p95 = percentile(samples, 95)
+        self.mean = statistics.fmean(samples)
+        self.stddev = statistics.stdev(samples) if self.repeats > 1 else 0.0
+        half_width = (t_critical_95(self.repeats - 1) * self.stddev / math.sqrt(self.repeats)
+                      if self.repeats > 1 else float("nan"))
+        self.ci_low = self.mean - half_width
+        self.ci_high = self.mean + half_width
+
+    @property
+    def ci_half_width(self) -> float:
+        return (self.ci_high - self.ci_low) / 2
+
+    def as_dict(self) -> Dict:
+        return {
+            "repeats": self.repeats,
+            "times_s": [ns / 1e9 for ns in self.samples_ns],
+            "min_s": self.min,
+            "median_s": self.median,
+            "p95_s": self.p95,
+            "mean_s": self.mean,
+            "stddev_s": self.stddev,
+            "ci95_low_s": self.ci_low,
+            "ci95_high_s": self.ci_high,
+            "max_s": self.max,
+        }
+
+    def describe(self) -> str:
+        if self.repeats == 1:
+            return f"{self.min:.6f}s (1 run)"
+        return (f"median {self.median:.6f}s, min {self.min:.6f}s, p95 {self.p95:.6f}s, "
+                f"sd {self.stddev:.6f}s, 95% CI ±{self.ci_half_width:.6f}s ({self.repeats} runs)")
+
+
+def timed(func: Callable, *args, **kwargs) -> Tuple[object, float]:
+    """Run func once with the GC paused; returns (result, seconds)"""
+    with gc_paused():
+        start = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter_ns() - start
+    return result, elapsed / 1e9
+
+
+def measure(func: Callable[[List], object], data: Sequence, repeats: int = 5, warmup: int = 0,
+            stop_cb: Optional[Callable[[], bool]] = None) -> Tuple[Optional[TimingStats], object]:
+    """Time func on a fresh copy of data, warmup + repeats times.
+
+    Copies are made outside the timed region. Returns (stats, last result);
+    stats is None if stop_cb asked to stop before any timed run finished.
+    """
+    samples = []
+    result = None
+    for run in range(warmup + repeats):
+        if stop_cb and stop_cb():
+            break
+        fresh = list(data)
+        with gc_paused():
+            start = time.perf_counter_ns()
+            result = func(fresh)
+            elapsed = time.perf_counter_ns() - start
+        if run >= warmup:
+            samples.append(elapsed)
+    return (TimingStats(samples) if samples else None), result
@@ -0,0 +1,89 @@
+"""One queue for UI updates posted by worker threads
+
+Tk widgets may only be touched from the thread running the main loop.
+Workers post small events instead, and the main loop drains them on an
+``after()`` tick:
+
+    ui = UIQueue(frame.after)
+    ui.start()
+    # in a worker thread
+    ui.post(report_text.insert, "end", "Sorting...\\n")       # every call, in order
+    ui.latest("progress", progress_bar.config, value=42)        # only the newest per tick
+
+``post`` events run in the order they were posted. ``latest`` events are
+coalesced by key, so a worker reporting progress thousands of times a
+second costs at most one widget update per tick. Each tick applies the
+coalesced values first and the ordered events after them, so a final
+state posted with ``post`` (e.g. progress 100% when a run ends) is not
+overwritten by a stale progress value. Posting never blocks the worker on
+the UI.
+"""
+
+import threading
+import traceback
+from collections import deque
+from typing import Callable, Dict, Tuple
+
+TICK_MS = 16
+
+
+class UIQueue:
+    """Worker-to-UI event queue drained on a periodic after() tick"""
+
+    def __init__(self, after: Callable[[int, Callable], object], interval_ms: int = TICK_MS):
+        self.after = after
+        self.interval_ms = interval_ms
+        self._events = deque()
+        self._latest: Dict[str, Tuple[Callable, tuple, dict]] = {}
+        self._lock = threading.Lock()
+        self._running = False
+        self.coalesced = 0  # latest() events replaced before they were applied
+
+    def start(self) -> "UIQueue":
+        if not self._running:
+            self._running = True
+            self.after(self.interval_ms, self._tick)
+        return self
+
+    def stop(self):
+        self._running = False
+
+    def post(self, func: Callable, *args, **kwargs):
+        """Run func(*args, **kwargs) on the UI thread, after everything posted before it"""
+        self._events.append((func, args, kwargs))
+
+    def latest(self, key: str, func: Callable, *args, **kwargs):
+        """Run func on the UI thread at the next tick, unless a newer event for key replaces it"""
+        with self._lock:
+            if key in self._latest:
+                self.coalesced += 1
+            self._latest[key] = (func, args, kwargs)
+
+    def drain(self):
+        """Apply pending events now (on the UI thread)"""
+        with self._lock:
+            latest, self._latest = self._latest, {}
+        for func, args, kwargs in latest.values():
+            self._apply(func, args, kwargs)
+        for _ in range(len(self._events)):
+            func, args, kwargs = self._events.popleft()
+            self._apply(func, args, kwargs)
+
+    @staticmethod
+    def _apply(func, args, kwargs):
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            # a widget destroyed while the event was queued raises TclError (matched by
+            # name: labkit does not import Tk); anything else is a bug in the callback.
+            # Neither may stop the queue.
+            if type(e).__name__ != "TclError":
+                traceback.print_exc()
+
+    def _tick(self):
+        if not self._running:
+            return
+        try:
+            self.drain()
+        finally:
+            self.after(self.interval_ms, self._tick)
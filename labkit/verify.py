@@ -0,0 +1,206 @@
+"""Linear-time correctness checks for sort results
+
+Three checks, each one pass over the data using C-level iterators
+(``map``/``compress`` over ``operator`` functions) rather than a Python
+loop over indices:
+
+- order: every neighbour pair is in order (``<=``, or ``>=`` descending);
+- permutation: the output holds exactly the input values, compared with an
+  order-independent multiset hash (sum of salted element hashes);
+- stability (keyed record sorts): records with equal keys keep their
+  original relative order.
+
+Run the checks after the timer has stopped, e.g. with
+``verify_in_background`` so the UI can show the timing straight away:
+
+    check = verify_in_background(lambda: verify_values(data, result),
+                                 lambda fn: frame.after(0, fn))
+    check.when_done(lambda v: text.insert(tk.END, v.describe()))
+"""
+
+import operator
+import threading
+import time
+from itertools import compress, count, islice, repeat
+from typing import Callable, Dict, List, Optional, Sequence
+
+HASH_SALT = 0x5EED
+HASH_MASK = (1 << 64) - 1
+PENDING = "⏳ verifying in background..."  # report placeholder until the result arrives
+
+
+def first_unordered(values: Sequence, reverse: bool = False) -> int:
+    """Index i of the first pair with values[i], values[i+1] out of order, or -1"""
+    in_order = operator.ge if reverse else operator.le
+    bad = map(operator.not_, map(in_order, values, islice(values, 1, None)))
+    return next(compress(count(), bad), -1)
+
+
+def first_unstable(keys: Sequence, order: Sequence[int]) -> int:
+    """Index i of the first pair with equal keys whose original indices decrease, or -1
+
+    keys are the sorted keys; order[i] is the original index of output i.
+    """
+    ties = map(operator.eq, keys, islice(keys, 1, None))
+    swapped = map(operator.gt, order, islice(order, 1, None))
+    return next(compress(count(), map(operator.and_, ties, swapped)), -1)
+
+
+def multiset_hash(values) -> int:
+    """Order-independent 64-bit hash of a collection of hashable values"""
+    return sum(map(hash, zip(values, repeat(HASH_SALT)))) & HASH_MASK
+
+
+def same_multiset(original: Sequence, result: Sequence) -> bool:
+    return len(original) == len(result) and multiset_hash(original) == multiset_hash(result)
+
+
+class Verification:
+    """Outcome of the checks on one sort result; stable is None when not checked"""
+
+    def __init__(self, size: int, ordered_at: int, permutation: bool,
+                 stable_at: Optional[int] = None, seconds: float = 0.0):
+        self.size = size
+        self.ordered_at = ordered_at
+        self.permutation = permutation
+        self.stable_at = stable_at
+        self.seconds = seconds
+
+    @property
+    def ordered(self) -> bool:
+        return self.ordered_at < 0
+
+    @property
+    def stable(self) -> Optional[bool]:
+        return None if self.stable_at is None else self.stable_at < 0
+
+    @property
+    def passed(self) -> bool:
+        return self.ordered and self.permutation and self.stable is not False
+
+    def problems(self) -> List[str]:
+        found = []
+        if not self.ordered:
+            found.append(f"out of order at position {self.ordered_at:,}")
+        if not self.permutation:
+            found.append("values differ from the input (not a permutation)")
+        if self.stable is False:
+            found.append(f"equal keys reordered at position {self.stable_at:,}")
+        return found
+
+    def describe(self) -> str:
+        checks = "order, permutation" + (", stability" if self.stable is not None else "")
+        if self.passed:
+            return f"✅ PASSED ({checks}; {self.size:,} items in {self.seconds * 1000:.1f} ms)"
+        return f"❌ FAILED: {'; '.join(self.problems())}"
+
+    def as_dict(self) -> Dict:
+        return {"verified": self.passed, "ordered": self.ordered, "permutation": self.permutation,
+                "stable": self.stable, "verify_s": self.seconds}
+
+
+def verify_values(original: Sequence, result: Sequence, reverse: bool = False) -> Verification:
+    """Check that result is original sorted (plain values, no stability to check)"""
+    start = time.perf_counter()
+    ordered_at = first_unordered(result, reverse)
+    permutation = same_multiset(original, result)
+    return Verification(len(result), ordered_at, permutation, None, time.perf_counter() - start)
+
+
+def verify_records(keys: Sequence, order: Sequence[int], reverse: bool = False) -> Verification:
+    """Check a keyed record sort given by the original index of each output record.
+
+    keys[i] is the key of input record i and order lists the input indices in
+    output order, so the output is ordered, a permutation of the input and
+    stable exactly when order passes the three checks below.
+    """
+    start = time.perf_counter()
+    sorted_keys = list(map(keys.__getitem__, order))
+    ordered_at = first_unordered(sorted_keys, reverse)
+    permutation = same_multiset(range(len(keys)), order)
+    stable_at = first_unstable(sorted_keys, order)
+    return Verification(len(order), ordered_at, permutation, stable_at, time.perf_counter() - start)
+
+
+class BackgroundVerify:
+    """Runs a verification job on a worker thread; results come back through schedule.
+
+    schedule must hand a callable to the UI thread, e.g.
+    ``lambda fn: frame.after(0, fn)``. Callbacks registered with when_done
+    are always delivered through schedule, once the result exists.
+    """
+
+    def __init__(self, job: Callable[[], Verification], schedule: Callable[[Callable], None]):
+        self.job = job
+        self.schedule = schedule
+        self.result: Optional[Verification] = None
+        self.error: Optional[Exception] = None
+        self._callbacks: List[Callable] = []
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "BackgroundVerify":
+        self.thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.result = self.job()
+        except Exception as e:
+            self.error = e
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self.schedule(lambda callback=callback: self._deliver(callback))
+
+    def _deliver(self, callback):
+        callback(self.outcome)
+
+    def when_done(self, callback: Callable[[object], None]):
+        """callback(Verification), or callback(exception) if the check itself failed"""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        self.schedule(lambda: self._deliver(callback))
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def outcome(self):
+        """The Verification, the exception the check raised, or None while running"""
+        return self.result if self.error is None else self.error
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Verification]:
+        self._done.wait(timeout)
+        return self.result
+
+
+def verify_in_background(job: Callable[[], Verification],
+                         schedule: Callable[[Callable], None]) -> BackgroundVerify:
+    return BackgroundVerify(job, schedule).start()
+
+
+def describe_outcome(outcome) -> str:
+    """Report text for what a BackgroundVerify delivered"""
+    if isinstance(outcome, Verification):
+        return outcome.describe()
+    return f"⚠ Could not verify: {outcome}"
+
+
+def fill_placeholder(text_widget, label: str, outcome, suffix: str = "") -> bool:
+    """Replace PENDING after label in a Tk Text widget with the outcome; False if not found
+
+    suffix, if given, follows the outcome after a space.
+    """
+    start = text_widget.search(label + PENDING, "1.0", "end")
+    if not start:
+        return False
+    begin = f"{start}+{len(label)}c"
+    text_widget.delete(begin, f"{begin}+{len(PENDING)}c")
+    text_widget.insert(begin, f"{describe_outcome(outcome)} {suffix}" if suffix else describe_outcome(outcome))
+    return True
@@ -0,0 +1,65 @@
+"""Scroll position of a window over a long sequence
+
+The GUI-independent half of a virtual-scrolling view: the widget only shows
+``visible`` rows starting at ``first`` and asks the viewport which slice of
+the data to draw, so drawing costs the same for 10 rows or 10 million.
+Scrollbar commands (``moveto`` fractions, unit and page steps) map directly
+onto the methods below.
+"""
+
+from typing import Tuple
+
+
+class Viewport:
+    """First visible row and window height over ``total`` rows"""
+
+    def __init__(self, total: int = 0, visible: int = 10):
+        self.total = max(0, total)
+        self.visible = max(1, visible)
+        self.first = 0
+
+    @property
+    def last(self) -> int:
+        """One past the last visible row"""
+        return min(self.total, self.first + self.visible)
+
+    def window(self) -> range:
+        return range(self.first, self.last)
+
+    def reset(self, total: int):
+        self.total = max(0, total)
+        self.first = 0
+
+    def resize(self, visible: int):
+        self.visible = max(1, visible)
+        self.scroll_to(self.first)
+
+    def scroll_to(self, first: int) -> bool:
+        """Move the window so it starts at first (clamped); True if it moved"""
+        first = max(0, min(int(first), self.total - self.visible))
+        moved = first != self.first
+        self.first = first
+        return moved
+
+    def scroll(self, units: int) -> bool:
+        return self.scroll_to(self.first + units)
+
+    def page(self, pages: int) -> bool:
+        return self.scroll_to(self.first + pages * max(1, self.visible - 1))
+
+    def moveto(self, fraction: float) -> bool:
+        return self.scroll_to(round(float(fraction) * self.total))
+
+    def show(self, index: int) -> bool:
+        """Scroll just enough for row index to be visible"""
+        if index < self.first:
+            return self.scroll_to(index)
+        if index >= self.first + self.visible:
+            return self.scroll_to(index - self.visible + 1)
+        return False
+
+    def fractions(self) -> Tuple[float, float]:
+        """(top, bottom) of the window as scrollbar fractions"""
+        if not self.total:
+            return 0.0, 1.0
+        return self.first / self.total, self.last / self.total
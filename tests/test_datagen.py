@@ -0,0 +1,16 @@
+"""Input shapes from labkit.datagen"""
+
+import pytest
+
+from labkit import datagen
+
+
+@pytest.mark.parametrize("size", [8, 9, 10, 11, 12, 13, 14, 15, 1000, 1001, 1002, 1003])
+def test_quicksort_killer_is_a_permutation(size):
+    # every residue of size mod 4: each rank appears exactly once
+    assert sorted(datagen._median_of_3_killer(size)) == list(range(size))
+
+
+def test_quicksort_killer_values_are_distinct():
+    values = datagen.generate(1002, "quicksort_killer", seed=1, low=1, high=100000)
+    assert len(set(values)) == len(values)